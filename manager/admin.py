@@ -4,7 +4,7 @@ from django.contrib import admin
 
 from .forms import AddressForm, ReviewForm
 from .models import (Account, Address, Agency, AgencyRequests, City, Country,
-                     Review, Tour, TourAddress)
+                     ImageJob, OutgoingEmail, Review, Tour, TourAddress)
 
 name = 'name'
 agency = 'agency'
@@ -123,3 +123,23 @@ class AgencyRequestsAdmin(admin.ModelAdmin):
     """Agency Requests admin."""
 
     model = AgencyRequests
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    """Outgoing email admin."""
+
+    model = OutgoingEmail
+    list_display = ['subject', 'created', 'attempts', 'next_attempt', 'sent']
+    list_filter = ['sent']
+    search_fields = ['subject']
+
+
+@admin.register(ImageJob)
+class ImageJobAdmin(admin.ModelAdmin):
+    """Image job admin."""
+
+    model = ImageJob
+    list_display = ['target_model', 'target_id', 'created', 'attempts', 'processed']
+    list_filter = ['target_model', 'processed']
+    search_fields = ['image']
@@ -8,3 +8,7 @@ class ManagerConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'manager'
+
+    def ready(self) -> None:
+        """Connect signals handlers."""
+        from . import page_signals, signals  # noqa: F401, WPS433
@@ -0,0 +1,52 @@
+"""PostGIS database backend which observes persistent connections."""
+
+import time
+from typing import Any
+
+from django.contrib.gis.db.backends.postgis import base
+
+from .. import metrics, timings
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostGIS connection wrapper which counts opened, reused and closed connections.
+
+    Queries are passed to observers of current request context, see timings.observe_queries.
+    Connections are kept between requests for CONN_MAX_AGE seconds and checked with
+    CONN_HEALTH_CHECKS before first use in request, so metrics show size of this pool,
+    time requests wait for new connections and share of reused ones.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init wrapper without connection used in current request and with query observers.
+
+        Args:
+            args: Any - arguments.
+            kwargs: Any - key word arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.checked_out = False
+        self.execute_wrappers.append(timings.observe_request_query)
+
+    def connect(self) -> None:
+        """Connect to database and observe connect duration."""
+        started = time.perf_counter()
+        super().connect()
+        metrics.observe_connect(self.alias, time.perf_counter() - started)
+
+    def ensure_connection(self) -> None:
+        """Count first use of connection in request and connect if needed."""
+        if not self.checked_out:
+            self.checked_out = True
+            metrics.count_checkout(self.alias, reused=self.connection is not None)
+        super().ensure_connection()
+
+    def close_if_unusable_or_obsolete(self) -> None:
+        """Close broken or expired connection at request start and end."""
+        super().close_if_unusable_or_obsolete()
+        self.checked_out = False
+
+    def _close(self) -> None:
+        if self.connection is not None:
+            metrics.observe_close(self.alias)
+        super()._close()
@@ -0,0 +1,154 @@
+"""Module with database router which sends reads of safe requests to replica.
+
+Replica is a database alias set with DB_REPLICA_ALIAS, `replica` by default. Without
+configured replica every query goes to default database.
+"""
+
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from os import getenv
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from dotenv import load_dotenv
+
+load_dotenv()
+DEFAULT_REPLICA_ALIAS = 'replica'
+DEFAULT_MAX_LAG_SECONDS = 5
+DEFAULT_CHECK_SECONDS = 1
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+read_database: ContextVar[str] = ContextVar('read_database', default=DEFAULT_DB_ALIAS)
+_replica_checks = {}
+
+
+class ReplicaRouter:
+    """Route reads to database chosen for current request, writes to default database."""
+
+    def db_for_read(self, model: type, **hints: Any) -> str:
+        """Get database for read.
+
+        Reads inside transaction of default database stay there to see its writes.
+
+        Args:
+            model: type - read model.
+            hints: Any - routing hints.
+
+        Returns:
+            str: database alias.
+        """
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return read_database.get()
+
+    def db_for_write(self, model: type, **hints: Any) -> str:
+        """Get database for write.
+
+        Args:
+            model: type - written model.
+            hints: Any - routing hints.
+
+        Returns:
+            str: default database alias.
+        """
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        """Allow relations of objects read from any database, replica has same data.
+
+        Args:
+            obj1: Any - first object.
+            obj2: Any - second object.
+            hints: Any - routing hints.
+
+        Returns:
+            bool: always True.
+        """
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str = None, **hints: Any) -> bool:
+        """Allow migrations on default database only, replica gets them by replication.
+
+        Args:
+            db: str - database alias.
+            app_label: str - application label.
+            model_name: str, optional - model name. Defaults to None.
+            hints: Any - routing hints.
+
+        Returns:
+            bool: True for default database.
+        """
+        return db == DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def read_from(alias: str) -> Iterator[None]:
+    """Route reads of block to database, previous database is restored even on error.
+
+    Args:
+        alias: str - database alias.
+
+    Yields:
+        None: block with routed reads.
+    """
+    with ExitStack() as restore:
+        restore.callback(read_database.reset, read_database.set(alias))
+        yield
+
+
+def get_replica_alias() -> str | None:
+    """Get alias of configured replica.
+
+    Returns:
+        str | None: replica alias, None if it is not in DATABASES.
+    """
+    alias = getenv('DB_REPLICA_ALIAS', DEFAULT_REPLICA_ALIAS)
+    return alias if alias in settings.DATABASES else None
+
+
+def get_replica_lag(alias: str) -> float | None:
+    """Get replay lag of replica.
+
+    Args:
+        alias: str - replica alias.
+
+    Returns:
+        float | None: lag in seconds, 0 if replica replayed all received changes,
+            None if replica is not available.
+    """
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(REPLICA_LAG_SQL)
+            return float(cursor.fetchone()[0] or 0)
+    except DatabaseError:
+        return None
+
+
+def is_replica_fresh(alias: str) -> bool:
+    """Check replica is available and lags less than REPLICA_MAX_LAG_SECONDS.
+
+    Result is kept in process for REPLICA_CHECK_SECONDS, so lag is not queried per request.
+
+    Args:
+        alias: str - replica alias.
+
+    Returns:
+        bool: True if reads may be served by replica.
+    """
+    checked_at, fresh = _replica_checks.get(alias, (None, False))
+    now = time.monotonic()
+    check_seconds = float(getenv('REPLICA_CHECK_SECONDS', DEFAULT_CHECK_SECONDS))
+    if checked_at is None or now - checked_at >= check_seconds:
+        lag = get_replica_lag(alias)
+        max_lag = float(getenv('REPLICA_MAX_LAG_SECONDS', DEFAULT_MAX_LAG_SECONDS))
+        fresh = lag is not None and lag <= max_lag
+        _replica_checks[alias] = (now, fresh)
+    return fresh
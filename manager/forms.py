@@ -6,7 +6,7 @@ from django.http import HttpRequest
 from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
 
-from .models import Address, Agency, Review, Tour
+from .models import Address, AgencyDirectory, City, Country, Review, Tour
 
 name_min = 'min'
 name_max = 'max'
@@ -19,6 +19,7 @@ address_widgets = {
 }
 ALL_LITERAL = '__all__'
 CITY_LITERAL = 'city'
+NAME_LITERAL = 'name'
 
 
 class CustomImageInput(forms.ClearableFileInput):
@@ -78,12 +79,13 @@ class ReviewForm(forms.ModelForm):
         max_length=1000,
     )
 
-    def my_render(self, request: HttpRequest, review: Review = None) -> str:
+    def my_render(self, request: HttpRequest, review: Review = None, errors: dict = None) -> str:
         """Render form.
 
         Args:
             request: HttpRequest - request from user.
             review: Review, optional - review for init data. Defaults to None.
+            errors: dict, optional - errors of posted form by field. Defaults to None.
 
         Returns:
             str: rendered form.
@@ -98,6 +100,8 @@ class ReviewForm(forms.ModelForm):
             'parts/review_form.html',
             {
                 'form': self,
+                'review': review,
+                'errors': errors or {},
                 'button_icon': button_icon,
                 'button_literal': button_literal,
                 'style_files': [
@@ -141,20 +145,11 @@ class FindToursForm(forms.Form):
         """
         super().__init__(*args, **kwargs)
         starting_city_choice_list, country_choice_list = [('', '')], [('', '')]
-        tours_objects = Tour.objects.all()
-        tours_starting_city = list({tour.starting_city for tour in tours_objects})
-        tours_addresses = [tour.addresses.all() for tour in tours_objects]
-        tours_countries_objects = set()
-        for address_objects in tours_addresses:
-            for address_object in address_objects:
-                tours_countries_objects.add(address_object.city.country)
-        tours_starting_city = sorted(
-            tours_starting_city, key=lambda country: country.name,
-        )
-        tours_countries_objects = list(set(tours_countries_objects))
-        tours_countries_objects = sorted(
-            tours_countries_objects, key=lambda country: country.name,
-        )
+        tours_starting_city = City.objects.filter(tour__isnull=False)
+        tours_starting_city = tours_starting_city.distinct().order_by(NAME_LITERAL)
+        tours_countries_objects = Country.objects.filter(
+            city__address__tours__isnull=False,
+        ).distinct().order_by(NAME_LITERAL)
         starting_city_choice_list += [(city.id, city.name) for city in tours_starting_city]
         country_choice_list += [(country.id, country.name) for country in tours_countries_objects]
         self.fields['starting_city'].choices = starting_city_choice_list
@@ -179,10 +174,9 @@ class FindAgenciesForm(forms.Form):
         """
         super().__init__(*args, **kwargs)
         city_choice_list = [('', _('all'))]
-        agencies_objects = Agency.objects.all()
-        agencies_cities = [agency.address.city for agency in agencies_objects.all()]
-        city_choice_list += [(city.id, city.name) for city in agencies_cities]
-        city_choice_list = list(set(city_choice_list))
+        agencies_cities = AgencyDirectory.objects.filter(has_account=True)
+        agencies_cities = agencies_cities.values_list(CITY_LITERAL, 'city_name').distinct()
+        city_choice_list += agencies_cities.order_by('city_name')
         self.fields[CITY_LITERAL].choices = city_choice_list
         if request and request.method == 'GET':
             self.fields[CITY_LITERAL].initial = request.GET.get(CITY_LITERAL)
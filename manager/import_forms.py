@@ -0,0 +1,70 @@
+"""Module with forms for tours catalog import."""
+
+from pathlib import Path
+
+from django import forms
+from django.utils.translation import gettext_lazy as _
+
+from .models import COUNTRY_MAX_LEN, NAME_MAX_LEN
+
+IMPORT_FORMATS = ('csv', 'json', 'jsonl')
+ADDRESSES_SEPARATOR = ';'
+ADDRESS_PARTS_SEPARATOR = ','
+ADDRESS_PARTS = ('city', 'street', 'house_number')
+
+
+class TourImportRowForm(forms.Form):
+    """Form for validate one row of tours import.
+
+    Addresses are `city, street, house_number` entries separated by `;`,
+    cities are looked up in the row country.
+    """
+
+    name = forms.CharField(max_length=NAME_MAX_LEN)
+    description = forms.CharField()
+    price = forms.DecimalField(max_digits=9, decimal_places=2, min_value=0)
+    country = forms.CharField(max_length=COUNTRY_MAX_LEN)
+    starting_city = forms.CharField(max_length=NAME_MAX_LEN)
+    addresses = forms.CharField()
+
+    def clean_addresses(self) -> tuple[tuple[str, str, str], ...]:
+        """Split addresses into city, street and house number.
+
+        Raises:
+            ValidationError: if address has not three parts.
+
+        Returns:
+            tuple[tuple[str, str, str], ...]: parsed addresses.
+        """
+        addresses = []
+        for address in self.cleaned_data['addresses'].split(ADDRESSES_SEPARATOR):
+            parts = tuple(part.strip() for part in address.split(ADDRESS_PARTS_SEPARATOR))
+            if len(parts) != len(ADDRESS_PARTS) or not all(parts):
+                raise forms.ValidationError(
+                    _('Address must be written as "city, street, house number".'),
+                )
+            addresses.append(parts)
+        return tuple(addresses)
+
+
+class TourImportFileForm(forms.Form):
+    """Form for upload tours catalog file."""
+
+    catalog = forms.FileField(
+        label=_('catalog'),
+        help_text=_('CSV, JSON array or JSON Lines file with tours.'),
+    )
+
+    def clean_catalog(self) -> forms.FileField:
+        """Check catalog file format by extension.
+
+        Raises:
+            ValidationError: if file format is not supported.
+
+        Returns:
+            FileField: uploaded file.
+        """
+        catalog = self.cleaned_data['catalog']
+        if Path(catalog.name).suffix.lstrip('.').lower() not in IMPORT_FORMATS:
+            raise forms.ValidationError(_('Only csv, json and jsonl files are supported.'))
+        return catalog
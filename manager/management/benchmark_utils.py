@@ -0,0 +1,154 @@
+"""Module with helpers for benchmark pages and API with test client."""
+
+import statistics
+import time
+import tracemalloc
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from ..models import Account, Address, Agency, Review, Tour
+from ..query_budget import QueryCounter
+
+BENCHMARK_HOST = 'localhost'
+BENCHMARK_USERNAME = 'benchmark'
+PERCENTILES = 20
+P95_INDEX = 18
+MILLISECONDS = 1000
+KILOBYTE = 1024
+ID_FIELD = 'id'
+
+
+class Endpoint(NamedTuple):
+    """Benchmarked url with request headers."""
+
+    name: str
+    url: str
+    headers: dict
+
+
+def _get_first_id(model: type) -> Any:
+    return model.objects.order_by(ID_FIELD).values_list(ID_FIELD, flat=True).first()
+
+
+def get_page_endpoints(tour: Tour, agency: Agency) -> list[Endpoint]:
+    """Get pages endpoints.
+
+    Args:
+        tour: Tour - tour for tour page and tours filter.
+        agency: Agency - agency for profile page.
+
+    Returns:
+        list[Endpoint]: pages endpoints.
+    """
+    tours_url = reverse('tours')
+    tours_filter = urlencode({
+        'starting_city': tour.starting_city_id,
+        'country': tour.starting_city.country_id,
+    })
+    username = agency.account.account.username
+    return [
+        Endpoint('index', reverse('index'), {}),
+        Endpoint('tours', tours_url, {}),
+        Endpoint('tours_filtered', f'{tours_url}?{tours_filter}', {}),
+        Endpoint('agencies', reverse('agencies'), {}),
+        Endpoint('tour', reverse('tour', kwargs={'uuid': tour.id}), {}),
+        Endpoint('profile', reverse('profile', kwargs={'username': username}), {}),
+        Endpoint('settings', reverse('settings'), {}),
+    ]
+
+
+def get_api_endpoints(user: User, objects_ids: dict[str, Any]) -> list[Endpoint]:
+    """Get API list and detail endpoints with token authorization.
+
+    Args:
+        user: User - token owner.
+        objects_ids: dict[str, Any] - detail object id by router basename.
+
+    Returns:
+        list[Endpoint]: API endpoints.
+    """
+    token = Token.objects.get_or_create(user=user)[0]
+    api_headers = {'HTTP_AUTHORIZATION': f'Token {token.key}'}
+    endpoints = []
+    for basename, object_id in objects_ids.items():
+        list_name, detail_name = f'{basename}-list', f'{basename}-detail'
+        endpoints.append(Endpoint(list_name, reverse(list_name), api_headers))
+        detail_url = reverse(detail_name, kwargs={'pk': object_id})
+        endpoints.append(Endpoint(detail_name, detail_url, api_headers))
+    return endpoints
+
+
+def get_endpoints(user: User) -> list[Endpoint]:
+    """Get pages and API endpoints with urls of seeded objects.
+
+    Args:
+        user: User - benchmark user with account.
+
+    Returns:
+        list[Endpoint]: endpoints for benchmark.
+    """
+    tour = Tour.objects.select_related('starting_city').order_by(ID_FIELD).first()
+    agency = Agency.objects.select_related('account__account').filter(account__isnull=False)
+    agency = agency.order_by(ID_FIELD).first()
+    objects_ids = {
+        'agency': agency.id,
+        'tour': tour.id,
+        'review': _get_first_id(Review),
+        'address': _get_first_id(Address),
+    }
+    return get_page_endpoints(tour, agency) + get_api_endpoints(user, objects_ids)
+
+
+def create_benchmark_client() -> tuple[Client, User]:
+    """Create logged in client of user with account.
+
+    Returns:
+        tuple[Client, User]: client and its user.
+    """
+    user = User.objects.create_user(username=BENCHMARK_USERNAME)
+    Account.objects.create(account=user)
+    client = Client(HTTP_HOST=BENCHMARK_HOST)
+    client.force_login(user)
+    return client, user
+
+
+def measure_endpoint(client: Client, endpoint: Endpoint, requests_count: int) -> dict:
+    """Measure latency percentiles, queries count and peak memory of endpoint.
+
+    Memory is traced in one more request, so tracing does not slow latency samples.
+
+    Args:
+        client: Client - test client.
+        endpoint: Endpoint - endpoint for measure.
+        requests_count: int - count of measured requests, at least 2.
+
+    Returns:
+        dict: status, p50_ms, p95_ms, queries and peak_memory_kb.
+    """
+    response = client.get(endpoint.url, **endpoint.headers)
+    latencies = []
+    counter = QueryCounter()
+    for _ in range(requests_count):
+        counter.count = 0
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            client.get(endpoint.url, **endpoint.headers)
+            latencies.append((time.perf_counter() - started) * MILLISECONDS)
+    tracemalloc.start()
+    client.get(endpoint.url, **endpoint.headers)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    p95_latency = statistics.quantiles(latencies, n=PERCENTILES)[P95_INDEX]
+    return {
+        'status': response.status_code,
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(p95_latency, 2),
+        'queries': counter.count,
+        'peak_memory_kb': round(peak_memory / KILOBYTE, 1),
+    }
@@ -0,0 +1 @@
+"""Package init method."""
@@ -0,0 +1,100 @@
+"""Command for benchmark pages and API on seeded data."""
+
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from ...views_utils.agency_directory import refresh_agency_directory
+from .. import benchmark_utils
+from ..seed_data import SyntheticData
+
+DEFAULT_SCALES = (1000, 10000, 100000)
+DEFAULT_REQUESTS = 20
+MIN_REQUESTS = 2
+
+
+class Command(BaseCommand):
+    """Pages and API benchmark."""
+
+    help = 'Measure latency, queries and peak memory of pages and API on seeded data.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument(
+            '--scales',
+            nargs='+',
+            type=int,
+            default=DEFAULT_SCALES,
+            help='Tours counts.',
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=DEFAULT_REQUESTS,
+            help='Measured requests per endpoint.',
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--only',
+            nargs='+',
+            default=None,
+            help='Endpoints names, e.g. tours tour-list.',
+        )
+        parser.add_argument('--output', default=None, help='JSON file, stdout by default.')
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Run benchmark at every scale and write JSON report.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+        """
+        self.options = options
+        report = {
+            'seed': options['seed'],
+            'requests': max(options['requests'], MIN_REQUESTS),
+            'scales': {},
+        }
+        requests_count = report['requests']
+        for scale in options['scales']:
+            report['scales'][str(scale)] = self.run_scale(scale, requests_count)
+        report_text = json.dumps(report, indent=2)
+        if not options['output']:
+            self.stdout.write(report_text)
+            return
+        with open(options['output'], 'w') as output:
+            output.write(report_text)
+
+    def run_scale(self, scale: int, requests_count: int) -> dict:
+        """Seed data and measure endpoints, database is left unchanged.
+
+        Agencies directory is refreshed at once, refreshes after commit never run here.
+
+        Args:
+            scale: int - tours count.
+            requests_count: int - measured requests per endpoint.
+
+        Returns:
+            dict: measurements by endpoint name.
+        """
+        measurements = {}
+        with transaction.atomic():
+            SyntheticData(self.options['seed']).create(scale)
+            refresh_agency_directory()
+            client, user = benchmark_utils.create_benchmark_client()
+            only = self.options['only']
+            for endpoint in benchmark_utils.get_endpoints(user):
+                if only and endpoint.name not in only:
+                    continue
+                measurement = benchmark_utils.measure_endpoint(client, endpoint, requests_count)
+                measurements[endpoint.name] = measurement
+                endpoint_name = f'{scale} {endpoint.name}'
+                self.stderr.write(f'{endpoint_name}: {measurement}')
+            transaction.set_rollback(True)
+        return measurements
@@ -0,0 +1,106 @@
+"""Command for compare throughput of sync WSGI and async ASGI servers."""
+
+import json
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import CommandParser
+
+from .. import load_test
+from .loadtest import Command as LoadTestCommand
+
+DEFAULT_WSGI_URL = 'http://localhost:8000'
+DEFAULT_ASGI_URL = 'http://localhost:8001'
+READ_SCENARIOS = ('browse', 'filter', 'tour', 'reviews', 'api')
+SERVERS = ('wsgi', 'asgi')
+DIGITS = 2
+
+
+def compare_levels(wsgi_levels: list[dict], asgi_levels: list[dict]) -> list[dict]:
+    """Compare throughput and latency of servers at every users count.
+
+    Args:
+        wsgi_levels: list[dict] - levels summaries of WSGI server.
+        asgi_levels: list[dict] - levels summaries of ASGI server in the same order.
+
+    Returns:
+        list[dict]: users, rps and p95_ms of both servers and ASGI rps gain.
+    """
+    comparison = []
+    for wsgi_level, asgi_level in zip(wsgi_levels, asgi_levels):
+        wsgi_rps = wsgi_level['rps']
+        comparison.append({
+            'users': wsgi_level['users'],
+            'wsgi_rps': wsgi_rps,
+            'asgi_rps': asgi_level['rps'],
+            'wsgi_p95_ms': wsgi_level.get('p95_ms'),
+            'asgi_p95_ms': asgi_level.get('p95_ms'),
+            'asgi_gain': round(asgi_level['rps'] / wsgi_rps, DIGITS) if wsgi_rps else None,
+        })
+    return comparison
+
+
+def create_report(servers: dict[str, list[dict]], options: dict) -> dict:
+    """Create report with levels of both servers and their comparison.
+
+    Args:
+        servers: dict[str, list[dict]] - levels summaries by server.
+        options: dict - command options.
+
+    Returns:
+        dict: report.
+    """
+    return {
+        'duration': options['duration'],
+        'scenarios': list(options['scenarios']),
+        'comparison': compare_levels(servers['wsgi'], servers['asgi']),
+        'saturation_users': {
+            server_name: load_test.find_saturation((level['users'], level) for level in levels)
+            for server_name, levels in servers.items()
+        },
+        'servers': servers,
+    }
+
+
+class Command(LoadTestCommand):
+    """Load test of the same database served by WSGI and ASGI servers.
+
+    Start both before, e.g. gunicorn tours_manager.wsgi on port 8000 and
+    uvicorn tours_manager.asgi:application on port 8001, asgi.py turns async views on.
+    """
+
+    help = 'Compare throughput of read scenarios on sync WSGI and async ASGI servers.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        super().add_arguments(parser)
+        parser.add_argument('--wsgi-url', default=DEFAULT_WSGI_URL)
+        parser.add_argument('--asgi-url', default=DEFAULT_ASGI_URL)
+        parser.set_defaults(scenarios=READ_SCENARIOS)
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Run load test levels on both servers and write JSON report.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+        """
+        targets = self.prepare_targets(max(options['accounts'], 1))
+        servers = {}
+        for server in SERVERS:
+            base_url = options[f'{server}_url']
+            self.stderr.write(f'{server}: {base_url}')
+            servers[server] = self.run_levels(targets, {**options, 'base_url': base_url})
+        if not options['keep_accounts']:
+            usernames = [username for username, _ in targets.credentials]
+            User.objects.filter(username__in=usernames).delete()
+        report_text = json.dumps(create_report(servers, options), indent=2)
+        if not options['output']:
+            self.stdout.write(report_text)
+            return
+        with open(options['output'], 'w') as output:
+            output.write(report_text)
@@ -0,0 +1,77 @@
+"""Command for bulk import tours catalog of agency."""
+
+from typing import Any
+
+from django.core.management.base import (BaseCommand, CommandError,
+                                         CommandParser)
+
+from ...import_forms import IMPORT_FORMATS
+from ...models import Agency
+from ...views_utils import tours_import
+
+
+class Command(BaseCommand):
+    """Tours catalog importer."""
+
+    help = 'Import agency tours from csv, json or jsonl catalog.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument('catalog', help='Catalog file path.')
+        parser.add_argument('--agency', required=True, help='Agency name.')
+        parser.add_argument(
+            '--format',
+            choices=IMPORT_FORMATS,
+            default=None,
+            help='Catalog format. Defaults to file extension.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=tours_import.DEFAULT_CHUNK_SIZE,
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Import catalog and print rows errors.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+
+        Raises:
+            CommandError: if agency or catalog is not found.
+        """
+        agency_name = options['agency']
+        agency = Agency.objects.filter(name=agency_name).first()
+        if not agency:
+            raise CommandError(f'Agency "{agency_name}" does not exist.')
+        path = options['catalog']
+        import_format = options['format'] or tours_import.get_import_format(path)
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError('Catalog format is not supported, pass --format.')
+        importer = tours_import.ToursImporter(agency, options['chunk_size'])
+        try:
+            with open(path, 'rb') as catalog:
+                summary = importer.import_rows(tours_import.read_rows(catalog, import_format))
+        except (OSError, ValueError) as error:
+            raise CommandError(f'Catalog was not imported: {error}') from error
+        self.write_summary(summary)
+
+    def write_summary(self, summary: tours_import.ImportSummary) -> None:
+        """Print rows errors and counts.
+
+        Args:
+            summary: ImportSummary - import summary.
+        """
+        for row_number, errors in summary.errors:
+            for field_name, error in errors.items():
+                message = f'Row {row_number}: {field_name}: {error}'
+                self.stderr.write(message)
+        failed_count = len(summary.errors)
+        self.stdout.write(self.style.SUCCESS(
+            f'Created: {summary.created}, failed: {failed_count}',
+        ))
@@ -0,0 +1,220 @@
+"""Command for bulk load countries and cities with COPY."""
+
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from django.core.management.base import (BaseCommand, CommandError,
+                                         CommandParser)
+from django.db import DatabaseError, connection, transaction
+from django.db.backends.utils import CursorWrapper
+
+from ...models import NAME_MAX_LEN
+from .. import reference_parsers
+from ..copy_utils import DEFAULT_REPORT_EVERY, ProgressReporter, copy_rows
+
+FORMATS = ('csv', 'geonames')
+
+
+class StagingLoad(NamedTuple):
+    """COPY into staging table followed by upsert."""
+
+    label: str
+    staging: str
+    columns: tuple[str, ...]
+    create_sql: str
+    upsert_sql: str
+
+
+COUNTRIES_LOAD = StagingLoad(
+    label='countries',
+    staging='country_staging',
+    columns=('name',),
+    create_sql="""
+        DROP TABLE IF EXISTS country_staging;
+        CREATE TEMP TABLE country_staging (name text) ON COMMIT DROP;
+    """,
+    upsert_sql="""
+        INSERT INTO tours_data.country (id, name)
+        SELECT gen_random_uuid(), staging.name
+        FROM (SELECT DISTINCT name FROM country_staging) AS staging
+        ON CONFLICT (name) DO NOTHING
+    """,
+)
+CITIES_LOAD = StagingLoad(
+    label='cities',
+    staging='city_staging',
+    columns=('name', 'country_name', 'longitude', 'latitude'),
+    create_sql="""
+        DROP TABLE IF EXISTS city_staging;
+        CREATE TEMP TABLE city_staging (
+            name text,
+            country_name text,
+            longitude double precision,
+            latitude double precision
+        ) ON COMMIT DROP;
+    """,
+    upsert_sql="""
+        WITH candidates AS (
+            SELECT DISTINCT ON (staging.name, country.id)
+                staging.name,
+                country.id AS country_id,
+                ST_SetSRID(ST_MakePoint(staging.longitude, staging.latitude), 4326) AS point
+            FROM city_staging AS staging
+            JOIN tours_data.country AS country ON country.name = staging.country_name
+            ORDER BY staging.name, country.id
+        ), unique_points AS (
+            SELECT DISTINCT ON (point) * FROM candidates ORDER BY point, name
+        )
+        INSERT INTO tours_data.city AS city (id, name, country_id, point)
+        SELECT gen_random_uuid(), new.name, new.country_id, new.point
+        FROM unique_points AS new
+        WHERE NOT EXISTS (
+            SELECT 1 FROM tours_data.city AS existing
+            WHERE existing.point = new.point
+            AND (existing.name, existing.country_id) <> (new.name, new.country_id)
+        )
+        ON CONFLICT (name, country_id) DO UPDATE SET point = EXCLUDED.point
+        WHERE NOT ST_Equals(city.point, EXCLUDED.point)
+    """,
+)
+
+
+def _collect_codes(
+    countries: Iterable[tuple[str, str]],
+    country_names: dict[str, str],
+) -> Iterator[tuple[str]]:
+    for code, name in countries:
+        if code:
+            country_names[code] = name
+        yield (name,)
+
+
+class Command(BaseCommand):
+    """Countries and cities loader."""
+
+    help = 'Load countries and cities from csv or GeoNames dumps with COPY and upsert.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument('--countries', help='Countries file, e.g. countries.csv.')
+        parser.add_argument(
+            '--cities',
+            help='Cities file. GeoNames cities need --countries with countryInfo.txt.',
+        )
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--report-every', type=int, default=DEFAULT_REPORT_EVERY)
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Load reference data in one transaction.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+
+        Raises:
+            CommandError: if arguments are wrong or data can not be loaded.
+        """
+        countries_path, cities_path = options['countries'], options['cities']
+        if not countries_path and not cities_path:
+            raise CommandError('Nothing to load, pass --countries and/or --cities.')
+        geonames = options['format'] == 'geonames'
+        if geonames and cities_path and not countries_path:
+            raise CommandError('GeoNames cities need --countries to resolve country codes.')
+        self.report_every = options['report_every']
+        country_names = {}
+        try:
+            with transaction.atomic():
+                self.load(countries_path, cities_path, geonames, country_names)
+        except (OSError, ValueError, DatabaseError) as error:
+            raise CommandError(f'Reference data was not loaded: {error}') from error
+
+    def load(
+        self,
+        countries_path: str | None,
+        cities_path: str | None,
+        geonames: bool,
+        country_names: dict[str, str],
+    ) -> None:
+        """Load countries and cities files.
+
+        Args:
+            countries_path: str | None - countries file path.
+            cities_path: str | None - cities file path.
+            geonames: bool - if files are GeoNames dumps.
+            country_names: dict[str, str] - country names by codes.
+        """
+        with connection.cursor() as cursor:
+            if countries_path:
+                self.load_countries(cursor, countries_path, geonames, country_names)
+            if cities_path:
+                self.load_cities(cursor, cities_path, geonames, country_names)
+
+    def load_countries(
+        self,
+        cursor: CursorWrapper,
+        path: str,
+        geonames: bool,
+        country_names: dict[str, str],
+    ) -> None:
+        """Load countries from file.
+
+        Args:
+            cursor: CursorWrapper - database cursor.
+            path: str - countries file path.
+            geonames: bool - if file is GeoNames countryInfo dump.
+            country_names: dict[str, str] - filled with country names by codes.
+        """
+        read = reference_parsers.read_countries_csv
+        if geonames:
+            read = reference_parsers.read_countries_geonames
+        with open(path, encoding='utf-8') as dump:
+            rows = _collect_codes(read(dump), country_names)
+            self._load(cursor, COUNTRIES_LOAD, rows)
+
+    def load_cities(
+        self,
+        cursor: CursorWrapper,
+        path: str,
+        geonames: bool,
+        country_names: dict[str, str],
+    ) -> None:
+        """Load cities from file.
+
+        Args:
+            cursor: CursorWrapper - database cursor.
+            path: str - cities file path.
+            geonames: bool - if file is GeoNames cities dump.
+            country_names: dict[str, str] - country names by codes.
+        """
+        with open(path, encoding='utf-8') as dump:
+            if geonames:
+                rows = reference_parsers.read_cities_geonames(dump, country_names)
+            else:
+                rows = reference_parsers.read_cities_csv(dump)
+            rows = (row for row in rows if len(row[0]) <= NAME_MAX_LEN)
+            self._load(cursor, CITIES_LOAD, rows)
+
+    def _report(self, label: str, count: int, elapsed: float) -> None:
+        rate = round(count / elapsed) if elapsed else count
+        message = f'{label}: {count} rows streamed, {rate} rows/s'
+        self.stdout.write(message)
+
+    def _load(
+        self,
+        cursor: CursorWrapper,
+        load: StagingLoad,
+        rows: Iterable[tuple],
+    ) -> None:
+        progress = ProgressReporter(
+            lambda count, elapsed: self._report(load.label, count, elapsed),
+            self.report_every,
+        )
+        cursor.execute(load.create_sql)
+        copy_rows(cursor, load.staging, load.columns, progress.track(rows))
+        self._report(load.label, progress.count, progress.elapsed)
+        cursor.execute(load.upsert_sql)
+        upserted = f'{load.label}: {cursor.rowcount} rows inserted or updated'
+        self.stdout.write(self.style.SUCCESS(upserted))
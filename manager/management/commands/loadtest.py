@@ -0,0 +1,173 @@
+"""Command for load test running server with concurrent virtual users."""
+
+import json
+import secrets
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import (BaseCommand, CommandError,
+                                         CommandParser)
+from rest_framework.authtoken.models import Token
+
+from ...models import Account, Tour
+from .. import load_test
+from ..load_scenarios import SCENARIOS, LoadTargets
+
+DEFAULT_BASE_URL = 'http://localhost:8000'
+DEFAULT_USERS = (1, 5, 10, 25, 50)
+DEFAULT_DURATION = 30
+DEFAULT_THINK_TIME = 0.5
+DEFAULT_ACCOUNTS = 20
+TARGET_TOURS = 200
+USERNAME_PREFIX = 'loadtest'
+
+
+class Command(BaseCommand):
+    """Load test of running server."""
+
+    help = 'Report throughput, latency and errors of running server under growing users counts.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+        parser.add_argument(
+            '--users',
+            nargs='+',
+            type=int,
+            default=DEFAULT_USERS,
+            help='Concurrent virtual users of every level.',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=DEFAULT_DURATION,
+            help='Seconds of every level.',
+        )
+        parser.add_argument(
+            '--think-time',
+            type=float,
+            default=DEFAULT_THINK_TIME,
+            help='Mean pause between scenarios in seconds, 0 for closed loop.',
+        )
+        parser.add_argument(
+            '--scenarios',
+            nargs='+',
+            choices=tuple(SCENARIOS),
+            default=tuple(SCENARIOS),
+        )
+        parser.add_argument(
+            '--accounts',
+            type=int,
+            default=DEFAULT_ACCOUNTS,
+            help='Accounts for log in and API tokens, shared by virtual users.',
+        )
+        parser.add_argument(
+            '--keep-accounts',
+            action='store_true',
+            help='Keep load test accounts and their reviews.',
+        )
+        parser.add_argument('--output', default=None, help='JSON file, stdout by default.')
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Run load test levels and write JSON report.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+        """
+        targets = self.prepare_targets(max(options['accounts'], 1))
+        levels = self.run_levels(targets, options)
+        if not options['keep_accounts']:
+            usernames = [username for username, _ in targets.credentials]
+            User.objects.filter(username__in=usernames).delete()
+        report = {
+            'base_url': options['base_url'],
+            'duration': options['duration'],
+            'scenarios': list(options['scenarios']),
+            'saturation_users': load_test.find_saturation(
+                (level['users'], level) for level in levels
+            ),
+            'levels': levels,
+        }
+        report_text = json.dumps(report, indent=2)
+        if not options['output']:
+            self.stdout.write(report_text)
+            return
+        with open(options['output'], 'w') as output:
+            output.write(report_text)
+
+    def run_levels(self, targets: LoadTargets, options: dict) -> list[dict]:
+        """Run load test with every users count.
+
+        Args:
+            targets: LoadTargets - objects and credentials for virtual users.
+            options: dict - command options.
+
+        Returns:
+            list[dict]: levels summaries.
+        """
+        levels = []
+        for users_count in sorted(set(options['users'])):
+            level = load_test.run_level(options['base_url'], targets, users_count, options)
+            levels.append(level)
+            level_summary = {key: level[key] for key in level if key != 'steps'}
+            self.stderr.write(f'{users_count} users: {level_summary}')
+        return levels
+
+    def prepare_targets(self, accounts_count: int) -> LoadTargets:
+        """Pick tours and create accounts with passwords and API tokens.
+
+        Args:
+            accounts_count: int - count of accounts.
+
+        Raises:
+            CommandError: if there are no tours.
+
+        Returns:
+            LoadTargets: objects and credentials for virtual users.
+        """
+        tours = Tour.objects.order_by('id').values_list(
+            'id', 'starting_city_id', 'starting_city__country_id',
+        )
+        tours = list(tours[:TARGET_TOURS])
+        if not tours:
+            raise CommandError('Nothing to load, fill database first, e.g. manage.py seed.')
+        filters = {
+            (str(country_id), str(city_id)) for _, city_id, country_id in tours
+        }
+        credentials, tokens = self.create_accounts(accounts_count)
+        return LoadTargets(
+            tours_ids=[str(tour[0]) for tour in tours],
+            filters=[
+                {'country': country_id, 'starting_city': city_id}
+                for country_id, city_id in sorted(filters)
+            ],
+            credentials=credentials,
+            tokens=tokens,
+        )
+
+    def create_accounts(self, accounts_count: int) -> tuple[list, list]:
+        """Create or reuse load test accounts with new passwords.
+
+        Args:
+            accounts_count: int - count of accounts.
+
+        Returns:
+            tuple[list, list]: usernames with passwords and API tokens.
+        """
+        credentials, tokens = [], []
+        for number in range(accounts_count):
+            username, password = f'{USERNAME_PREFIX}{number}', secrets.token_urlsafe()
+            user = User.objects.filter(username=username).first()
+            user = user or User(username=username)
+            user.set_password(password)
+            user.save()
+            Account.objects.get_or_create(account=user)
+            credentials.append((username, password))
+            token = Token.objects.get_or_create(user=user)[0]
+            tokens.append(token.key)
+        return credentials, tokens
@@ -0,0 +1,57 @@
+"""Command for process uploaded images in background."""
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...views_utils import image_jobs
+
+DEFAULT_INTERVAL_SECONDS = 5
+
+
+class Command(BaseCommand):
+    """Image jobs worker."""
+
+    help = 'Make renditions of uploaded images and delete replaced files on a thread pool.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--max-attempts', type=int, default=None)
+        parser.add_argument('--workers', type=int, default=None)
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=DEFAULT_INTERVAL_SECONDS,
+            help='Seconds to wait when there are no due jobs.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process due jobs and exit.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Process jobs until stopped.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+        """
+        while True:
+            processed_count, failed_count = image_jobs.process_image_jobs(
+                batch_size=options['batch_size'],
+                max_attempts=options['max_attempts'],
+                workers=options['workers'],
+            )
+            if processed_count or failed_count:
+                self.stdout.write(f'Processed: {processed_count}, failed: {failed_count}')
+                continue
+            if options['once']:
+                return
+            time.sleep(options['interval'])
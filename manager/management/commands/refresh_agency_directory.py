@@ -0,0 +1,39 @@
+"""Command for refresh agencies directory summary."""
+
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...views_utils.agency_directory import refresh_agency_directory
+
+
+class Command(BaseCommand):
+    """Agencies directory refresh, run it on schedule, e.g. from cron."""
+
+    help = 'Refresh agencies directory entries in batches without blocking readers.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument(
+            '--agencies',
+            nargs='+',
+            type=UUID,
+            default=None,
+            help='Ids of agencies for refresh, all agencies by default.',
+        )
+        parser.add_argument('--batch-size', type=int, default=None)
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Refresh directory entries.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+        """
+        refreshed_count = refresh_agency_directory(options['agencies'], options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Refreshed: {refreshed_count} agencies'))
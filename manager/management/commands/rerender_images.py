@@ -0,0 +1,190 @@
+"""Command for make renditions of already uploaded covers and avatars."""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Iterator
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
+
+from ...views_utils import image_jobs, renditions
+
+DEFAULT_CHUNK_SIZE = 200
+DEFAULT_CHECKPOINT = '.rerender_images_checkpoint.json'
+
+
+def _init_worker() -> None:
+    if not apps.ready:
+        django.setup()
+
+
+def render_image(model_key: str, image: str) -> tuple[dict | None, str | None]:
+    """Make renditions of stored image in worker process.
+
+    Args:
+        model_key: str - tour or account.
+        image: str - image storage name.
+
+    Returns:
+        tuple[dict | None, str | None]: renditions names by widths or error.
+    """
+    model = image_jobs.IMAGE_MODELS[model_key]
+    try:
+        new_renditions = renditions.create_renditions(
+            model.avatar.field.storage, image, model.rendition_widths,
+        )
+    except Exception as error:
+        return None, str(error)
+    return new_renditions, None
+
+
+class Checkpoint:
+    """Last processed id of every model saved in JSON file."""
+
+    def __init__(self, path: str, reset: bool) -> None:
+        """Load checkpoint.
+
+        Args:
+            path: str - checkpoint file path.
+            reset: bool - start from the beginning.
+        """
+        self.path = Path(path)
+        self.last_ids = {}
+        if self.path.exists() and not reset:
+            self.last_ids = json.loads(self.path.read_text())
+
+    def save(self, model_key: str, last_id: Any) -> None:
+        """Save last processed id atomically.
+
+        Args:
+            model_key: str - tour or account.
+            last_id: Any - last processed id.
+        """
+        self.last_ids[model_key] = str(last_id)
+        temporary_path = self.path.with_suffix('.tmp')
+        temporary_path.write_text(json.dumps(self.last_ids))
+        os.replace(temporary_path, self.path)
+
+
+class Command(BaseCommand):
+    """Bulk renditions maker."""
+
+    help = 'Make renditions of existing covers and avatars on a process pool with resume.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument(
+            '--models',
+            nargs='+',
+            choices=tuple(image_jobs.IMAGE_MODELS),
+            default=tuple(image_jobs.IMAGE_MODELS),
+        )
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count(),
+            help='Worker processes, 1 for render in this process.',
+        )
+        parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT)
+        parser.add_argument('--reset', action='store_true', help='Ignore saved checkpoint.')
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Render images which already have renditions too.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Render images of all chosen models.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+        """
+        self.options = options
+        self.checkpoint = Checkpoint(options['checkpoint'], options['reset'])
+        self.started = time.monotonic()
+        self.rendered_count = 0
+        if options['workers'] <= 1:
+            self.render_models(map)
+            return
+        connections.close_all()
+        with ProcessPoolExecutor(options['workers'], initializer=_init_worker) as pool:
+            self.render_models(pool.map)
+
+    def render_models(self, map_function: Any) -> None:
+        """Render images model by model.
+
+        Args:
+            map_function: Any - map or pool map for render chunks.
+        """
+        for model_key in self.options['models']:
+            for chunk in self.iter_chunks(model_key):
+                images = [image for _, image in chunk]
+                outcomes = list(map_function(render_image, repeat(model_key), images))
+                self.store_chunk(model_key, chunk, outcomes)
+
+    def iter_chunks(self, model_key: str) -> Iterator[list]:
+        """Iterate ids and images in id order after checkpoint.
+
+        Args:
+            model_key: str - tour or account.
+
+        Yields:
+            list: chunk of ids and images.
+        """
+        model = image_jobs.IMAGE_MODELS[model_key]
+        queryset = model.objects.exclude(avatar='').exclude(avatar=None)
+        queryset = queryset.order_by('id')
+        if not self.options['all']:
+            queryset = queryset.filter(avatar_renditions={})
+        last_id = self.checkpoint.last_ids.get(model_key)
+        while True:
+            page = queryset.filter(id__gt=last_id) if last_id else queryset
+            page = page.values_list('id', 'avatar')
+            chunk = list(page[:self.options['chunk_size']])
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1][0]
+
+    def store_chunk(self, model_key: str, chunk: list, outcomes: list) -> None:
+        """Save renditions of chunk, checkpoint and report throughput.
+
+        Args:
+            model_key: str - tour or account.
+            chunk: list - ids and images.
+            outcomes: list - renditions or errors.
+        """
+        model = image_jobs.IMAGE_MODELS[model_key]
+        for (target_id, image), (new_renditions, error) in zip(chunk, outcomes):
+            if error:
+                self.stderr.write(f'{model_key} {target_id}: {error}')
+            else:
+                self.rendered_count += image_jobs.store_renditions(
+                    model, target_id, image, new_renditions,
+                )
+        self.checkpoint.save(model_key, chunk[-1][0])
+        self.report(model_key)
+
+    def report(self, model_key: str) -> None:
+        """Print rendered images count and throughput.
+
+        Args:
+            model_key: str - tour or account.
+        """
+        rendered_count = self.rendered_count
+        elapsed = time.monotonic() - self.started
+        rate = round(rendered_count / elapsed, 1) if elapsed else rendered_count
+        message = f'{model_key}: {rendered_count} rendered, {rate} images/s'
+        self.stdout.write(message)
@@ -0,0 +1,67 @@
+"""Command for fill database with deterministic synthetic data."""
+
+from typing import Any
+
+from django.core.management.base import (BaseCommand, CommandError,
+                                         CommandParser)
+from django.db import DatabaseError, transaction
+
+from ...views_utils.agency_directory import refresh_agency_directory
+from ..copy_utils import DEFAULT_REPORT_EVERY
+from ..seed_data import DEFAULT_REVIEWS_PER_TOUR, SyntheticData
+
+DEFAULT_TOURS_COUNT = 10000
+
+
+class Command(BaseCommand):
+    """Synthetic data generator."""
+
+    help = 'Fill empty database with reproducible skewed tours, reviews and accounts with COPY.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument('--tours', type=int, default=DEFAULT_TOURS_COUNT)
+        parser.add_argument('--seed', type=int, default=0, help='The same seed gives same rows.')
+        parser.add_argument(
+            '--reviews-per-tour',
+            type=float,
+            default=DEFAULT_REVIEWS_PER_TOUR,
+            help='Mean reviews count, popular tours get much more.',
+        )
+        parser.add_argument('--report-every', type=int, default=DEFAULT_REPORT_EVERY)
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Create synthetic data and agencies directory of it in one transaction.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+
+        Raises:
+            CommandError: if data can not be created.
+        """
+        generator = SyntheticData(
+            options['seed'],
+            options['reviews_per_tour'],
+            self._report,
+            options['report_every'],
+        )
+        try:
+            with transaction.atomic():
+                counts = generator.create(options['tours'])
+                counts['agencydirectory'] = refresh_agency_directory()
+        except DatabaseError as error:
+            raise CommandError(f'Synthetic data was not created: {error}') from error
+        self._report(generator.progress.count, generator.progress.elapsed)
+        for model_name, count in counts.items():
+            message = f'{model_name}: {count} rows'
+            self.stdout.write(self.style.SUCCESS(message))
+
+    def _report(self, count: int, elapsed: float) -> None:
+        rate = round(count / elapsed) if elapsed else count
+        message = f'{count} rows streamed, {rate} rows/s'
+        self.stdout.write(message)
@@ -0,0 +1,55 @@
+"""Command for deliver emails from outbox."""
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...views_utils import email_utils
+
+DEFAULT_INTERVAL_SECONDS = 5
+
+
+class Command(BaseCommand):
+    """Outbox delivery worker."""
+
+    help = 'Deliver queued emails from outbox in batches over one SMTP connection.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser: CommandParser - command arguments parser.
+        """
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--max-attempts', type=int, default=None)
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=DEFAULT_INTERVAL_SECONDS,
+            help='Seconds to wait when outbox is empty.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain due emails and exit.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Drain outbox until stopped.
+
+        Args:
+            args: Any - arguments.
+            options: Any - command options.
+        """
+        while True:
+            sent_count, failed_count = email_utils.send_queued_emails(
+                batch_size=options['batch_size'],
+                max_attempts=options['max_attempts'],
+            )
+            if sent_count or failed_count:
+                self.stdout.write(f'Sent: {sent_count}, failed: {failed_count}')
+                continue
+            if options['once']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,187 @@
+"""Module with helpers for bulk load rows into database with COPY."""
+
+import csv
+import io
+import json
+import time
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+
+DEFAULT_CHUNK_ROWS = 10000
+DEFAULT_REPORT_EVERY = 100000
+
+
+def iter_csv_chunks(
+    rows: Iterable[Sequence],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[str]:
+    """Format rows as CSV text in chunks, so only one chunk is kept in memory.
+
+    Args:
+        rows: Iterable[Sequence] - rows for format.
+        chunk_rows: int, optional - rows in one chunk. Defaults to DEFAULT_CHUNK_ROWS.
+
+    Yields:
+        str: CSV text of chunk.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    for row_number, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if row_number % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+class ChunksFile(io.TextIOBase):
+    """Readable file over iterator of text chunks."""
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        """Init file.
+
+        Args:
+            chunks: Iterable[str] - text chunks.
+        """
+        super().__init__()
+        self.chunks = iter(chunks)
+        self.current = io.StringIO()
+
+    def readable(self) -> bool:
+        """Check file is readable.
+
+        Returns:
+            bool: always True.
+        """
+        return True
+
+    def read(self, size: int = -1) -> str:
+        """Read text from chunks.
+
+        Args:
+            size: int, optional - max characters count, -1 for read all. Defaults to -1.
+
+        Returns:
+            str: read text, empty at the end of chunks.
+        """
+        parts = []
+        remaining = size
+        while remaining:
+            part = self.current.read(remaining)
+            if part:
+                parts.append(part)
+                remaining = remaining - len(part) if size >= 0 else remaining
+                continue
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.current = io.StringIO(chunk)
+        return ''.join(parts)
+
+
+class ProgressReporter:
+    """Count streamed rows and report progress."""
+
+    def __init__(self, report: Callable[[int, float], None], every: int) -> None:
+        """Init reporter.
+
+        Args:
+            report: Callable[[int, float], None] - called with rows count and elapsed seconds.
+            every: int - report every this rows count.
+        """
+        self.report = report
+        self.every = every
+        self.count = 0
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """Get seconds since reporter creation.
+
+        Returns:
+            float: elapsed seconds.
+        """
+        return time.monotonic() - self.started
+
+    def track(self, rows: Iterable[Sequence]) -> Iterator[Sequence]:
+        """Pass rows through and count them.
+
+        Args:
+            rows: Iterable[Sequence] - rows for count.
+
+        Yields:
+            Sequence: the same rows.
+        """
+        for row in rows:
+            self.count += 1
+            if self.count % self.every == 0:
+                self.report(self.count, self.elapsed)
+            yield row
+
+
+def copy_rows(
+    cursor: CursorWrapper,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+) -> None:
+    """Stream rows into table with COPY FROM STDIN.
+
+    Works with both psycopg2 and psycopg 3 database drivers.
+
+    Args:
+        cursor: CursorWrapper - django database cursor.
+        table: str - quoted table name.
+        columns: Sequence[str] - columns of rows.
+        rows: Iterable[Sequence] - rows for load.
+    """
+    columns_sql = ', '.join(columns)
+    copy_sql = f'COPY {table} ({columns_sql}) FROM STDIN WITH (FORMAT csv)'
+    chunks = iter_csv_chunks(rows)
+    driver_cursor = cursor.cursor
+    copy_expert = getattr(driver_cursor, 'copy_expert', None)
+    if copy_expert:
+        copy_expert(copy_sql, ChunksFile(chunks))
+        return
+    with driver_cursor.copy(copy_sql) as copy:
+        for chunk in chunks:
+            copy.write(chunk)
+
+
+def to_copy_value(field_value: Any) -> Any:
+    """Convert python value of model field to COPY csv value.
+
+    Args:
+        field_value: Any - python value of field.
+
+    Returns:
+        Any: value which csv writer formats as postgres input.
+    """
+    if isinstance(field_value, (dict, list)):
+        return json.dumps(field_value)
+    return getattr(field_value, 'ewkt', field_value)
+
+
+def copy_models(cursor: CursorWrapper, model: type, rows: Iterable[Any]) -> None:
+    """Stream rows of model into its table with COPY.
+
+    Args:
+        cursor: CursorWrapper - django database cursor.
+        model: type - model of table.
+        rows: Iterable[Any] - rows with fields attnames attributes, missing fields get defaults.
+    """
+    fields = model._meta.concrete_fields  # noqa: WPS437
+    defaults = tuple((field.attname, field.get_default()) for field in fields)
+    copy_rows(
+        cursor,
+        connection.ops.quote_name(model._meta.db_table),  # noqa: WPS437
+        [connection.ops.quote_name(field.column) for field in fields],
+        (
+            [to_copy_value(getattr(row, attname, default)) for attname, default in defaults]
+            for row in rows
+        ),
+    )
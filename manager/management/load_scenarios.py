@@ -0,0 +1,226 @@
+"""Module with virtual users and scenarios of load test."""
+
+import json
+import random
+import time
+from http.cookiejar import CookieJar
+from types import MappingProxyType
+from typing import NamedTuple
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urlsplit
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+
+MILLISECONDS = 1000
+REQUEST_TIMEOUT = 30
+CSRF_COOKIE = 'csrftoken'
+BROWSED_PAGES = 3
+PAGED_REVIEWS = 3
+API_PAGES = 5
+API_DETAILS = 3
+TOUR_URL = '/tour/{0}/'
+REVIEW_TEXT = 'Load test review.'
+
+
+class Sample(NamedTuple):
+    """One measured request."""
+
+    scenario: str
+    step: str
+    status: int
+    latency_ms: float
+
+
+class LoadTargets(NamedTuple):
+    """Existing objects and credentials shared by virtual users."""
+
+    tours_ids: list[str]
+    filters: list[dict[str, str]]
+    credentials: list[tuple[str, str]]
+    tokens: list[str]
+
+
+class VirtualUser:
+    """Client with own cookies which records latency of every request."""
+
+    def __init__(
+        self,
+        base_url: str,
+        targets: LoadTargets,
+        number: int,
+        generator: random.Random,
+    ) -> None:
+        """Init virtual user.
+
+        Args:
+            base_url: str - server url, e.g. http://localhost:8000.
+            targets: LoadTargets - objects and credentials for requests.
+            number: int - user number, picks credentials and token.
+            generator: Random - random generator of user choices.
+        """
+        self._base_url = base_url.rstrip('/')
+        self._cookies = CookieJar()
+        self._opener = build_opener(HTTPCookieProcessor(self._cookies))
+        self.targets = targets
+        self.number = number
+        self.random = generator
+        self.scenario = ''
+        self.logged_in = False
+        self.samples = []
+
+    def request(
+        self,
+        step: str,
+        path: str,
+        form: dict | None = None,
+        api_token: str | None = None,
+    ) -> bytes:
+        """Send request and record its status and latency.
+
+        Args:
+            step: str - step name in report.
+            path: str - url path with query.
+            form: dict | None, optional - POST form, GET if None. Defaults to None.
+            api_token: str | None, optional - API token. Defaults to None.
+
+        Returns:
+            bytes: response body, empty on errors.
+        """
+        payload = None if form is None else urlencode(form).encode()
+        request = Request(f'{self._base_url}{path}', data=payload)
+        if api_token:
+            request.add_header('Authorization', f'Token {api_token}')
+        started = time.perf_counter()
+        body = b''
+        try:
+            with self._opener.open(request, timeout=REQUEST_TIMEOUT) as response:
+                body = response.read()
+                status = response.status
+        except HTTPError as error:
+            status = error.code
+        except OSError:
+            status = 0
+        latency = (time.perf_counter() - started) * MILLISECONDS
+        self.samples.append(Sample(self.scenario, step, status, latency))
+        return body
+
+    def post(self, step: str, path: str, form: dict) -> bytes:
+        """Send form with CSRF token from cookies.
+
+        Args:
+            step: str - step name in report.
+            path: str - url path.
+            form: dict - POST form.
+
+        Returns:
+            bytes: response body, empty on errors.
+        """
+        csrf_tokens = [cookie.value for cookie in self._cookies if cookie.name == CSRF_COOKIE]
+        csrf_form = {'csrfmiddlewaretoken': ''.join(csrf_tokens[:1])}
+        return self.request(step, path, {**csrf_form, **form})
+
+    def pick_tour_url(self) -> str:
+        """Pick tour page url.
+
+        Returns:
+            str: tour page path.
+        """
+        return TOUR_URL.format(self.random.choice(self.targets.tours_ids))
+
+
+def browse_tours(user: VirtualUser) -> None:
+    """Walk first tours pages and agencies.
+
+    Args:
+        user: VirtualUser - virtual user.
+    """
+    user.request('index', '/')
+    for page in range(1, user.random.randint(1, BROWSED_PAGES) + 1):
+        user.request('tours', f'/tours/?page={page}')
+    user.request('agencies', '/agencies/')
+
+
+def filter_tours(user: VirtualUser) -> None:
+    """Filter tours by country and starting city.
+
+    Args:
+        user: VirtualUser - virtual user.
+    """
+    query = urlencode(user.random.choice(user.targets.filters))
+    user.request('tours-filtered', f'/tours/?{query}')
+
+
+def open_tour(user: VirtualUser) -> None:
+    """Open tour page.
+
+    Args:
+        user: VirtualUser - virtual user.
+    """
+    user.request('tour', user.pick_tour_url())
+
+
+def page_reviews(user: VirtualUser) -> None:
+    """Page through reviews of tour.
+
+    Args:
+        user: VirtualUser - virtual user.
+    """
+    tour_url = user.pick_tour_url()
+    for page in range(1, PAGED_REVIEWS + 1):
+        user.request('reviews-page', f'{tour_url}?page={page}')
+
+
+def post_review(user: VirtualUser) -> None:
+    """Log in once and post or edit review of tour.
+
+    Args:
+        user: VirtualUser - virtual user.
+    """
+    if not user.logged_in:
+        credentials = user.targets.credentials
+        username, password = credentials[user.number % len(credentials)]
+        user.request('login-page', '/login/')
+        user.post('login', '/login/', {'username': username, 'password': password})
+        user.logged_in = True
+    tour_url = user.pick_tour_url()
+    user.request('tour', tour_url)
+    review_form = {'rating': user.random.randint(1, 5), 'text': REVIEW_TEXT}
+    user.post('review-post', tour_url, review_form)
+
+
+def walk_api(user: VirtualUser) -> None:
+    """Walk tours API list with token and open some tours.
+
+    Args:
+        user: VirtualUser - virtual user.
+    """
+    tokens = user.targets.tokens
+    token = tokens[user.number % len(tokens)]
+    next_url = '/api/tours/'
+    tours = []
+    for _ in range(API_PAGES):
+        body = user.request('api-tours', next_url, api_token=token)
+        try:
+            page = json.loads(body)
+        except ValueError:
+            return
+        if isinstance(page, list):
+            tours.extend(page)
+            break
+        tours.extend(page.get('results', []))
+        if not page.get('next'):
+            break
+        next_parts = urlsplit(page['next'])
+        next_url = f'{next_parts.path}?{next_parts.query}'
+    for tour in user.random.sample(tours, min(len(tours), API_DETAILS)):
+        user.request('api-tour', f"/api/tours/{tour['id']}/", api_token=token)
+
+
+# Scenarios functions with weights of their choice by virtual users.
+SCENARIOS = MappingProxyType({
+    'browse': (browse_tours, 30),
+    'filter': (filter_tours, 15),
+    'tour': (open_tour, 25),
+    'reviews': (page_reviews, 15),
+    'post-review': (post_review, 5),
+    'api': (walk_api, 10),
+})
@@ -0,0 +1,166 @@
+"""Module with load test runner and report of throughput, latency and errors."""
+
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Iterable
+
+from .load_scenarios import SCENARIOS, LoadTargets, Sample, VirtualUser
+
+PERCENTILES = 100
+P50_INDEX = 49
+P95_INDEX = 94
+P99_INDEX = 98
+MIN_ERROR_STATUS = 400
+SATURATION_GAIN = 0.1
+DIGITS = 2
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict:
+    """Summarize requests count, throughput, error rate and latency percentiles.
+
+    Args:
+        samples: list[Sample] - measured requests.
+        elapsed: float - seconds of test.
+
+    Returns:
+        dict: requests, errors, error_rate, rps and p50_ms, p95_ms, p99_ms.
+    """
+    errors_count = sum(
+        1 for sample in samples if not sample.status or sample.status >= MIN_ERROR_STATUS
+    )
+    summary = {
+        'requests': len(samples),
+        'errors': errors_count,
+        'error_rate': round(errors_count / len(samples), DIGITS + DIGITS) if samples else 0,
+        'rps': round(len(samples) / elapsed, DIGITS) if elapsed else 0,
+    }
+    latencies = [sample.latency_ms for sample in samples]
+    if latencies:
+        # Quantiles need two points at least, one request is its own percentiles.
+        padded = latencies
+        if len(latencies) == 1:
+            padded = list(repeat(latencies[0], 2))
+        cut_points = statistics.quantiles(padded, n=PERCENTILES, method='inclusive')
+        summary['p50_ms'] = round(cut_points[P50_INDEX], DIGITS)
+        summary['p95_ms'] = round(cut_points[P95_INDEX], DIGITS)
+        summary['p99_ms'] = round(cut_points[P99_INDEX], DIGITS)
+    return summary
+
+
+def summarize_steps(samples: list[Sample], elapsed: float) -> dict:
+    """Summarize every scenario step.
+
+    Args:
+        samples: list[Sample] - measured requests.
+        elapsed: float - seconds of test.
+
+    Returns:
+        dict: summaries by scenario and step names.
+    """
+    steps = {}
+    for sample in samples:
+        step_name = f'{sample.scenario}:{sample.step}'
+        steps.setdefault(step_name, []).append(sample)
+    return {
+        step_name: summarize(step_samples, elapsed)
+        for step_name, step_samples in sorted(steps.items())
+    }
+
+
+def find_saturation(levels: Iterable[tuple[int, dict]]) -> int | None:
+    """Find users count after which throughput stops growing.
+
+    Args:
+        levels: Iterable[tuple[int, dict]] - users counts with their summaries in growing order.
+
+    Returns:
+        int | None: last users count which still gained throughput, None if it always grew.
+    """
+    previous_users, previous_rps = None, 0
+    for users_count, summary in levels:
+        if previous_users and summary['rps'] < previous_rps * (1 + SATURATION_GAIN):
+            return previous_users
+        previous_users, previous_rps = users_count, summary['rps']
+    return None
+
+
+def run_user(user: VirtualUser, scenarios: list[str], deadline: float, think_time: float) -> None:
+    """Run random scenarios until deadline.
+
+    Args:
+        user: VirtualUser - virtual user.
+        scenarios: list[str] - names of scenarios for choose.
+        deadline: float - perf counter value for stop.
+        think_time: float - mean pause between scenarios in seconds.
+    """
+    weights = [SCENARIOS[scenario][1] for scenario in scenarios]
+    while time.perf_counter() < deadline:
+        user.scenario = user.random.choices(scenarios, weights)[0]
+        SCENARIOS[user.scenario][0](user)
+        if think_time:
+            time.sleep(user.random.expovariate(1 / think_time))
+
+
+def create_users(
+    base_url: str,
+    targets: LoadTargets,
+    users_count: int,
+) -> list[VirtualUser]:
+    """Create virtual users with own random generators seeded with their numbers.
+
+    Args:
+        base_url: str - server url.
+        targets: LoadTargets - objects and credentials for requests.
+        users_count: int - count of virtual users.
+
+    Returns:
+        list[VirtualUser]: virtual users.
+    """
+    users = []
+    for number in range(users_count):
+        generator = random.Random(number)  # noqa: S311
+        users.append(VirtualUser(base_url, targets, number, generator))
+    return users
+
+
+def run_level(
+    base_url: str,
+    targets: LoadTargets,
+    users_count: int,
+    options: dict,
+) -> dict:
+    """Run concurrent virtual users for duration and summarize their requests.
+
+    Args:
+        base_url: str - server url.
+        targets: LoadTargets - objects and credentials for requests.
+        users_count: int - concurrent virtual users.
+        options: dict - scenarios, duration and think_time.
+
+    Returns:
+        dict: level summary with steps summaries.
+    """
+    users = create_users(base_url, targets, users_count)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(users_count) as pool:
+        runs = [
+            pool.submit(
+                run_user,
+                user,
+                options['scenarios'],
+                started + options['duration'],
+                options['think_time'],
+            )
+            for user in users
+        ]
+    for run in runs:
+        run.result()
+    elapsed = time.perf_counter() - started
+    samples = [sample for virtual_user in users for sample in virtual_user.samples]
+    summary = summarize(samples, elapsed)
+    summary['users'] = users_count
+    summary['steps'] = summarize_steps(samples, elapsed)
+    return summary
@@ -0,0 +1,97 @@
+"""Module with streaming parsers of countries and cities dumps.
+
+Supported formats:
+    csv - countries as comma separated names (in one or several lines),
+        cities with `name,country,latitude,longitude` header.
+    geonames - countries from `countryInfo.txt`, cities from `cities*.txt`
+        or `allCountries.txt` tab separated dumps.
+"""
+
+import csv
+from typing import Iterator, TextIO
+
+GEONAMES_COMMENT = '#'
+GEONAMES_COUNTRY_CODE = 0
+GEONAMES_COUNTRY_NAME = 4
+GEONAMES_CITY_NAME = 1
+GEONAMES_CITY_LATITUDE = 4
+GEONAMES_CITY_LONGITUDE = 5
+GEONAMES_CITY_COUNTRY = 8
+
+
+def _iter_geonames_rows(dump: TextIO) -> Iterator[list[str]]:
+    for line in dump:
+        if line.strip() and not line.startswith(GEONAMES_COMMENT):
+            yield line.rstrip('\r\n').split('\t')
+
+
+def read_countries_csv(dump: TextIO) -> Iterator[tuple[str, str]]:
+    """Read countries from csv.
+
+    Args:
+        dump: TextIO - opened csv file.
+
+    Yields:
+        tuple[str, str]: country code (empty for csv) and country name.
+    """
+    for row in csv.reader(dump):
+        for name in row:
+            if name.strip():
+                yield '', name.strip()
+
+
+def read_countries_geonames(dump: TextIO) -> Iterator[tuple[str, str]]:
+    """Read countries from GeoNames countryInfo dump.
+
+    Args:
+        dump: TextIO - opened countryInfo.txt file.
+
+    Yields:
+        tuple[str, str]: ISO country code and country name.
+    """
+    yield from (
+        (row[GEONAMES_COUNTRY_CODE], row[GEONAMES_COUNTRY_NAME])
+        for row in _iter_geonames_rows(dump)
+    )
+
+
+def read_cities_csv(dump: TextIO) -> Iterator[tuple[str, str, str, str]]:
+    """Read cities from csv with header.
+
+    Args:
+        dump: TextIO - opened csv file.
+
+    Yields:
+        tuple[str, str, str, str]: city name, country name, longitude and latitude.
+    """
+    fields = ('name', 'country', 'longitude', 'latitude')
+    yield from (
+        tuple(row[field] for field in fields)
+        for row in csv.DictReader(dump)
+    )
+
+
+def read_cities_geonames(
+    dump: TextIO,
+    country_names: dict[str, str],
+) -> Iterator[tuple[str, str, str, str]]:
+    """Read cities from GeoNames dump.
+
+    Cities of countries missing in `country_names` are skipped.
+
+    Args:
+        dump: TextIO - opened GeoNames cities file.
+        country_names: dict[str, str] - country names by ISO codes.
+
+    Yields:
+        tuple[str, str, str, str]: city name, country name, longitude and latitude.
+    """
+    for row in _iter_geonames_rows(dump):
+        country_name = country_names.get(row[GEONAMES_CITY_COUNTRY])
+        if country_name:
+            yield (
+                row[GEONAMES_CITY_NAME],
+                country_name,
+                row[GEONAMES_CITY_LONGITUDE],
+                row[GEONAMES_CITY_LATITUDE],
+            )
@@ -0,0 +1,371 @@
+"""Module with deterministic synthetic dataset loaded with COPY."""
+
+from itertools import accumulate, repeat
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator
+
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.contrib.auth.models import User
+from django.core.management.color import no_style
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+from django.db.models import Max
+
+from .. import models
+from . import synthetic_rows as rows
+from .copy_utils import DEFAULT_REPORT_EVERY, ProgressReporter, copy_models
+
+COUNTRIES_COUNT = 50
+CITIES_PER_COUNTRY = 20
+STOPS_PER_CITY = 5
+MAX_STOPS = 4
+TOURS_PER_AGENCY = 20
+REVIEWERS_PER_TOUR = 0.5
+MIN_REVIEWERS = 100
+DEFAULT_REVIEWS_PER_TOUR = 5
+AGENCY_SIZE_EXPONENT = 0.8
+# J-shaped ratings distribution of real reviews, from five to one star.
+RATING_WEIGHTS = (45, 25, 12, 8, 10)
+MIN_PRICE = 100
+MAX_PRICE = 300000
+MIN_PHONE = 10 ** 9
+MAX_PHONE = 10 ** 10
+STREETS = ('Main St', 'Harbor Rd', 'Market Sq', 'Park Ave', 'River Ln', 'Hill St')
+REVIEW_TEXTS = MappingProxyType({
+    5: 'Great tour, would go again.',
+    4: 'Good guide and nice places.',
+    3: 'It was fine.',
+    2: 'Too long transfers.',
+    1: 'Not worth the price.',
+})
+TRAVELER_PREFIX = 'traveler'
+AGENCY_PREFIX = 'agency'
+COUNTRY_SYLLABLES = 4
+
+
+def make_cities(generator: rows.SyntheticRandom, country: rows.CountryRow) -> list[rows.CityRow]:
+    """Make cities of country around its center.
+
+    Args:
+        generator: SyntheticRandom - random generator.
+        country: CountryRow - country row.
+
+    Returns:
+        list[CityRow]: cities rows.
+    """
+    center = generator.make_point()
+    cities = []
+    for index in range(CITIES_PER_COUNTRY):
+        city_name = generator.make_name()
+        cities.append(rows.CityRow(
+            generator.make_id(),
+            f'{city_name} {index}',
+            country.id,
+            generator.make_point(center),
+        ))
+    return cities
+
+
+def make_stops(generator: rows.SyntheticRandom, city: rows.CityRow) -> list[rows.AddressRow]:
+    """Make addresses of tours stops in city.
+
+    Args:
+        generator: SyntheticRandom - random generator.
+        city: CityRow - city row.
+
+    Returns:
+        list[AddressRow]: addresses rows.
+    """
+    return [
+        rows.AddressRow(
+            generator.make_id(),
+            city.id,
+            generator.choice(STREETS),
+            str(house_number),
+            generator.make_point(city.point),
+        )
+        for house_number in range(1, STOPS_PER_CITY + 1)
+    ]
+
+
+def make_tour(
+    generator: rows.SyntheticRandom,
+    agency: rows.AgencyRow,
+    number: int,
+    country_stops: list,
+    ratings: list[int],
+) -> rows.TourRow:
+    """Make tour of agency with stops in agency country.
+
+    Args:
+        generator: SyntheticRandom - random generator.
+        agency: AgencyRow - agency row.
+        number: int - tour number, keeps tours unique.
+        country_stops: list - stops addresses ids of agency country.
+        ratings: list[int] - ratings of tour reviews.
+
+    Returns:
+        TourRow: tour row, its ratings counters match ratings.
+    """
+    tour_name = generator.make_name()
+    stops_count = generator.randint(1, MAX_STOPS)
+    return rows.TourRow(
+        id=generator.make_id(),
+        name=f'{tour_name} tour',
+        description=f'Route {number} by {agency.name}.',
+        agency_id=agency.id,
+        starting_city_id=agency.city.id,
+        price=generator.randint(MIN_PRICE, MAX_PRICE),
+        ratings=ratings,
+        stops=generator.sample(country_stops, stops_count),
+        **{
+            field_name: ratings.count(rating)
+            for rating, field_name in models.RATING_COUNT_FIELDS.items()
+        },
+    )
+
+
+def iter_stops(
+    generator: rows.SyntheticRandom,
+    tours: list[rows.TourRow],
+) -> Iterator[rows.LinkRow]:
+    """Iterate links of tours and their stops.
+
+    Args:
+        generator: SyntheticRandom - random generator.
+        tours: list[TourRow] - tours rows.
+
+    Yields:
+        LinkRow: tour address row.
+    """
+    for tour in tours:
+        yield from (
+            rows.LinkRow(generator.make_id(), tour.id, address_id) for address_id in tour.stops
+        )
+
+
+def iter_reviews(
+    generator: rows.SyntheticRandom,
+    tours: list[rows.TourRow],
+    reviewers: list,
+) -> Iterator[rows.ReviewRow]:
+    """Iterate reviews with ratings counted in tours counters.
+
+    Args:
+        generator: SyntheticRandom - random generator.
+        tours: list[TourRow] - tours rows.
+        reviewers: list - reviewers accounts ids.
+
+    Yields:
+        ReviewRow: review row.
+    """
+    for tour in tours:
+        tour_reviewers = generator.sample(reviewers, len(tour.ratings))
+        yield from (
+            rows.ReviewRow(
+                generator.make_id(),
+                tour.id,
+                account_id,
+                rating,
+                REVIEW_TEXTS[rating],
+                generator.make_datetime(),
+            )
+            for account_id, rating in zip(tour_reviewers, tour.ratings)
+        )
+
+
+class SyntheticData:
+    """Countries, cities, addresses, agencies, accounts, tours, stops and reviews."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        reviews_per_tour: float = DEFAULT_REVIEWS_PER_TOUR,
+        report: Callable[[int, float], None] | None = None,
+        report_every: int = DEFAULT_REPORT_EVERY,
+    ) -> None:
+        """Init generator.
+
+        Args:
+            seed: int, optional - random seed, the same seed gives the same rows. Defaults to 0.
+            reviews_per_tour: float, optional - mean reviews count of tour. Defaults to 5.
+            report: Callable[[int, float], None] | None, optional - progress callback.
+            report_every: int, optional - report every this rows count. Defaults to 100000.
+        """
+        self.random = rows.SyntheticRandom(seed)
+        self.reviews_per_tour = reviews_per_tour
+        self.progress = ProgressReporter(
+            report or (lambda count, elapsed: None),
+            report_every,
+        )
+        self.stops = {}
+        self.counts = {}
+
+    def copy(self, cursor: CursorWrapper, model: type, model_rows: Iterable) -> None:
+        """Copy rows of model and count them.
+
+        Args:
+            cursor: CursorWrapper - database cursor.
+            model: type - model of table.
+            model_rows: Iterable - rows of model.
+        """
+        copied_before = self.progress.count
+        copy_models(cursor, model, self.progress.track(model_rows))
+        model_name = model._meta.model_name  # noqa: WPS437
+        copied_count = self.progress.count - copied_before
+        self.counts[model_name] = self.counts.get(model_name, 0) + copied_count
+
+    def create(self, tours_count: int) -> dict[str, int]:
+        """Create dataset in current transaction.
+
+        Args:
+            tours_count: int - count of tours.
+
+        Returns:
+            dict[str, int]: copied rows count by model name.
+        """
+        with connection.cursor() as cursor:
+            cities = self.create_geography(cursor)
+            agencies_count = max(tours_count // TOURS_PER_AGENCY, 1)
+            agencies = self.create_agencies(cursor, cities, agencies_count)
+            reviewers_count = max(int(tours_count * REVIEWERS_PER_TOUR), MIN_REVIEWERS)
+            reviewers = self.create_accounts(
+                cursor, TRAVELER_PREFIX, list(repeat(None, reviewers_count)),
+            )
+            self.create_tours(cursor, agencies, reviewers, tours_count)
+            for statement in connection.ops.sequence_reset_sql(no_style(), [User]):
+                cursor.execute(statement)
+        return self.counts
+
+    def create_geography(self, cursor: CursorWrapper) -> list[rows.CityRow]:
+        """Create countries, cities and tours stops addresses.
+
+        Args:
+            cursor: CursorWrapper - database cursor.
+
+        Returns:
+            list[CityRow]: cities rows.
+        """
+        names = set()
+        while len(names) < COUNTRIES_COUNT:
+            names.add(self.random.make_name(max_syllables=COUNTRY_SYLLABLES))
+        countries = [
+            rows.CountryRow(self.random.make_id(), name) for name in sorted(names)
+        ]
+        cities = []
+        for country in countries:
+            cities.extend(make_cities(self.random, country))
+        stops = []
+        for city in cities:
+            city_stops = make_stops(self.random, city)
+            country_stops = self.stops.setdefault(city.country_id, [])
+            country_stops.extend(stop.id for stop in city_stops)
+            stops.extend(city_stops)
+        self.copy(cursor, models.Country, countries)
+        self.copy(cursor, models.City, cities)
+        self.copy(cursor, models.Address, stops)
+        return cities
+
+    def create_accounts(self, cursor: CursorWrapper, prefix: str, agencies_ids: list) -> list:
+        """Create users with accounts.
+
+        Args:
+            cursor: CursorWrapper - database cursor.
+            prefix: str - usernames prefix.
+            agencies_ids: list - agency id or None of every account.
+
+        Returns:
+            list: accounts ids.
+        """
+        last_id = User.objects.aggregate(last_id=Max('id'))['last_id']
+        first_id = (last_id or 0) + 1
+        users = []
+        for user_id in range(first_id, first_id + len(agencies_ids)):
+            username = f'{prefix}{user_id}'
+            users.append(rows.UserRow(
+                user_id,
+                username,
+                UNUSABLE_PASSWORD_PREFIX,
+                self.random.make_name(),
+                self.random.make_name(max_syllables=COUNTRY_SYLLABLES),
+                f'{username}@example.com',
+                self.random.make_datetime(),
+            ))
+        accounts = [
+            rows.AccountRow(self.random.make_id(), user.id, agency_id)
+            for user, agency_id in zip(users, agencies_ids)
+        ]
+        self.copy(cursor, User, users)
+        self.copy(cursor, models.Account, accounts)
+        return [account.id for account in accounts]
+
+    def create_agencies(
+        self,
+        cursor: CursorWrapper,
+        cities: list[rows.CityRow],
+        agencies_count: int,
+    ) -> list[rows.AgencyRow]:
+        """Create agencies with own addresses and accounts.
+
+        Args:
+            cursor: CursorWrapper - database cursor.
+            cities: list[CityRow] - cities rows.
+            agencies_count: int - count of agencies.
+
+        Returns:
+            list[AgencyRow]: agencies rows.
+        """
+        addresses, agencies = [], []
+        for number in range(1, agencies_count + 1):
+            city = self.random.choice(cities)
+            address = rows.AddressRow(
+                self.random.make_id(),
+                city.id,
+                self.random.choice(STREETS),
+                str(number),
+                self.random.make_point(city.point),
+                flat_number=number,
+            )
+            phone_number = self.random.randrange(MIN_PHONE, MAX_PHONE)
+            agency_name = self.random.make_name()
+            agencies.append(rows.AgencyRow(
+                self.random.make_id(),
+                f'{agency_name} Travel {number}',
+                f'+79{phone_number}',
+                address.id,
+                city,
+            ))
+            addresses.append(address)
+        self.copy(cursor, models.Address, addresses)
+        self.copy(cursor, models.Agency, agencies)
+        self.create_accounts(cursor, AGENCY_PREFIX, [agency.id for agency in agencies])
+        return agencies
+
+    def create_tours(
+        self,
+        cursor: CursorWrapper,
+        agencies: list[rows.AgencyRow],
+        reviewers: list,
+        tours_count: int,
+    ) -> None:
+        """Create tours with stops and reviews, agencies sizes and tours popularity are skewed.
+
+        Args:
+            cursor: CursorWrapper - database cursor.
+            agencies: list[AgencyRow] - agencies rows.
+            reviewers: list - reviewers accounts ids.
+            tours_count: int - count of tours.
+        """
+        agencies_weights = list(accumulate(
+            1 / (rank ** AGENCY_SIZE_EXPONENT) for rank in range(1, len(agencies) + 1)
+        ))
+        tours = []
+        for number in range(1, tours_count + 1):
+            agency = self.random.pick(agencies, agencies_weights)
+            reviews_count = self.random.make_reviews_count(self.reviews_per_tour, len(reviewers))
+            ratings = self.random.choices(models.RATING_VALUES, RATING_WEIGHTS, k=reviews_count)
+            country_stops = self.stops[agency.city.country_id]
+            tours.append(make_tour(self.random, agency, number, country_stops, ratings))
+        self.copy(cursor, models.Tour, tours)
+        self.copy(cursor, models.TourAddress, iter_stops(self.random, tours))
+        self.copy(cursor, models.Review, iter_reviews(self.random, tours, reviewers))
@@ -0,0 +1,188 @@
+"""Module with rows and random values of synthetic dataset."""
+
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from django.contrib.gis.geos import Point
+
+from ..models import srid
+
+UUID_BITS = 128
+MAX_LONGITUDE = 170
+MAX_LATITUDE = 70
+CITY_SPREAD = 5
+REVIEWS_PERIOD_DAYS = 1095
+REVIEWS_PERIOD = timedelta(days=REVIEWS_PERIOD_DAYS)
+SEED_EPOCH = datetime.fromisoformat('2024-01-01T00:00:00+00:00')
+POPULARITY_ALPHA = 1.5
+SYLLABLES = tuple('ka lo mi ra ve to sa ni por del an ri su mar tel bo gra zen lu ta'.split())
+
+
+class UserRow(NamedTuple):
+    """Row of user."""
+
+    id: int
+    username: str
+    password: str
+    first_name: str
+    last_name: str
+    email: str
+    date_joined: datetime
+
+
+class AccountRow(NamedTuple):
+    """Row of account."""
+
+    id: uuid.UUID
+    account_id: int
+    agency_id: uuid.UUID | None
+
+
+class CountryRow(NamedTuple):
+    """Row of country."""
+
+    id: uuid.UUID
+    name: str
+
+
+class CityRow(NamedTuple):
+    """Row of city."""
+
+    id: uuid.UUID
+    name: str
+    country_id: uuid.UUID
+    point: Point
+
+
+class AddressRow(NamedTuple):
+    """Row of address."""
+
+    id: uuid.UUID
+    city_id: uuid.UUID
+    street: str
+    house_number: str
+    point: Point
+    flat_number: int | None = None
+
+
+class AgencyRow(NamedTuple):
+    """Row of agency with city and country of its address."""
+
+    id: uuid.UUID
+    name: str
+    phone_number: str
+    address_id: uuid.UUID
+    city: CityRow
+
+
+class TourRow(NamedTuple):
+    """Row of tour with ratings of its reviews and its stops."""
+
+    id: uuid.UUID
+    name: str
+    description: str
+    agency_id: uuid.UUID
+    starting_city_id: uuid.UUID
+    price: int
+    one_star_count: int
+    two_stars_count: int
+    three_stars_count: int
+    four_stars_count: int
+    five_stars_count: int
+    ratings: list[int]
+    stops: list[uuid.UUID]
+
+
+class LinkRow(NamedTuple):
+    """Row of tour and address link."""
+
+    id: uuid.UUID
+    tour_id: uuid.UUID
+    address_id: uuid.UUID
+
+
+class ReviewRow(NamedTuple):
+    """Row of review."""
+
+    id: uuid.UUID
+    tour_id: uuid.UUID
+    account_id: uuid.UUID
+    rating: int
+    text: str
+    created: datetime
+
+
+class SyntheticRandom(random.Random):
+    """Random generator of synthetic values, the same seed gives the same values."""
+
+    def make_id(self) -> uuid.UUID:
+        """Make UUID.
+
+        Returns:
+            UUID: random UUID of version 4.
+        """
+        return uuid.UUID(int=self.getrandbits(UUID_BITS), version=4)
+
+    def make_name(self, max_syllables: int = 3) -> str:
+        """Make pronounceable name.
+
+        Args:
+            max_syllables: int, optional - max syllables count. Defaults to 3.
+
+        Returns:
+            str: capitalized name.
+        """
+        syllables = self.choices(SYLLABLES, k=self.randint(2, max_syllables))
+        return ''.join(syllables).capitalize()
+
+    def make_point(self, center: Point | None = None) -> Point:
+        """Make geopoint anywhere or near center.
+
+        Args:
+            center: Point | None, optional - center of area. Defaults to None.
+
+        Returns:
+            Point: point with longitude and latitude.
+        """
+        if center is None:
+            longitude = self.uniform(-MAX_LONGITUDE, MAX_LONGITUDE)
+            latitude = self.uniform(-MAX_LATITUDE, MAX_LATITUDE)
+        else:
+            longitude = center.x + self.uniform(-CITY_SPREAD, CITY_SPREAD)
+            latitude = center.y + self.uniform(-CITY_SPREAD, CITY_SPREAD)
+        return Point(longitude, latitude, srid=srid)
+
+    def make_datetime(self) -> datetime:
+        """Make datetime in reviews period before seed epoch.
+
+        Returns:
+            datetime: datetime with timezone.
+        """
+        return SEED_EPOCH - REVIEWS_PERIOD * self.random()
+
+    def make_reviews_count(self, mean: float, limit: int) -> int:
+        """Make Pareto distributed reviews count, few tours are popular and most are not.
+
+        Args:
+            mean: float - mean reviews count.
+            limit: int - max reviews count.
+
+        Returns:
+            int: reviews count.
+        """
+        scale = mean * (POPULARITY_ALPHA - 1) / POPULARITY_ALPHA
+        return min(int(scale * self.paretovariate(POPULARITY_ALPHA)), limit)
+
+    def pick(self, population: list, cumulative_weights: list[float]) -> Any:
+        """Pick one element with precomputed cumulative weights.
+
+        Args:
+            population: list - elements for pick.
+            cumulative_weights: list[float] - cumulative weights of elements.
+
+        Returns:
+            Any: picked element.
+        """
+        return self.choices(population, cum_weights=cumulative_weights)[0]
@@ -0,0 +1,168 @@
+"""Module with Prometheus metrics of requests, database, connections, caches and outbox.
+
+Under gunicorn set PROMETHEUS_MULTIPROC_DIR to an empty directory shared by workers,
+every worker writes its samples there and /metrics aggregates them. The directory
+must be emptied before server start.
+"""
+
+from os import getenv
+from typing import Iterator
+
+from django.apps import apps
+from prometheus_client import (REGISTRY, CollectorRegistry, Counter, Gauge,
+                               Histogram, multiprocess)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from .timings import MILLISECONDS
+
+UNRESOLVED_VIEW = 'unresolved'
+VIEW_LABEL = 'view'
+DATABASE_LABEL = 'database'
+QUERIES_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+REQUEST_LATENCY = Histogram(
+    'tours_request_duration_seconds',
+    'Request latency by url view name.',
+    [VIEW_LABEL, 'method', 'status'],
+)
+DB_QUERIES = Histogram(
+    'tours_request_db_queries',
+    'Database queries count of request.',
+    [VIEW_LABEL],
+    buckets=QUERIES_BUCKETS,
+)
+DB_DURATION = Histogram(
+    'tours_request_db_duration_seconds',
+    'Database queries duration of request.',
+    [VIEW_LABEL],
+)
+TEMPLATE_RENDERS = Counter(
+    'tours_template_renders',
+    'Template renders by url view name.',
+    [VIEW_LABEL],
+)
+DB_READ_ROUTES = Counter(
+    'tours_db_read_routes',
+    'Safe requests by database serving their reads, default or replica.',
+    [DATABASE_LABEL],
+)
+DB_CONNECTIONS_OPEN = Gauge(
+    'tours_db_connections_open',
+    'Database connections kept open between requests, pool size of all workers.',
+    [DATABASE_LABEL],
+    multiprocess_mode='livesum',
+)
+DB_CONNECT_DURATION = Histogram(
+    'tours_db_connect_duration_seconds',
+    'Duration of opening database connection, request waits it unless connection is reused.',
+    [DATABASE_LABEL],
+)
+DB_CHECKOUTS = Counter(
+    'tours_db_connection_checkouts',
+    'First database use of request or command by connection state, reused or opened.',
+    [DATABASE_LABEL, 'result'],
+)
+CACHE_LOOKUPS = Counter(
+    'tours_cache_lookups',
+    'Cache lookups by cache and result, hit ratio is hit / all lookups.',
+    ['cache', 'result'],
+)
+
+
+class OutboxCollector(Collector):
+    """Collector of email outbox depth, read from database on scrape."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        """Collect outbox depth.
+
+        Yields:
+            GaugeMetricFamily: count of emails waiting for delivery.
+        """
+        # Model is looked up on scrape, database backend imports metrics before apps are ready.
+        yield GaugeMetricFamily(
+            'tours_email_outbox_depth',
+            'Emails waiting in outbox for delivery.',
+            value=apps.get_model('manager', 'OutgoingEmail').objects.filter(sent=None).count(),
+        )
+
+
+def count_cache_lookup(cache_name: str, hit: bool) -> None:
+    """Count cache hit or miss.
+
+    Args:
+        cache_name: str - cache name, e.g. storage_urls.
+        hit: bool - True if value was found in cache.
+    """
+    CACHE_LOOKUPS.labels(cache_name, 'hit' if hit else 'miss').inc()
+
+
+def count_read_route(alias: str) -> None:
+    """Count safe request served by database.
+
+    Args:
+        alias: str - database alias.
+    """
+    DB_READ_ROUTES.labels(alias).inc()
+
+
+def observe_connect(alias: str, duration: float) -> None:
+    """Observe opened database connection.
+
+    Args:
+        alias: str - database alias.
+        duration: float - connect duration in seconds.
+    """
+    DB_CONNECTIONS_OPEN.labels(alias).inc()
+    DB_CONNECT_DURATION.labels(alias).observe(duration)
+
+
+def observe_close(alias: str) -> None:
+    """Observe closed database connection.
+
+    Args:
+        alias: str - database alias.
+    """
+    DB_CONNECTIONS_OPEN.labels(alias).dec()
+
+
+def count_checkout(alias: str, reused: bool) -> None:
+    """Count first database use of request.
+
+    Args:
+        alias: str - database alias.
+        reused: bool - True if connection was kept open from previous request.
+    """
+    DB_CHECKOUTS.labels(alias, 'reused' if reused else 'opened').inc()
+
+
+def observe_request(view_name: str | None, method: str, status: int, phases: dict) -> None:
+    """Observe request latency, queries and template renders.
+
+    Args:
+        view_name: str | None - url view name, None if url was not resolved.
+        method: str - request method.
+        status: int - response status code.
+        phases: dict - request timings summary.
+    """
+    view_name = view_name or UNRESOLVED_VIEW
+    latency = REQUEST_LATENCY.labels(view_name, method, status)
+    latency.observe(phases['total_ms'] / MILLISECONDS)
+    DB_QUERIES.labels(view_name).observe(phases.get('db_count', 0))
+    DB_DURATION.labels(view_name).observe(phases.get('db_ms', 0) / MILLISECONDS)
+    TEMPLATE_RENDERS.labels(view_name).inc(phases.get('tpl_count', 0))
+
+
+def get_registry() -> CollectorRegistry:
+    """Get registry for scrape, aggregated over workers in multiprocess mode.
+
+    Returns:
+        CollectorRegistry: registry with all metrics and outbox depth.
+    """
+    registry = CollectorRegistry()
+    if getenv('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(REGISTRY)
+    registry.register(OutboxCollector())
+    return registry
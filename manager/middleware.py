@@ -0,0 +1,292 @@
+"""Module with project middleware."""
+
+import json
+import logging
+from os import getenv
+from typing import Awaitable, Callable
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest, HttpResponse
+from dotenv import load_dotenv
+
+from . import db_router, metrics, query_budget
+from .timings import RequestTimings, current_timings, observe_queries
+
+load_dotenv()
+SAFE_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+PRIMARY_COOKIE = 'db_primary'
+DEFAULT_READ_YOUR_WRITES_SECONDS = 10
+ERROR_STATUS = 400
+logger = logging.getLogger(__name__)
+timings_logger = logging.getLogger('manager.timings')
+
+
+def get_view_name(request: HttpRequest) -> str | None:
+    """Get url view name of resolved request.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        str | None: view name, None if url was not resolved.
+    """
+    resolver_match = getattr(request, 'resolver_match', None)
+    return resolver_match.view_name if resolver_match else None
+
+
+class HybridMiddleware:
+    """Base of middleware which runs in sync and async chains without thread switch.
+
+    Subclass handles sync requests in __call__ and async ones in __acall__.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Init middleware.
+
+        Args:
+            get_response: Callable[[HttpRequest], HttpResponse] - next handler.
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+
+class ServerTimingMiddleware(HybridMiddleware):
+    """Add Server-Timing header, log structured line and observe metrics of request phases.
+
+    Phases are total, db queries, template renders, cache and storage operations.
+    """
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        """Measure request phases.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            HttpResponse | Awaitable[HttpResponse]: response with Server-Timing header.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        with observe_queries(timings.measure_query):
+            response = self.get_response(request)
+        current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Measure phases of async request.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            HttpResponse: response with Server-Timing header.
+        """
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        with observe_queries(timings.measure_query):
+            response = await self.get_response(request)
+        current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    def finish(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        timings: RequestTimings,
+    ) -> HttpResponse:
+        """Add header, log line and metrics of measured request.
+
+        Args:
+            request: HttpRequest - request from user.
+            response: HttpResponse - response from server.
+            timings: RequestTimings - request phases.
+
+        Returns:
+            HttpResponse: response with Server-Timing header.
+        """
+        response['Server-Timing'] = timings.header()
+        view_name = get_view_name(request)
+        phases = timings.summary()
+        timings_logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'view': view_name,
+            'status': response.status_code,
+            **phases,
+        }))
+        metrics.observe_request(view_name, request.method, response.status_code, phases)
+        return response
+
+
+class QueryBudgetMiddleware(HybridMiddleware):
+    """Check queries count of every view against its budget in DEBUG.
+
+    Exceeded budget is logged, or raised if QUERY_BUDGET_RAISE is True.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Init middleware.
+
+        Args:
+            get_response: Callable[[HttpRequest], HttpResponse] - next handler.
+
+        Raises:
+            MiddlewareNotUsed: if DEBUG is off.
+        """
+        if not settings.DEBUG:
+            raise MiddlewareNotUsed()
+        super().__init__(get_response)
+        self.raise_exceeded = getenv('QUERY_BUDGET_RAISE') == 'True'
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        """Count queries of request and check them.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            HttpResponse | Awaitable[HttpResponse]: response from server.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        counter = query_budget.QueryCounter()
+        with observe_queries(counter):
+            response = self.get_response(request)
+        return self.check(request, response, counter)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Count queries of async request and check them.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            HttpResponse: response from server.
+        """
+        counter = query_budget.QueryCounter()
+        with observe_queries(counter):
+            response = await self.get_response(request)
+        return self.check(request, response, counter)
+
+    def check(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        counter: query_budget.QueryCounter,
+    ) -> HttpResponse:
+        """Check queries count of request against budget of its view.
+
+        Args:
+            request: HttpRequest - request from user.
+            response: HttpResponse - response from server.
+            counter: query_budget.QueryCounter - queries of request.
+
+        Raises:
+            query_budget.QueryBudgetExceeded: if budget is exceeded and QUERY_BUDGET_RAISE is True.
+
+        Returns:
+            HttpResponse: response from server.
+        """
+        try:
+            query_budget.check_query_budget(get_view_name(request), counter.count)
+        except query_budget.QueryBudgetExceeded as error:
+            if self.raise_exceeded:
+                raise
+            logger.warning(f'{request.path}: {error}')
+        return response
+
+
+class ReplicaRoutingMiddleware(HybridMiddleware):
+    """Serve reads of safe requests from replica while it is fresh.
+
+    Unsafe requests read and write default database. After successful one the client
+    reads default database for READ_YOUR_WRITES_SECONDS, so it sees its own changes.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Init middleware.
+
+        Args:
+            get_response: Callable[[HttpRequest], HttpResponse] - next handler.
+
+        Raises:
+            MiddlewareNotUsed: if replica is not configured.
+        """
+        self.replica = db_router.get_replica_alias()
+        if self.replica is None:
+            raise MiddlewareNotUsed()
+        super().__init__(get_response)
+        self.pin_seconds = int(
+            getenv('READ_YOUR_WRITES_SECONDS', DEFAULT_READ_YOUR_WRITES_SECONDS),
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        """Route reads of request.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            HttpResponse | Awaitable[HttpResponse]: response from server.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if request.method not in SAFE_METHODS:
+            return self.pin_primary(self.get_response(request))
+        with db_router.read_from(self.choose_database(request)):
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Route reads of async request, replica lag is checked in thread.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            HttpResponse: response from server.
+        """
+        if request.method not in SAFE_METHODS:
+            return self.pin_primary(await self.get_response(request))
+        alias = await sync_to_async(self.choose_database)(request)
+        with db_router.read_from(alias):
+            return await self.get_response(request)
+
+    def choose_database(self, request: HttpRequest) -> str:
+        """Choose database for reads of safe request.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            str: replica alias if client did not write recently and replica is fresh.
+        """
+        alias = DEFAULT_DB_ALIAS
+        if PRIMARY_COOKIE not in request.COOKIES and db_router.is_replica_fresh(self.replica):
+            alias = self.replica
+        metrics.count_read_route(alias)
+        return alias
+
+    def pin_primary(self, response: HttpResponse) -> HttpResponse:
+        """Pin client to default database after successful unsafe request.
+
+        Args:
+            response: HttpResponse - response to unsafe request.
+
+        Returns:
+            HttpResponse: response with cookie.
+        """
+        if response.status_code < ERROR_STATUS:
+            response.set_cookie(
+                PRIMARY_COOKIE, '1', max_age=self.pin_seconds, httponly=True, samesite='Lax',
+            )
+        return response
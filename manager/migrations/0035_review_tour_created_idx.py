@@ -0,0 +1,19 @@
+# Generated by Django 4.2.4 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0034_alter_agencyrequests_account_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["tour", "-created"], name="review_tour_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.4 on 2026-10-19 11:05
+
+from django.db import migrations, models
+
+RATING_COUNT_FIELDS = {
+    5: "five_stars_count",
+    4: "four_stars_count",
+    3: "three_stars_count",
+    2: "two_stars_count",
+    1: "one_star_count",
+}
+
+
+def fill_ratings_counts(apps, schema_editor):
+    Review = apps.get_model("manager", "Review")
+    Tour = apps.get_model("manager", "Tour")
+    grouped_reviews = (
+        Review.objects.filter(rating__in=RATING_COUNT_FIELDS.keys())
+        .values("tour", "rating")
+        .annotate(reviews_count=models.Count("id"))
+    )
+    for group in grouped_reviews:
+        Tour.objects.filter(id=group["tour"]).update(
+            **{RATING_COUNT_FIELDS[group["rating"]]: group["reviews_count"]}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0035_review_tour_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tour",
+            name="five_stars_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="five stars reviews count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tour",
+            name="four_stars_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="four stars reviews count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tour",
+            name="one_star_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="one star reviews count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tour",
+            name="three_stars_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="three stars reviews count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tour",
+            name="two_stars_count",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="two stars reviews count"
+            ),
+        ),
+        migrations.RunPython(fill_ratings_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 4.2.4 on 2026-10-19 12:20
+
+import uuid
+
+from django.db import migrations, models
+
+import manager.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0036_tour_ratings_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutgoingEmail",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("subject", models.CharField(max_length=255, verbose_name="subject")),
+                ("plain_message", models.TextField(verbose_name="plain message")),
+                (
+                    "html_message",
+                    models.TextField(blank=True, null=True, verbose_name="html message"),
+                ),
+                ("recipients", models.JSONField(verbose_name="recipients")),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="delivery attempts"
+                    ),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        default=manager.validators.get_datetime,
+                        verbose_name="next delivery attempt date and time",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, null=True, verbose_name="last delivery error"
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        default=manager.validators.get_datetime,
+                        verbose_name="creation date and time",
+                    ),
+                ),
+                (
+                    "sent",
+                    models.DateTimeField(
+                        blank=True,
+                        default=None,
+                        null=True,
+                        verbose_name="delivery date and time",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "outgoing email",
+                "verbose_name_plural": "outgoing emails",
+                "db_table": '"tours_data"."outgoing_email"',
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("sent__isnull", True)),
+                        fields=["next_attempt"],
+                        name="email_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0037_outgoingemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="account",
+            name="avatar_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="avatar renditions",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tour",
+            name="avatar_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="avatar renditions",
+            ),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:41
+
+import uuid
+
+from django.db import migrations, models
+
+import manager.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0038_avatar_renditions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImageJob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "target_model",
+                    models.CharField(max_length=16, verbose_name="target model"),
+                ),
+                ("target_id", models.UUIDField(verbose_name="target id")),
+                (
+                    "image",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="image storage name"
+                    ),
+                ),
+                (
+                    "obsolete_files",
+                    models.JSONField(
+                        blank=True, default=list, verbose_name="obsolete files"
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="processing attempts"
+                    ),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        default=manager.validators.get_datetime,
+                        verbose_name="next processing attempt date and time",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, null=True, verbose_name="last processing error"
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        default=manager.validators.get_datetime,
+                        verbose_name="creation date and time",
+                    ),
+                ),
+                (
+                    "processed",
+                    models.DateTimeField(
+                        blank=True,
+                        default=None,
+                        null=True,
+                        verbose_name="processing date and time",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "image job",
+                "verbose_name_plural": "image jobs",
+                "db_table": '"tours_data"."image_job"',
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("processed__isnull", True)),
+                        fields=["next_attempt"],
+                        name="image_job_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
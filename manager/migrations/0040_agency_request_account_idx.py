@@ -0,0 +1,31 @@
+# Generated by Django 4.2.4 on 2026-10-19 18:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0039_imagejob"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="agencyrequests",
+            name="account",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="request",
+                to="manager.account",
+                verbose_name="account",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="agencyrequests",
+            index=models.Index(
+                fields=["account", "agency"], name="agency_request_account_idx"
+            ),
+        ),
+    ]
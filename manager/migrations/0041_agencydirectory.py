@@ -0,0 +1,144 @@
+# Generated by Django 4.2.4 on 2026-10-19 19:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import manager.validators
+
+RATING_COUNT_FIELDS = {
+    5: "five_stars_count",
+    4: "four_stars_count",
+    3: "three_stars_count",
+    2: "two_stars_count",
+    1: "one_star_count",
+}
+
+
+def fill_agency_directory(apps, schema_editor):
+    Agency = apps.get_model("manager", "Agency")
+    AgencyDirectory = apps.get_model("manager", "AgencyDirectory")
+    agencies = Agency.objects.select_related("address__city__country").annotate(
+        tours_count=models.Count("tour"),
+        listed_account_id=models.F("account"),
+        **{
+            field_name: models.Sum(f"tour__{field_name}", default=0)
+            for field_name in RATING_COUNT_FIELDS.values()
+        },
+    )
+    refreshed = manager.validators.get_datetime()
+    entries = []
+    for agency in agencies.order_by().iterator():
+        distribution = {
+            rating: getattr(agency, field_name)
+            for rating, field_name in RATING_COUNT_FIELDS.items()
+        }
+        reviews_count = sum(distribution.values())
+        ratings_sum = sum(rating * count for rating, count in distribution.items())
+        city = agency.address.city
+        entries.append(
+            AgencyDirectory(
+                agency_id=agency.id,
+                name=agency.name,
+                city_id=city.id,
+                city_name=city.name,
+                country_name=city.country.name,
+                rating=round(ratings_sum / reviews_count, 2) if reviews_count else 0,
+                reviews_count=reviews_count,
+                tours_count=agency.tours_count,
+                account_id=agency.listed_account_id,
+                has_account=agency.listed_account_id is not None,
+                refreshed=refreshed,
+            )
+        )
+    AgencyDirectory.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0040_agency_request_account_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AgencyDirectory",
+            fields=[
+                (
+                    "agency",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="directory",
+                        serialize=False,
+                        to="manager.agency",
+                        verbose_name="agency",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, verbose_name="name")),
+                ("city_name", models.CharField(max_length=255, verbose_name="city name")),
+                (
+                    "country_name",
+                    models.CharField(max_length=255, verbose_name="country name"),
+                ),
+                ("rating", models.FloatField(default=0, verbose_name="rating")),
+                (
+                    "reviews_count",
+                    models.PositiveIntegerField(default=0, verbose_name="reviews count"),
+                ),
+                (
+                    "tours_count",
+                    models.PositiveIntegerField(default=0, verbose_name="tours count"),
+                ),
+                (
+                    "has_account",
+                    models.BooleanField(default=False, verbose_name="has account"),
+                ),
+                (
+                    "refreshed",
+                    models.DateTimeField(
+                        default=manager.validators.get_datetime,
+                        verbose_name="refresh date and time",
+                    ),
+                ),
+                (
+                    "account",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="manager.account",
+                        verbose_name="agency account",
+                    ),
+                ),
+                (
+                    "city",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="manager.city",
+                        verbose_name="city",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "agency directory entry",
+                "verbose_name_plural": "agency directory",
+                "db_table": '"tours_data"."agency_directory"',
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("has_account", True)),
+                        fields=["name"],
+                        name="agency_directory_listed_idx",
+                    ),
+                    models.Index(
+                        condition=models.Q(("has_account", True)),
+                        fields=["city", "name"],
+                        name="agency_directory_city_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(fill_agency_directory, migrations.RunPython.noop),
+    ]
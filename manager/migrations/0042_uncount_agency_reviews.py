@@ -0,0 +1,39 @@
+# Generated by Django 4.2.4 on 2026-10-19 21:40
+
+from django.db import migrations, models
+
+RATING_COUNT_FIELDS = {
+    5: "five_stars_count",
+    4: "four_stars_count",
+    3: "three_stars_count",
+    2: "two_stars_count",
+    1: "one_star_count",
+}
+
+
+def uncount_agency_reviews(apps, schema_editor):
+    Review = apps.get_model("manager", "Review")
+    Tour = apps.get_model("manager", "Tour")
+    grouped_reviews = (
+        Review.objects.filter(
+            account__agency__isnull=False, rating__in=RATING_COUNT_FIELDS.keys()
+        )
+        .values("tour", "rating")
+        .annotate(reviews_count=models.Count("id"))
+    )
+    for group in grouped_reviews:
+        field_name = RATING_COUNT_FIELDS[group["rating"]]
+        Tour.objects.filter(id=group["tour"]).update(
+            **{field_name: models.F(field_name) - group["reviews_count"]}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0041_agencydirectory"),
+    ]
+
+    operations = [
+        migrations.RunPython(uncount_agency_reviews, migrations.RunPython.noop),
+    ]
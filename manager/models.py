@@ -1,5 +1,6 @@
 """Module with table models."""
 
+from types import MappingProxyType
 from uuid import uuid4
 
 from django.conf.global_settings import AUTH_USER_MODEL
@@ -17,6 +18,19 @@ COUNTRY_MAX_LEN = 255
 STREET_MAX_LEN = 255
 HOUSE_NUMBER_MAX_LEN = 8
 REVIEW_TEXT_MAX_LEN = 8192
+EMAIL_SUBJECT_MAX_LEN = 255
+IMAGE_JOB_TARGET_MAX_LEN = 16
+IMAGE_NAME_MAX_LEN = 255
+RATING_COUNT_FIELDS = MappingProxyType({
+    5: 'five_stars_count',
+    4: 'four_stars_count',
+    3: 'three_stars_count',
+    2: 'two_stars_count',
+    1: 'one_star_count',
+})
+RATING_VALUES = tuple(RATING_COUNT_FIELDS.keys())
+AVATAR_WIDTHS = (64, 128, 256)
+COVER_WIDTHS = (180, 360, 720)
 srid = 4326
 
 name_field = 'name'
@@ -25,6 +39,22 @@ country_field = 'country'
 city_field = 'city'
 
 
+def get_average_rating(distribution: dict[int, int]) -> float:
+    """Get average rating weighted by reviews counts.
+
+    Args:
+        distribution: dict[int, int] - reviews count by rating.
+
+    Returns:
+        float: average rating or 0 if there are no reviews.
+    """
+    ratings_count = sum(distribution.values())
+    if not ratings_count:
+        return 0
+    ratings_sum = sum(rating * count for rating, count in distribution.items())
+    return round(ratings_sum / ratings_count, 2)
+
+
 class UUIDMixin(models.Model):
     """Create id field with default UUID vaule."""
 
@@ -54,6 +84,125 @@ class NameMixin(models.Model):
         abstract = True
 
 
+class RatingDistributionMixin(models.Model):
+    """Create counters of reviews for every rating value."""
+
+    one_star_count = models.PositiveIntegerField(_('one star reviews count'), default=0)
+    two_stars_count = models.PositiveIntegerField(_('two stars reviews count'), default=0)
+    three_stars_count = models.PositiveIntegerField(_('three stars reviews count'), default=0)
+    four_stars_count = models.PositiveIntegerField(_('four stars reviews count'), default=0)
+    five_stars_count = models.PositiveIntegerField(_('five stars reviews count'), default=0)
+
+    @property
+    def ratings_distribution(self) -> dict[int, int]:
+        """Get reviews count for every rating value.
+
+        Returns:
+            dict[int, int]: reviews count by rating, from five to one star.
+        """
+        return {
+            rating: getattr(self, field_name) for rating, field_name in RATING_COUNT_FIELDS.items()
+        }
+
+    @property
+    def ratings_count(self) -> int:
+        """Get reviews count.
+
+        Returns:
+            int: reviews count.
+        """
+        return sum(self.ratings_distribution.values())
+
+    @property
+    def rating(self) -> float:
+        """Get average rating.
+
+        Returns:
+            float: average rating or 0 if there are no reviews.
+        """
+        return get_average_rating(self.ratings_distribution)
+
+    class Meta:
+        """Meta class with Mixin settings."""
+
+        abstract = True
+
+
+class AvatarRenditionsMixin(models.Model):
+    """Create field with names of WebP renditions of `avatar` image by widths."""
+
+    rendition_widths: tuple[int, ...] = ()
+
+    avatar_renditions = models.JSONField(
+        _('avatar renditions'),
+        default=dict,
+        blank=True,
+        editable=False,
+    )
+
+    @classmethod
+    def from_db(
+        cls,
+        db: str,
+        field_names: list[str],
+        field_values: list,
+    ) -> 'AvatarRenditionsMixin':
+        """Create instance from database row and remember saved avatar.
+
+        Args:
+            db: str - database alias.
+            field_names: list[str] - loaded fields names.
+            field_values: list - loaded fields values.
+
+        Returns:
+            AvatarRenditionsMixin: loaded instance.
+        """
+        instance = super().from_db(db, field_names, field_values)
+        instance.saved_avatar = instance.__dict__.get('avatar')
+        return instance
+
+    @property
+    def avatar_changed(self) -> bool:
+        """Check avatar was changed since load from database.
+
+        Returns:
+            bool: True if avatar was uploaded, replaced or cleared.
+        """
+        saved_avatar = getattr(self, 'saved_avatar', None) or ''
+        return saved_avatar != (self.avatar.name or '')
+
+    class Meta:
+        """Meta class with Mixin settings."""
+
+        abstract = True
+
+
+class DerivedFieldsMixin(models.Model):
+    """Keep fields maintained by queries out of default update of saved instance."""
+
+    derived_fields: tuple[str, ...] = ()
+
+    def save(self, *args, update_fields: list[str] | None = None, **kwargs) -> None:
+        """Save model, derived fields are updated only if listed in `update_fields`.
+
+        Args:
+            args: Any - arguments.
+            update_fields: list[str] | None, optional - fields for update. Defaults to None.
+            kwargs: Any - key word arguments.
+        """
+        if update_fields is None and not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.derived_fields
+            ]
+        super().save(*args, update_fields=update_fields, **kwargs)
+
+    class Meta:
+        """Meta class with Mixin settings."""
+
+        abstract = True
+
+
 class Country(UUIDMixin, models.Model):
     """Country table model."""
 
@@ -236,9 +385,19 @@ class Agency(UUIDMixin, NameMixin, models.Model):
         unique_together = ((name_field,),)
 
 
-class Tour(UUIDMixin, NameMixin, models.Model):
+class Tour(  # noqa: WPS215
+    UUIDMixin,
+    NameMixin,
+    DerivedFieldsMixin,
+    RatingDistributionMixin,
+    AvatarRenditionsMixin,
+    models.Model,
+):
     """Tour table model."""
 
+    rendition_widths = COVER_WIDTHS
+    derived_fields = (*RATING_COUNT_FIELDS.values(), 'avatar_renditions')
+
     avatar = models.ImageField(
         upload_to='covers/',
         null=True,
@@ -276,13 +435,27 @@ class Tour(UUIDMixin, NameMixin, models.Model):
         Returns:
             tuple[Review, Account]: user review and user account.
         """
-        if request.user.is_authenticated:
-            account = Account.objects.filter(account=request.user).first()
-        else:
-            account = None
-        user_review = self.reviews.filter(account=account, account__agency=None).first()
+        if not request.user.is_authenticated:
+            return None, None
+        account = Account.objects.filter(account=request.user).first()
+        if not account or account.agency_id:
+            return None, account
+        user_review = self.reviews.select_related('account__account', 'tour').filter(
+            account=account,
+        ).first()
         return user_review, account
 
+    def refresh_ratings_counts(self) -> None:
+        """Recount ratings counters from reviews, reviews of agencies accounts are not counted."""
+        ratings_counts = dict.fromkeys(RATING_COUNT_FIELDS.values(), 0)
+        grouped_reviews = self.reviews.filter(account__agency=None, rating__in=RATING_VALUES)
+        grouped_reviews = grouped_reviews.values('rating')
+        for group in grouped_reviews.annotate(reviews_count=models.Count('id')):
+            ratings_counts[RATING_COUNT_FIELDS[group['rating']]] = group['reviews_count']
+        Tour.objects.filter(id=self.id).update(**ratings_counts)
+        for field_name, ratings_count in ratings_counts.items():
+            setattr(self, field_name, ratings_count)
+
     def __str__(self) -> str:
         """Stringify class.
 
@@ -356,6 +529,22 @@ class Review(UUIDMixin, models.Model):
         blank=True,
     )
 
+    @classmethod
+    def from_db(cls, db: str, field_names: list[str], field_values: list) -> 'Review':
+        """Create instance from database row and remember saved rating.
+
+        Args:
+            db: str - database alias.
+            field_names: list[str] - loaded fields names.
+            field_values: list - loaded fields values.
+
+        Returns:
+            Review: loaded review.
+        """
+        review = super().from_db(db, field_names, field_values)
+        review.saved_rating = review.__dict__.get('rating')
+        return review
+
     def __str__(self) -> str:
         """Stringify class.
 
@@ -374,11 +563,22 @@ class Review(UUIDMixin, models.Model):
         verbose_name = _('review')
         verbose_name_plural = _('reviews')
         unique_together = (('tour', 'account'),)
+        indexes = [
+            models.Index(fields=['tour', '-created'], name='review_tour_created_idx'),
+        ]
 
 
-class Account(UUIDMixin, models.Model):
+class Account(  # noqa: WPS215
+    UUIDMixin,
+    DerivedFieldsMixin,
+    AvatarRenditionsMixin,
+    models.Model,
+):
     """Account table model."""
 
+    rendition_widths = AVATAR_WIDTHS
+    derived_fields = ('avatar_renditions',)
+
     account = models.OneToOneField(
         AUTH_USER_MODEL,
         unique=True,
@@ -409,6 +609,22 @@ class Account(UUIDMixin, models.Model):
         verbose_name = _('account')
         verbose_name_plural = _('accounts')
 
+    @classmethod
+    def from_db(cls, db: str, field_names: list[str], field_values: list) -> 'Account':
+        """Create instance from database row and remember saved agency.
+
+        Args:
+            db: str - database alias.
+            field_names: list[str] - loaded fields names.
+            field_values: list - loaded fields values.
+
+        Returns:
+            Account: loaded account.
+        """
+        account = super().from_db(db, field_names, field_values)
+        account.saved_agency_id = account.__dict__.get('agency_id')
+        return account
+
     def __str__(self) -> str:
         """Stringify class.
 
@@ -465,6 +681,7 @@ class AgencyRequests(UUIDMixin, models.Model):
         verbose_name=_('account'),
         on_delete=models.CASCADE,
         related_name='request',
+        db_index=False,
     )
     agency = models.ForeignKey(
         Agency,
@@ -472,3 +689,205 @@ class AgencyRequests(UUIDMixin, models.Model):
         on_delete=models.CASCADE,
         related_name='request',
     )
+
+    class Meta:
+        """Meta class with AgencyRequests settings."""
+
+        indexes = [
+            models.Index(fields=['account', 'agency'], name='agency_request_account_idx'),
+        ]
+
+
+class OutgoingEmail(UUIDMixin, models.Model):
+    """Email waiting in outbox for delivery by worker."""
+
+    subject = models.CharField(
+        _('subject'),
+        max_length=EMAIL_SUBJECT_MAX_LEN,
+    )
+    plain_message = models.TextField(_('plain message'))
+    html_message = models.TextField(
+        _('html message'),
+        null=True,
+        blank=True,
+    )
+    recipients = models.JSONField(_('recipients'))
+    attempts = models.PositiveSmallIntegerField(
+        _('delivery attempts'),
+        default=0,
+    )
+    next_attempt = models.DateTimeField(
+        _('next delivery attempt date and time'),
+        default=get_datetime,
+    )
+    last_error = models.TextField(
+        _('last delivery error'),
+        null=True,
+        blank=True,
+    )
+    created = models.DateTimeField(
+        _('creation date and time'),
+        default=get_datetime,
+    )
+    sent = models.DateTimeField(
+        _('delivery date and time'),
+        default=None,
+        null=True,
+        blank=True,
+    )
+
+    def __str__(self) -> str:
+        """Stringify class.
+
+        Returns:
+            str: stringified class. Subject (recipients).
+        """
+        recipients = ', '.join(self.recipients)
+        return f'{self.subject} ({recipients})'
+
+    class Meta:
+        """Meta class with OutgoingEmail settings."""
+
+        db_table = '"tours_data"."outgoing_email"'
+        verbose_name = _('outgoing email')
+        verbose_name_plural = _('outgoing emails')
+        indexes = [
+            models.Index(
+                fields=['next_attempt'],
+                name='email_pending_idx',
+                condition=models.Q(sent__isnull=True),
+            ),
+        ]
+
+
+class ImageJob(UUIDMixin, models.Model):
+    """Image processing job waiting for worker."""
+
+    target_model = models.CharField(
+        _('target model'),
+        max_length=IMAGE_JOB_TARGET_MAX_LEN,
+    )
+    target_id = models.UUIDField(_('target id'))
+    image = models.CharField(
+        _('image storage name'),
+        max_length=IMAGE_NAME_MAX_LEN,
+        blank=True,
+    )
+    obsolete_files = models.JSONField(
+        _('obsolete files'),
+        default=list,
+        blank=True,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        _('processing attempts'),
+        default=0,
+    )
+    next_attempt = models.DateTimeField(
+        _('next processing attempt date and time'),
+        default=get_datetime,
+    )
+    last_error = models.TextField(
+        _('last processing error'),
+        null=True,
+        blank=True,
+    )
+    created = models.DateTimeField(
+        _('creation date and time'),
+        default=get_datetime,
+    )
+    processed = models.DateTimeField(
+        _('processing date and time'),
+        default=None,
+        null=True,
+        blank=True,
+    )
+
+    def __str__(self) -> str:
+        """Stringify class.
+
+        Returns:
+            str: stringified class. Target model target id: image.
+        """
+        return f'{self.target_model} {self.target_id}: {self.image}'
+
+    class Meta:
+        """Meta class with ImageJob settings."""
+
+        db_table = '"tours_data"."image_job"'
+        verbose_name = _('image job')
+        verbose_name_plural = _('image jobs')
+        indexes = [
+            models.Index(
+                fields=['next_attempt'],
+                name='image_job_pending_idx',
+                condition=models.Q(processed__isnull=True),
+            ),
+        ]
+
+
+class AgencyDirectory(models.Model):
+    """Summary of agency for directory page, kept up to date by agency_directory utils."""
+
+    agency = models.OneToOneField(
+        Agency,
+        verbose_name=_(agency_field),
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='directory',
+    )
+    name = models.CharField(
+        verbose_name=_(name_field),
+        max_length=NAME_MAX_LEN,
+    )
+    city = models.ForeignKey(
+        City,
+        verbose_name=_(city_field),
+        on_delete=models.CASCADE,
+        related_name='+',
+        db_index=False,
+    )
+    city_name = models.CharField(_('city name'), max_length=NAME_MAX_LEN)
+    country_name = models.CharField(_('country name'), max_length=COUNTRY_MAX_LEN)
+    rating = models.FloatField(_('rating'), default=0)
+    reviews_count = models.PositiveIntegerField(_('reviews count'), default=0)
+    tours_count = models.PositiveIntegerField(_('tours count'), default=0)
+    account = models.OneToOneField(
+        Account,
+        verbose_name=_('agency account'),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    has_account = models.BooleanField(_('has account'), default=False)
+    refreshed = models.DateTimeField(
+        _('refresh date and time'),
+        default=get_datetime,
+    )
+
+    def __str__(self) -> str:
+        """Stringify class.
+
+        Returns:
+            str: stringified class. Name (City name).
+        """
+        return f'{self.name} ({self.city_name})'
+
+    class Meta:
+        """Meta class with AgencyDirectory settings."""
+
+        db_table = '"tours_data"."agency_directory"'
+        verbose_name = _('agency directory entry')
+        verbose_name_plural = _('agency directory')
+        indexes = [
+            models.Index(
+                fields=[name_field],
+                name='agency_directory_listed_idx',
+                condition=models.Q(has_account=True),
+            ),
+            models.Index(
+                fields=[city_field, name_field],
+                name='agency_directory_city_idx',
+                condition=models.Q(has_account=True),
+            ),
+        ]
@@ -0,0 +1,134 @@
+"""Module with signals for invalidate cached pages of changed data after commit."""
+
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Account, Address, Agency, City, Country, Review, Tour
+from .views_utils import page_cache
+
+ID_FIELD = 'id'
+
+
+def invalidate_accounts_pages(accounts: Any) -> None:
+    """Invalidate tours of agencies of accounts and tours reviewed by accounts.
+
+    Args:
+        accounts: Any - accounts or accounts queryset.
+    """
+    for account in accounts:
+        shown_in_tours = models.Q(reviews__account=account)
+        if account.agency_id:
+            shown_in_tours |= models.Q(agency_id=account.agency_id)
+        tours = Tour.objects.filter(shown_in_tours).values_list(ID_FIELD, flat=True).distinct()
+        page_cache.schedule_tours_invalidation(tours)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+@receiver(post_save, sender=Tour)
+@receiver(post_delete, sender=Tour)
+def invalidate_tour_pages(
+    sender: type,
+    instance: Review | Tour,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Invalidate tours list and page of changed tour or of tour of changed review.
+
+    Agencies page is invalidated by refresh of agencies directory.
+
+    Args:
+        sender: type - review or tour model.
+        instance: Review | Tour - saved or deleted instance.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    if not raw:
+        tour_id = instance.id if sender is Tour else instance.tour_id
+        page_cache.schedule_tours_invalidation([tour_id])
+
+
+@receiver(post_save, sender=Agency)
+@receiver(post_delete, sender=Agency)
+def invalidate_agency_pages(
+    sender: type,
+    instance: Agency,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Invalidate agencies page, tours list and pages of agency tours.
+
+    Deleted agency deletes its directory entry without directory refresh.
+
+    Args:
+        sender: type - agency model.
+        instance: Agency - saved or deleted agency.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    if not raw:
+        tours = Tour.objects.filter(agency=instance).values_list(ID_FIELD, flat=True)
+        page_cache.schedule_tours_invalidation(tours)
+        page_cache.schedule_invalidation(page_cache.AGENCIES_TAG)
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_account_pages(
+    sender: type,
+    instance: Account,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Invalidate pages with name and avatar of changed account.
+
+    Args:
+        sender: type - account model.
+        instance: Account - saved or deleted account.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    if not raw:
+        invalidate_accounts_pages([instance])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_pages(
+    sender: type,
+    instance: User,
+    update_fields: frozenset | None = None,
+    **kwargs: Any,
+) -> None:
+    """Invalidate pages with accounts of user when username or email may be changed.
+
+    Args:
+        sender: type - user model.
+        instance: User - saved user.
+        update_fields: frozenset | None, optional - saved fields. Defaults to None.
+        kwargs: Any - other signal data.
+    """
+    if update_fields is not None and not {'username', 'email'} & set(update_fields):
+        return
+    invalidate_accounts_pages(Account.objects.filter(account=instance))
+
+
+@receiver(post_save, sender=Address)
+@receiver(post_delete, sender=Address)
+@receiver(post_save, sender=City)
+@receiver(post_save, sender=Country)
+def invalidate_all_pages(sender: type, raw: bool = False, **kwargs: Any) -> None:
+    """Invalidate all pages after change of addresses, cities or countries, it is rare.
+
+    Deleted city or country deletes its addresses.
+
+    Args:
+        sender: type - address, city or country model.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    if not raw:
+        page_cache.schedule_invalidation(page_cache.PAGES_TAG)
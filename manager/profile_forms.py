@@ -5,10 +5,12 @@ from django.contrib.auth import forms as auth_forms
 from django.contrib.auth import models as auth_models
 from django.contrib.auth.password_validation import validate_password
 from django.http import HttpRequest
+from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
 
 from .forms import CustomImageInput, address_widgets
 from .models import Account, Address, Agency
+from .views_utils import email_utils
 
 EMAIL_LITERAL = 'email'
 USERNAME_LITERAL = 'username'
@@ -192,3 +194,34 @@ class PasswordChangeRequestForm(forms.Form):
         if new_password != new_password_confirm:
             raise forms.ValidationError(_('Passwords do not match.'))
         return cleaned_data
+
+
+class OutboxPasswordResetForm(auth_forms.PasswordResetForm):
+    """Password reset form which puts email into outbox."""
+
+    def send_mail(  # noqa: WPS211
+        self,
+        subject_template_name: str,
+        email_template_name: str,
+        context: dict,
+        from_email: str | None,
+        to_email: str,
+        html_email_template_name: str | None = None,
+    ) -> None:
+        """Queue password reset email.
+
+        Args:
+            subject_template_name: str - template of subject.
+            email_template_name: str - template of plain message.
+            context: dict - templates context.
+            from_email: str | None - sender, outbox worker uses SMTP_FROM_EMAIL.
+            to_email: str - recipient.
+            html_email_template_name: str | None, optional - template of html message.
+        """
+        subject = ''.join(render_to_string(subject_template_name, context).splitlines())
+        if html_email_template_name:
+            html_message = render_to_string(html_email_template_name, context)
+            email_utils.queue_email(subject, html_message, [to_email])
+        else:
+            message = render_to_string(email_template_name, context)
+            email_utils.queue_email(subject, message, [to_email], render_message_to_html=False)
@@ -0,0 +1,123 @@
+"""Module with database query budgets of views."""
+
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Callable, Iterator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+LIST_BUDGET = 12
+DETAIL_BUDGET = 20
+FORM_BUDGET = 10
+AUTH_BUDGET = 6
+API_BUDGET = 5
+
+# Budgets by url view name. Pages run a fixed number of queries regardless of rows
+# count, so the budget is a constant. Tours import is not budgeted, it runs queries
+# per catalog chunk.
+QUERY_BUDGETS = MappingProxyType({
+    'index': FORM_BUDGET,
+    'tours': LIST_BUDGET,
+    'tours_list': LIST_BUDGET,
+    'agencies': LIST_BUDGET,
+    'my_profile': DETAIL_BUDGET,
+    'profile': DETAIL_BUDGET,
+    'profile_tours': LIST_BUDGET,
+    'profile_reviews': LIST_BUDGET,
+    'agency_requests': LIST_BUDGET,
+    'tour': DETAIL_BUDGET,
+    'tour_reviews': LIST_BUDGET,
+    'settings': FORM_BUDGET,
+    'create_tour': FORM_BUDGET,
+    'edit_tour': LIST_BUDGET,
+    'delete_tour': FORM_BUDGET,
+    'create_agency': FORM_BUDGET,
+    'create_address': FORM_BUDGET,
+    'manager-registration': AUTH_BUDGET,
+    'manager-login': AUTH_BUDGET,
+    'manager-logout': AUTH_BUDGET,
+    'login': AUTH_BUDGET,
+    'logout': AUTH_BUDGET,
+    'password_reset': AUTH_BUDGET,
+    'password_reset_done': AUTH_BUDGET,
+    'password_reset_confirm': AUTH_BUDGET,
+    'password_reset_complete': AUTH_BUDGET,
+    'password_change': AUTH_BUDGET,
+    'password_change_done': AUTH_BUDGET,
+    'confirm_password_change': AUTH_BUDGET,
+    'password_change_complete': AUTH_BUDGET,
+    'rest_framework:login': AUTH_BUDGET,
+    'rest_framework:logout': AUTH_BUDGET,
+    'api-root': API_BUDGET,
+    'agency-list': API_BUDGET,
+    'agency-detail': API_BUDGET,
+    'tour-list': API_BUDGET,
+    'tour-detail': API_BUDGET,
+    'review-list': API_BUDGET,
+    'review-detail': API_BUDGET,
+    'address-list': API_BUDGET,
+    'address-detail': API_BUDGET,
+    'metrics': API_BUDGET,
+})
+
+
+class QueryBudgetExceeded(AssertionError):
+    """View ran more queries than its budget."""
+
+
+class QueryCounter:
+    """Database execute wrapper which counts queries."""
+
+    def __init__(self) -> None:
+        """Create counter with zero queries."""
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, execute: Callable, *args: Any) -> Any:
+        """Count and execute query.
+
+        Args:
+            execute: Callable - next execute wrapper.
+            args: Any - sql, params, many and context.
+
+        Returns:
+            Any: execute result.
+        """
+        with self.lock:
+            self.count += 1
+        return execute(*args)
+
+
+def check_query_budget(view_name: str | None, queries_count: int) -> None:
+    """Check queries count of view against its budget.
+
+    Args:
+        view_name: str | None - url view name.
+        queries_count: int - count of executed queries.
+
+    Raises:
+        QueryBudgetExceeded: if view has budget and it is exceeded.
+    """
+    budget = QUERY_BUDGETS.get(view_name)
+    if budget is not None and queries_count > budget:
+        raise QueryBudgetExceeded(
+            f'{view_name} ran {queries_count} queries, budget is {budget}',
+        )
+
+
+@contextmanager
+def assert_query_budget(view_name: str, using: str = DEFAULT_DB_ALIAS) -> Iterator[QueryCounter]:
+    """Count queries in block and check them against view budget, for use in tests.
+
+    Args:
+        view_name: str - url view name.
+        using: str, optional - database alias. Defaults to default database.
+
+    Yields:
+        QueryCounter: queries counter.
+    """
+    counter = QueryCounter()
+    with connections[using].execute_wrapper(counter):
+        yield counter
+    check_query_budget(view_name, counter.count)
@@ -21,12 +21,25 @@ class TourSerializer(serializers.ModelSerializer):
     """Tour table serializer."""
 
     addresses = serializers.PrimaryKeyRelatedField(queryset=Address.objects.all(), many=True)
+    rating = serializers.FloatField(read_only=True)
+    ratings_count = serializers.IntegerField(read_only=True)
+    ratings_distribution = serializers.DictField(child=serializers.IntegerField(), read_only=True)
 
     class Meta:
         """Class with Tour settings."""
 
         model = Tour
-        fields = [id_field, 'name', 'agency', 'addresses', 'starting_city', 'price']
+        fields = [
+            id_field,
+            'name',
+            'agency',
+            'addresses',
+            'starting_city',
+            'price',
+            'rating',
+            'ratings_count',
+            'ratings_distribution',
+        ]
         optional_fields = ['description']
 
 
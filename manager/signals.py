@@ -0,0 +1,224 @@
+"""Module with signals for keep tours ratings counters, images and directory up to date."""
+
+from functools import partial
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import RATING_COUNT_FIELDS, Account, Agency, Review, Tour
+from .views_utils import agency_directory, avatar_utils, image_jobs, tour_utils
+
+
+def shift_ratings_counts(tour_id: Any, shifts: dict[int, int]) -> None:
+    """Change tour ratings counters in one UPDATE.
+
+    Args:
+        tour_id: Any - id of tour.
+        shifts: dict[int, int] - counter changes by rating value.
+    """
+    counters = {
+        RATING_COUNT_FIELDS[rating]: models.F(RATING_COUNT_FIELDS[rating]) + shift
+        for rating, shift in shifts.items()
+        if rating in RATING_COUNT_FIELDS and shift
+    }
+    if counters:
+        Tour.objects.filter(id=tour_id).update(**counters)
+
+
+@receiver(post_save, sender=Review)
+def count_saved_review(sender: type, instance: Review, created: bool, **kwargs: Any) -> None:
+    """Count created review or move edited review to its new rating.
+
+    Reviews of agencies accounts are not shown with tour, so they are not counted.
+
+    Args:
+        sender: type - review model.
+        instance: Review - saved review.
+        created: bool - True if review was created.
+        kwargs: Any - other signal data.
+    """
+    rating = int(instance.rating)
+    saved_rating = getattr(instance, 'saved_rating', None)
+    instance.saved_rating = rating
+    if instance.account.agency_id:
+        return
+    if created:
+        shift_ratings_counts(instance.tour_id, {rating: 1})
+    elif saved_rating is None:
+        instance.tour.refresh_ratings_counts()
+    elif int(saved_rating) != rating:
+        shift_ratings_counts(instance.tour_id, {int(saved_rating): -1, rating: 1})
+
+
+@receiver(post_delete, sender=Review)
+def count_deleted_review(sender: type, instance: Review, **kwargs: Any) -> None:
+    """Uncount deleted review of user account.
+
+    Args:
+        sender: type - review model.
+        instance: Review - deleted review.
+        kwargs: Any - other signal data.
+    """
+    rating = getattr(instance, 'saved_rating', None) or instance.rating
+    if not instance.account.agency_id:
+        shift_ratings_counts(instance.tour_id, {int(rating): -1})
+
+
+@receiver(post_save, sender=Account)
+@receiver(pre_delete, sender=Agency)
+def recount_account_reviews(
+    sender: type,
+    instance: Account | Agency,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Recount tours reviewed by account after commit when its agency link is changed.
+
+    Deleted agency unlinks its account, so its reviews are counted again.
+
+    Args:
+        sender: type - account or agency model.
+        instance: Account | Agency - saved account or deleted agency.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    if raw:
+        return
+    if sender is Agency:
+        agency_accounts = Account.objects.filter(agency=instance)
+        accounts_ids = list(agency_accounts.values_list('id', flat=True))
+    elif getattr(instance, 'saved_agency_id', None) == instance.agency_id:
+        return
+    else:
+        accounts_ids = [instance.id]
+        instance.saved_agency_id = instance.agency_id
+    transaction.on_commit(partial(tour_utils.refresh_reviewed_tours_counts, accounts_ids))
+
+
+@receiver(post_save, sender=Tour)
+@receiver(post_save, sender=Account)
+def queue_avatar_processing(
+    sender: type,
+    instance: Tour | Account,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Queue renditions of changed avatar and deletion of replaced files.
+
+    Outdated renditions are forgotten at once, so original is shown until worker is done.
+
+    Args:
+        sender: type - tour or account model.
+        instance: Tour | Account - saved instance.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    if raw or not instance.avatar_changed:
+        return
+    obsolete_files = list(instance.avatar_renditions.values())
+    saved_avatar = getattr(instance, 'saved_avatar', None)
+    if saved_avatar:
+        obsolete_files.append(saved_avatar)
+    if obsolete_files:
+        sender.objects.filter(id=instance.id).update(avatar_renditions={})
+    image_jobs.queue_image_job(instance, obsolete_files)
+    instance.avatar_renditions = {}
+    instance.saved_avatar = instance.avatar.name
+
+
+@receiver(post_delete, sender=Tour)
+@receiver(post_delete, sender=Account)
+def queue_avatar_deletion(sender: type, instance: Tour | Account, **kwargs: Any) -> None:
+    """Queue deletion of avatar and its renditions of deleted instance.
+
+    Args:
+        sender: type - tour or account model.
+        instance: Tour | Account - deleted instance.
+        kwargs: Any - other signal data.
+    """
+    obsolete_files = list(instance.avatar_renditions.values())
+    if instance.avatar:
+        obsolete_files.append(instance.avatar.name)
+    if obsolete_files:
+        image_jobs.queue_image_job(instance, obsolete_files)
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_account_avatar(sender: type, instance: Account, **kwargs: Any) -> None:
+    """Forget cached avatar urls of saved or deleted account.
+
+    Args:
+        sender: type - account model.
+        instance: Account - saved or deleted account.
+        kwargs: Any - other signal data.
+    """
+    avatar_utils.invalidate_avatar_urls([instance.id])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_avatar(
+    sender: type,
+    instance: User,
+    update_fields: frozenset | None = None,
+    **kwargs: Any,
+) -> None:
+    """Forget cached gravatar urls of accounts when user email may be changed.
+
+    Args:
+        sender: type - user model.
+        instance: User - saved user.
+        update_fields: frozenset | None, optional - saved fields. Defaults to None.
+        kwargs: Any - other signal data.
+    """
+    if update_fields is not None and 'email' not in update_fields:
+        return
+    account_ids = Account.objects.filter(account=instance).values_list('id', flat=True)
+    avatar_utils.invalidate_avatar_urls(account_ids)
+
+
+@receiver(post_save, sender=Agency)
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+@receiver(post_save, sender=Tour)
+@receiver(post_delete, sender=Tour)
+def refresh_agency_entry(
+    sender: type,
+    instance: Agency | Account | Tour,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Refresh directory entry of changed agency, its account or tour after commit.
+
+    Args:
+        sender: type - agency, account or tour model.
+        instance: Agency | Account | Tour - saved or deleted instance.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    agency_id = instance.id if sender is Agency else instance.agency_id
+    if not raw and agency_id:
+        agency_directory.schedule_agency_refresh(agency_id=agency_id)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def refresh_review_agency_entry(
+    sender: type,
+    instance: Review,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Refresh directory entry of reviewed tour agency after commit.
+
+    Args:
+        sender: type - review model.
+        instance: Review - saved or deleted review.
+        raw: bool, optional - True if loaded from fixture. Defaults to False.
+        kwargs: Any - other signal data.
+    """
+    if not raw:
+        agency_directory.schedule_agency_refresh(tour_id=instance.tour_id)
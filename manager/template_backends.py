@@ -0,0 +1,70 @@
+"""Module with template backends."""
+
+from typing import Any
+
+from django.http import HttpRequest
+from django.template.backends.django import DjangoTemplates
+
+from .timings import TEMPLATE_PHASE, timed
+
+
+class TimedTemplate:
+    """Template which measures renders as request template phase."""
+
+    def __init__(self, template: Any) -> None:
+        """Wrap backend template.
+
+        Args:
+            template: Any - Django backend template.
+        """
+        self.template = template
+
+    def __getattr__(self, name: str) -> Any:
+        """Get attribute of wrapped template.
+
+        Args:
+            name: str - attribute name.
+
+        Returns:
+            Any: attribute value.
+        """
+        return getattr(self.template, name)
+
+    def render(self, context: dict | None = None, request: HttpRequest | None = None) -> str:
+        """Render template.
+
+        Args:
+            context: dict | None, optional - template context. Defaults to None.
+            request: HttpRequest | None, optional - request from user. Defaults to None.
+
+        Returns:
+            str: rendered template.
+        """
+        with timed(TEMPLATE_PHASE):
+            return self.template.render(context, request)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Django templates backend with render timings."""
+
+    def from_string(self, template_code: str) -> TimedTemplate:
+        """Compile template from string.
+
+        Args:
+            template_code: str - template code.
+
+        Returns:
+            TimedTemplate: compiled template.
+        """
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name: str) -> TimedTemplate:
+        """Load template by name.
+
+        Args:
+            template_name: str - template name.
+
+        Returns:
+            TimedTemplate: loaded template.
+        """
+        return TimedTemplate(super().get_template(template_name))
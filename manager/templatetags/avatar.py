@@ -4,15 +4,21 @@ import hashlib
 from urllib.parse import urlencode
 
 from django import template
+from django.db.models.fields.files import FieldFile
 
-from ..models import Account, Tour
+from ..models import AVATAR_WIDTHS, Account, Tour
+from ..views_utils.avatar_utils import get_avatar_url
+from ..views_utils.renditions import pick_rendition
+from ..views_utils.storage_urls import storage_urls
 
 register = template.Library()
 DEFAULT = 'https://i.imgur.com/9D119KO.png'
+AVATAR_SIZE = 55
+COVER_SIZE = 180
 
 
 @register.filter
-def gravatar_url(email: str, size: int = 55) -> str:
+def gravatar_url(email: str, size: int = AVATAR_SIZE) -> str:
     """Get gravatar URL for an account.
 
     Args:
@@ -29,31 +35,92 @@ def gravatar_url(email: str, size: int = 55) -> str:
     return f'https://www.gravatar.com/avatar/{email_hash}?{url_params}'
 
 
+def _get_image_url(image: FieldFile, renditions: dict[str, str], size: int) -> str:
+    rendition_name = pick_rendition(renditions, size) or image.name
+    return storage_urls.url(image.storage, rendition_name)
+
+
+def _format_srcset(urls: dict) -> str:
+    candidates = []
+    for width, url in urls.items():
+        candidates.append(f'{url} {width}w')
+    return ', '.join(candidates)
+
+
+def _get_srcset(image: FieldFile, renditions: dict[str, str]) -> str:
+    return _format_srcset({
+        width: storage_urls.url(image.storage, name) for width, name in renditions.items()
+    })
+
+
+def _make_avatar_url(user: Account, size: int) -> str:
+    if user.avatar:
+        return _get_image_url(user.avatar, user.avatar_renditions, size)
+    return gravatar_url(user.email, size)
+
+
+def _make_avatar_srcset(user: Account) -> str:
+    if user.avatar:
+        return _get_srcset(user.avatar, user.avatar_renditions)
+    return _format_srcset({
+        width: gravatar_url(user.email, width) for width in AVATAR_WIDTHS
+    })
+
+
 @register.filter
-def get_avatar(user: Account) -> str:
+def get_avatar(user: Account, size: int = AVATAR_SIZE) -> str:
     """Get avatar for Account.
 
     Args:
         user: Account - account for find avatar.
+        size: int, optional - displayed avatar width. Defaults to 55.
 
     Returns:
-        str: avatar url.
+        str: url of avatar rendition, original avatar or gravatar, cached per account.
     """
-    if user.avatar:
-        return user.avatar.url
-    return gravatar_url(user.email)
+    size = int(size)
+    return get_avatar_url(user.id, str(size), lambda: _make_avatar_url(user, size))
 
 
 @register.filter
-def get_tour_cover(tour: Tour) -> str:
+def get_avatar_srcset(user: Account) -> str:
+    """Get srcset of Account avatar renditions.
+
+    Args:
+        user: Account - account for find avatar.
+
+    Returns:
+        str: srcset, empty until renditions are made, cached per account.
+    """
+    return get_avatar_url(user.id, 'srcset', lambda: _make_avatar_srcset(user))
+
+
+@register.filter
+def get_tour_cover(tour: Tour, size: int = COVER_SIZE) -> str:
     """Get tour cover.
 
     Args:
         tour: Tour - tour for find cover.
+        size: int, optional - displayed cover width. Defaults to 180.
 
     Returns:
-        str: cover url.
+        str: url of cover rendition, original cover or default cover.
     """
     if tour.avatar:
-        return tour.avatar.url
+        return _get_image_url(tour.avatar, tour.avatar_renditions, int(size))
     return DEFAULT
+
+
+@register.filter
+def get_tour_cover_srcset(tour: Tour) -> str:
+    """Get srcset of tour cover renditions.
+
+    Args:
+        tour: Tour - tour for find cover.
+
+    Returns:
+        str: srcset, empty until renditions are made.
+    """
+    if tour.avatar:
+        return _get_srcset(tour.avatar, tour.avatar_renditions)
+    return ''
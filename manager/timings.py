@@ -0,0 +1,150 @@
+"""Module with request phases timings for Server-Timing header and logs."""
+
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable, Iterator
+
+DB_PHASE = 'db'
+TEMPLATE_PHASE = 'tpl'
+CACHE_PHASE = 'cache'
+STORAGE_PHASE = 'storage'
+MILLISECONDS = 1000
+
+
+class RequestTimings:
+    """Durations and counts of request phases."""
+
+    def __init__(self) -> None:
+        """Start request timer."""
+        self.started = time.perf_counter()
+        self.durations = {}
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def add(self, phase: str, duration: float) -> None:
+        """Add phase operation.
+
+        Args:
+            phase: str - phase name.
+            duration: float - operation duration in seconds.
+        """
+        with self.lock:
+            self.durations[phase] = self.durations.get(phase, 0) + duration
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Measure block as phase operation.
+
+        Args:
+            phase: str - phase name.
+
+        Yields:
+            None: measured block.
+        """
+        started = time.perf_counter()
+        yield
+        self.add(phase, time.perf_counter() - started)
+
+    def measure_query(self, execute: Callable, *args: Any) -> Any:
+        """Database execute wrapper which measures queries.
+
+        Args:
+            execute: Callable - next execute wrapper.
+            args: Any - sql, params, many and context.
+
+        Returns:
+            Any: execute result.
+        """
+        with self.measure(DB_PHASE):
+            return execute(*args)
+
+    def summary(self) -> dict[str, float | int]:
+        """Get total and phases durations in milliseconds with counts.
+
+        Returns:
+            dict[str, float | int]: e.g. total_ms, db_ms and db_count.
+        """
+        total = time.perf_counter() - self.started
+        phases = {'total_ms': round(total * MILLISECONDS, 2)}
+        for phase, duration in self.durations.items():
+            phases[f'{phase}_ms'] = round(duration * MILLISECONDS, 2)
+            phases[f'{phase}_count'] = self.counts[phase]
+        return phases
+
+    def header(self) -> str:
+        """Get Server-Timing header value.
+
+        Returns:
+            str: header value, e.g. total;dur=12.5, db;dur=3.1;desc="4".
+        """
+        phases = self.summary()
+        metrics = [f'total;dur={phases["total_ms"]}']
+        for phase in self.durations:
+            duration = phases[f'{phase}_ms']
+            phase_count = self.counts[phase]
+            metrics.append(f'{phase};dur={duration};desc="{phase_count}"')
+        return ', '.join(metrics)
+
+
+current_timings: ContextVar[RequestTimings | None] = ContextVar('current_timings', default=None)
+current_query_observers: ContextVar[tuple[Callable, ...]] = ContextVar(
+    'current_query_observers', default=(),
+)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Measure block as phase of current request, if timings are collected.
+
+    Args:
+        phase: str - phase name.
+
+    Yields:
+        None: measured block.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    with timings.measure(phase):
+        yield
+
+
+@contextmanager
+def observe_queries(observer: Callable) -> Iterator[None]:
+    """Pass queries of block to execute wrapper in any thread the block context reaches.
+
+    Unlike connection execute_wrapper, observer sees queries of sync_to_async threads
+    of async views, their connections are not connections of the caller.
+
+    Args:
+        observer: Callable - execute wrapper.
+
+    Yields:
+        None: observed block.
+    """
+    with ExitStack() as restore:
+        observers = current_query_observers.get()
+        restore.callback(
+            current_query_observers.reset, current_query_observers.set((*observers, observer)),
+        )
+        yield
+
+
+def observe_request_query(execute: Callable, *args: Any) -> Any:
+    """Database execute wrapper which passes query to observers of current context.
+
+    Args:
+        execute: Callable - next execute wrapper.
+        args: Any - sql, params, many and context.
+
+    Returns:
+        Any: execute result.
+    """
+    for observer in reversed(current_query_observers.get()):
+        execute = partial(observer, execute)
+    return execute(*args)
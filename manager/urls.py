@@ -1,10 +1,12 @@
 """Module with site urls."""
 
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import (authentication_views, password_change_views, profile_views,
-                    views, viewset_views)
+from .views import (async_views, authentication_views, fragment_views,
+                    metrics_views, password_change_views, profile_views, views,
+                    viewset_views)
 
 router = DefaultRouter()
 router.register('agencies', viewset_views.AgencyViewSet)
@@ -12,16 +14,27 @@ router.register('tours', viewset_views.TourViewSet)
 router.register('reviews', viewset_views.ReviewViewSet)
 router.register('addresses', viewset_views.AddressViewSet)
 
+read_views = async_views if settings.ASYNC_VIEWS else views
+api_lists = [
+    path('api/tours/', async_views.tours_api, name='tour-list'),
+    path('api/reviews/', async_views.reviews_api, name='review-list'),
+] if settings.ASYNC_VIEWS else []
+
 urlpatterns = [
     path('', views.index, name='index'),
-    path('tours/', views.tours, name='tours'),
-    path('agencies/', views.agencies, name='agencies'),
+    path('tours/', read_views.tours, name='tours'),
+    path('tours/list/', fragment_views.tours_list, name='tours_list'),
+    path('agencies/', read_views.agencies, name='agencies'),
     path('profile/', profile_views.my_profile, name='my_profile'),
     path('profile/<str:username>/', profile_views.profile, name='profile'),
+    path('profile/<str:username>/tours/', fragment_views.profile_tours, name='profile_tours'),
+    path('profile/<str:username>/reviews/', fragment_views.profile_reviews, name='profile_reviews'),
+    path('agency-requests/', fragment_views.agency_requests, name='agency_requests'),
     path('settings/', profile_views.settings, name='settings'),
     path('registration/', authentication_views.registration, name='manager-registration'),
     path('login/', authentication_views.login, name='manager-login'),
     path('logout/', authentication_views.logout, name='manager-logout'),
+    *api_lists,
     path('api/', include(router.urls)),
     path('api-auth/', include('rest_framework.urls', namespace='rest_framework')),
     path('accounts/', include('django.contrib.auth.urls')),
@@ -33,10 +46,13 @@ urlpatterns = [
     path('password_change/done/', password_change_views.CustomPasswordChangeDoneView.as_view(), name='password_change_done'),
     path('change/<uidb64>/<token>/', password_change_views.confirm_password_change, name='confirm_password_change'),
     path('change/complete/', password_change_views.CustomPasswordResetCompleteView.as_view(), name='password_change_complete'),
-    path('tour/<uuid:uuid>/', views.tour, name='tour'),
+    path('tour/<uuid:uuid>/', read_views.tour, name='tour'),
+    path('tour/<uuid:uuid>/reviews/', fragment_views.tour_reviews, name='tour_reviews'),
     path('tour/<uuid:uuid>/edit/', views.edit_tour, name='edit_tour'),
     path('tour/<uuid:uuid>/delete/', views.delete_tour, name='delete_tour'),
     path('tour/create/', views.create_tour, name='create_tour'),
+    path('tour/import/', profile_views.import_tours, name='import_tours'),
     path('agencies/create/', profile_views.create_agency_form, name='create_agency'),
     path('addresses/create/', views.create_address, name='create_address'),
+    path('metrics', metrics_views.metrics_view, name='metrics'),
 ]
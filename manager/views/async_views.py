@@ -0,0 +1,151 @@
+"""Module with async read views served under ASGI.
+
+Pages gather their independent reads concurrently and render templates in thread,
+context processors of templates read session. Unsafe requests are handled by sync views,
+API lists are answered by DRF views in own threads.
+"""
+
+from functools import partial
+from types import MappingProxyType
+from typing import Callable
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse, HttpResponseNotFound
+
+from ..forms import FindAgenciesForm, FindToursForm
+from ..models import Tour
+from ..views_utils import async_reads, page_cache, read_pages, tour_utils
+from . import views, viewset_views
+
+READ_METHODS = frozenset(('GET', 'HEAD'))
+LIST_ACTIONS = MappingProxyType({'get': 'list', 'post': 'create'})
+TOURS_LIST_VIEW = viewset_views.TourViewSet.as_view(LIST_ACTIONS)
+REVIEWS_LIST_VIEW = viewset_views.ReviewViewSet.as_view(LIST_ACTIONS)
+
+
+@page_cache.cache_anonymous_page(page_cache.TOURS_TAG)
+async def tours(request: HttpRequest) -> HttpResponse:
+    """Tours list view, tours page and search form choices are read concurrently.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: rendered template.
+    """
+    tours_block, form = await async_reads.gather_reads(
+        request,
+        partial(read_pages.render_tours_block, request),
+        partial(FindToursForm, request),
+    )
+    return await sync_to_async(read_pages.render_tours_page)(request, tours_block, form)
+
+
+@page_cache.cache_anonymous_page(page_cache.AGENCIES_TAG)
+async def agencies(request: HttpRequest) -> HttpResponse:
+    """Agencies list view, directory page and search form choices are read concurrently.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: rendered template.
+    """
+    agencies_page, form = await async_reads.gather_reads(
+        request,
+        partial(read_pages.get_agencies_page, request),
+        partial(FindAgenciesForm, request),
+    )
+    return await sync_to_async(read_pages.render_agencies_page)(request, agencies_page, form)
+
+
+@page_cache.cache_anonymous_page(page_cache.TOUR_TAG)
+async def tour(request: HttpRequest, uuid: UUID) -> HttpResponse:
+    """Tour view, tour and page of its reviews are read concurrently.
+
+    Rating comes from tour counters, so tour read has no aggregate. Reviews forms are
+    posted to sync view.
+
+    Args:
+        request: HttpRequest - request from user.
+        uuid: UUID - tour id.
+
+    Returns:
+        HttpResponse: rendered template.
+    """
+    if request.method not in READ_METHODS:
+        return await sync_to_async(views.tour)(request, uuid)
+    reviews_manager = tour_utils.create_tour_reviews_manager(request, Tour(id=uuid))
+    tour_data, reviews = await async_reads.gather_reads(
+        request,
+        partial(read_pages.get_tour, uuid),
+        reviews_manager.render_reviews_block,
+    )
+    if not tour_data:
+        return HttpResponseNotFound()
+    return await sync_to_async(read_pages.render_tour_page)(request, tour_data, reviews)
+
+
+def render_api_list(sync_view: Callable, request: HttpRequest) -> HttpResponse:
+    """Answer request with DRF view and render response in the same thread.
+
+    Args:
+        sync_view: Callable - DRF view of viewset list.
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: rendered response.
+    """
+    return sync_view(request).render()
+
+
+async def list_api(request: HttpRequest, sync_view: Callable) -> HttpResponse:
+    """List objects with DRF view, GET runs in own thread with own connection.
+
+    DRF view authenticates token, checks permissions and throttles, negotiates renderer
+    and pages list, so responses are the same as of sync view. Other requests, e.g.
+    create, run in request thread.
+
+    Args:
+        request: HttpRequest - request from user.
+        sync_view: Callable - DRF view of viewset list.
+
+    Returns:
+        HttpResponse: objects list.
+    """
+    if request.method != 'GET':
+        return await sync_to_async(sync_view)(request)
+    api_responses = await async_reads.gather_reads(
+        request, partial(render_api_list, sync_view, request),
+    )
+    return api_responses[0]
+
+
+async def tours_api(request: HttpRequest) -> HttpResponse:
+    """Tours API list view.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: tours list.
+    """
+    return await list_api(request, TOURS_LIST_VIEW)
+
+
+async def reviews_api(request: HttpRequest) -> HttpResponse:
+    """Reviews API list view.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: reviews list.
+    """
+    return await list_api(request, REVIEWS_LIST_VIEW)
+
+
+# DRF views check API tokens instead of CSRF tokens, API views delegate to them.
+tours_api.csrf_exempt = True
+reviews_api.csrf_exempt = True
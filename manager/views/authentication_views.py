@@ -3,6 +3,7 @@
 from django.contrib.auth import authenticate, decorators
 from django.contrib.auth import login as auth_login
 from django.contrib.auth import logout as auth_logout
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
@@ -30,15 +31,16 @@ def registration(request: HttpRequest) -> HttpResponse | HttpResponseRedirect:
     if request.method == 'POST':
         form = SignupForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            created_account = Account.objects.create(account=user)
-            token = Token.objects.create(user=created_account.account)
-            mail_subject = 'Welcome! Thats your API auth key!'
-            html_message = render_to_string(
-                'registration/token_email.html',
-                {'api_key': token.key},
-            )
-            email_utils.send_email(mail_subject, html_message, [user.email])
+            with transaction.atomic():
+                user = form.save()
+                created_account = Account.objects.create(account=user)
+                token = Token.objects.create(user=created_account.account)
+                mail_subject = 'Welcome! Thats your API auth key!'
+                html_message = render_to_string(
+                    'registration/token_email.html',
+                    {'api_key': token.key},
+                )
+                email_utils.queue_email(mail_subject, html_message, [user.email])
             return redirect('manager-login')
         else:
             errors = form.errors.as_data()
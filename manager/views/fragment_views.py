@@ -0,0 +1,93 @@
+"""Module with partial endpoints which render only a block of page."""
+
+from uuid import UUID
+
+from django.http import HttpRequest, HttpResponse, HttpResponseNotFound
+from django.views.decorators.http import require_GET
+
+from ..models import Tour
+from ..views_utils import profile_tabs, tour_utils, tours_list_manager
+from ..views_utils.read_pages import TOUR_ADDRESSES_PREFETCH
+
+
+@require_GET
+def tours_list(request: HttpRequest) -> HttpResponse:
+    """Render requested page of tours list without search form and header.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: rendered tours block.
+    """
+    tours_data = Tour.objects.prefetch_related(TOUR_ADDRESSES_PREFETCH)
+    tours_data = tours_list_manager.filter_tours(request, tours_data)
+    tours_manager = tours_list_manager.ToursListManager(request, tours_data)
+    return HttpResponse(tours_manager.render_tours_block())
+
+
+@require_GET
+def tour_reviews(request: HttpRequest, uuid: UUID) -> HttpResponse:
+    """Render requested page of tour reviews without tour.
+
+    Args:
+        request: HttpRequest - request from user.
+        uuid: UUID - tour id.
+
+    Returns:
+        HttpResponse: rendered reviews block, not found if there is no tour.
+    """
+    tour = Tour.objects.filter(id=uuid).first()
+    if not tour:
+        return HttpResponseNotFound()
+    reviews = tour_utils.create_tour_reviews_manager(request, tour)
+    return HttpResponse(reviews.render_reviews_block(display=True))
+
+
+@require_GET
+def profile_tours(request: HttpRequest, username: str) -> HttpResponse:
+    """Render requested page of agency profile tours tab.
+
+    Args:
+        request: HttpRequest - request from user.
+        username: str - profile username.
+
+    Returns:
+        HttpResponse: rendered tours block, not found if profile is not agency.
+    """
+    account = profile_tabs.get_profile_account(request, username)
+    if account is None or not account.agency:
+        return HttpResponseNotFound()
+    return HttpResponse(profile_tabs.render_tours_tab(request, account))
+
+
+@require_GET
+def profile_reviews(request: HttpRequest, username: str) -> HttpResponse:
+    """Render requested page of user profile reviews tab.
+
+    Args:
+        request: HttpRequest - request from user.
+        username: str - profile username.
+
+    Returns:
+        HttpResponse: rendered reviews block, not found if profile is agency.
+    """
+    account = profile_tabs.get_profile_account(request, username)
+    if account is None or account.agency:
+        return HttpResponseNotFound()
+    return HttpResponse(profile_tabs.render_reviews_tab(request, account))
+
+
+@require_GET
+def agency_requests(request: HttpRequest) -> HttpResponse:
+    """Render requested page of agency requests tab for staff.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: rendered requests block, not found if user is not staff.
+    """
+    if not request.user.is_staff:
+        return HttpResponseNotFound()
+    return HttpResponse(profile_tabs.render_requests_tab(request))
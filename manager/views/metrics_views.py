@@ -0,0 +1,35 @@
+"""Module with view for Prometheus metrics."""
+
+import hmac
+from os import getenv
+
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+from dotenv import load_dotenv
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from .. import metrics
+
+load_dotenv()
+
+
+@require_GET
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Metrics in Prometheus text format.
+
+    If METRICS_TOKEN is set, scraper must send it as bearer token.
+
+    Args:
+        request: HttpRequest - request from scraper.
+
+    Returns:
+        HttpResponse: metrics or forbidden response.
+    """
+    token = getenv('METRICS_TOKEN')
+    authorization = request.headers.get('Authorization', '')
+    if token and not hmac.compare_digest(authorization, f'Bearer {token}'):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        generate_latest(metrics.get_registry()),
+        content_type=CONTENT_TYPE_LATEST,
+    )
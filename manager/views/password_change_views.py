@@ -10,7 +10,7 @@ from django.template.loader import render_to_string
 from django.utils import encoding, http
 from dotenv import load_dotenv
 
-from ..profile_forms import PasswordChangeRequestForm
+from ..profile_forms import OutboxPasswordResetForm, PasswordChangeRequestForm
 from ..views_utils import email_utils, errors_utils, profile_utils
 
 
@@ -43,7 +43,7 @@ def request_password_change(request: HttpRequest) -> HttpResponse | HttpResponse
                     'token': tokens.default_token_generator.make_token(user),
                 },
             )
-            email_utils.send_email(mail_subject, html_message, [user.email])
+            email_utils.queue_email(mail_subject, html_message, [user.email])
             request.session['new_password'] = new_password
             return redirect('password_change_done')
         else:
@@ -114,6 +114,7 @@ account_form_styles = [
 class CustomPasswordResetView(views.PasswordResetView):
     """View for password reset."""
 
+    form_class = OutboxPasswordResetForm
     html_email_template_name = 'registration/password_reset_email_html.html'
 
 
@@ -1,43 +1,40 @@
 """Module with views for user profile."""
 
 from django.contrib.auth import decorators
-from django.contrib.auth import models as auth_models
+from django.core import exceptions
 from django.http import (HttpRequest, HttpResponse, HttpResponseNotFound,
                          HttpResponseRedirect)
 from django.shortcuts import redirect, render
-from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
 
-from ..models import Account, Address, Agency, AgencyRequests, Review, Tour
+from ..import_forms import TourImportFileForm
+from ..models import Account, Address, Agency, AgencyRequests
 from ..profile_forms import (SettingsAddressForm, SettingsAgencyForm,
                              SettingsUserForm)
-from ..views_utils import (errors_utils, requests_list_manager,
-                           reviews_list_manager, tours_list_manager)
+from ..views_utils import errors_utils, profile_tabs, tour_utils, tours_import
 
+REQUEST_USER_LITERAL = 'request_user'
+USER_LITERAL = 'user'
+STYLE_FILES_LITERAL = 'style_files'
+HEADER_CSS = 'css/header.css'
+BODY_CSS = 'css/body.css'
 
-def _get_agency_requests(request: HttpRequest, account: Account) -> str | HttpResponseRedirect:
-    requests_block = ''
+
+def _render_user_tabs(request: HttpRequest, account: Account) -> dict | HttpResponseRedirect:
+    tabs = {'reviews': profile_tabs.render_reviews_tab(request, account)}
     if account.account.is_staff:
-        agency_requests = list(AgencyRequests.objects.all())
-        requests_manager = requests_list_manager.AgencyRequestsListManager(
-            request,
-            agency_requests,
-        )
-        requests_block = requests_manager.render_agency_requests_block()
-    return requests_block
-
-
-def _calculate_reviews_rating(reviews_data: dict) -> dict:
-    for tour_data, tour_reviews in reviews_data.items():
-        tour_ratings = [review.rating for review in tour_reviews]
-        if tour_ratings:
-            reviews_data[tour_data] = round(sum(tour_ratings) / len(tour_ratings), 2)
-        else:
-            reviews_data[tour_data] = 0
-    return reviews_data
+        tabs['requests'] = profile_tabs.render_requests_tab(request)
+    for tab in tabs.values():
+        if isinstance(tab, HttpResponseRedirect):
+            return tab
+    return tabs
 
 
 def profile(request: HttpRequest, username: str = None) -> HttpResponse | HttpResponseRedirect:
-    """Render profile page.
+    """Render profile page, its tabs are loaded by partial endpoints when shown.
+
+    Reviews and agency requests forms are posted to the page itself, so POST renders
+    tabs inline to redirect after change or show form errors.
 
     Args:
         request: HttpRequest - request from user.
@@ -46,54 +43,37 @@ def profile(request: HttpRequest, username: str = None) -> HttpResponse | HttpRe
     Returns:
         HttpResponse | HttpResponseRedirect: rendered page or redirect to login.
     """
-    tours_data = {}
-    tours_block = ''
-    requests_block = ''
-    reviews = {}
-    if username:
-        user = auth_models.User.objects.get(username=username)
-        account = Account.objects.filter(account=user).first()
-    else:
-        if not request.user.is_authenticated:
-            return redirect('manager-login')
-        account = Account.objects.filter(account=request.user).first()
+    account = profile_tabs.get_profile_account(request, username)
+    if account is None:
+        return HttpResponseNotFound() if username else redirect('manager-login')
+    tabs = {}
+    agency_rating = 0
     if account.agency:
-        tours_data = Tour.objects.filter(agency=account.agency.id)
-        reviews_data = {tour: Review.objects.filter(tour=tour) for tour in tours_data}
-        tours_manager = tours_list_manager.ToursListManager(request, tours_data, reviews_data)
-        tours_block = tours_manager.render_tours_block()
-        reviews_data = _calculate_reviews_rating(reviews_data)
-    else:
-        reviews_data = list(Review.objects.filter(account=account))
-        reviews = reviews_list_manager.ReviewsListManager(
-            request,
-            reviews_data,
-            reverse('my_profile'),
-            'parts/tour_review.html',
-        )
-        reviews_data = reviews.render_reviews_block(display=True, check_user_review=False)
-        if isinstance(reviews_data, HttpResponseRedirect):
-            return reviews_data
-        requests_block = _get_agency_requests(request, account)
-        if isinstance(requests_block, HttpResponseRedirect):
-            return requests_block
+        agency_rating = tour_utils.get_agency_rating(account.agency)
+    elif request.method != 'GET':
+        tabs = _render_user_tabs(request, account)
+        if isinstance(tabs, HttpResponseRedirect):
+            return tabs
     return render(
         request,
         'pages/profile.html',
         {
-            'request_user': request.user,
-            'user': account,
-            'tours_block': tours_block,
-            'requests_block': requests_block,
-            'reviews_data': reviews_data,
+            REQUEST_USER_LITERAL: request.user,
+            USER_LITERAL: account,
+            'agency_rating': agency_rating,
+            'reviews_block': tabs.get('reviews', ''),
+            'requests_block': tabs.get('requests', ''),
             'review_form': '',
-            'style_files': [
-                'css/header.css',
-                'css/body.css',
+            STYLE_FILES_LITERAL: [
+                HEADER_CSS,
+                BODY_CSS,
                 'css/tour.css',
                 'css/profile.css',
                 'css/rating.css',
                 'css/avatar.css',
+                'css/tours.css',
+                'css/reviews.css',
+                'css/pages.css',
             ],
         },
     )
@@ -120,7 +100,7 @@ def user_update(request: HttpRequest, user: Account, errors: dict) -> Account |
     if user_form.is_valid():
         user_form.save()
         if post_request.get('avatar_clear') == 'on':
-            user.avatar.delete()
+            user.avatar = None
             user.save()
         if 'avatar' in request.FILES and post_request.get('avatar_clear') != 'on':
             user.avatar = request.FILES['avatar']
@@ -198,16 +178,16 @@ def settings(request: HttpRequest) -> HttpResponse:
         request,
         'pages/settings.html',
         {
-            'request_user': request_user,
-            'user': user,
+            REQUEST_USER_LITERAL: request_user,
+            USER_LITERAL: user,
             'user_form': user_form,
             'agency_form': agency_form,
             'address_form': address_form,
             'errors': errors,
             'ignore_special_header': True,
-            'style_files': [
-                'css/header.css',
-                'css/body.css',
+            STYLE_FILES_LITERAL: [
+                HEADER_CSS,
+                BODY_CSS,
                 'css/account_form.css',
                 'css/profile.css',
                 'css/settings.css',
@@ -257,15 +237,63 @@ def create_agency_form(request: HttpRequest) -> HttpResponse:
         request,
         'pages/create_agency.html',
         {
-            'request_user': request.user,
-            'user': account,
+            REQUEST_USER_LITERAL: request.user,
+            USER_LITERAL: account,
             'agency_form': agency_form,
             'address_form': address_form,
             'errors': errors,
             'ignore_special_header': True,
-            'style_files': [
-                'css/header.css',
-                'css/body.css',
+            STYLE_FILES_LITERAL: [
+                HEADER_CSS,
+                BODY_CSS,
+                'css/account_form.css',
+            ],
+        },
+    )
+
+
+@decorators.login_required
+def import_tours(request: HttpRequest) -> HttpResponse:
+    """Render tours catalog import form and import uploaded catalog.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Raises:
+        PermissionDenied: if user is not agency.
+
+    Returns:
+        HttpResponse: rendered form with import summary.
+    """
+    account = Account.objects.filter(account=request.user).first()
+    if not account or not account.agency:
+        raise exceptions.PermissionDenied()
+    summary = None
+    form = TourImportFileForm()
+    if request.method == 'POST':
+        form = TourImportFileForm(request.POST, request.FILES)
+        if form.is_valid():
+            catalog = form.cleaned_data['catalog']
+            rows = tours_import.read_rows(
+                catalog.file,
+                tours_import.get_import_format(catalog.name),
+            )
+            try:
+                summary = tours_import.ToursImporter(account.agency).import_rows(rows)
+            except ValueError:
+                form.add_error('catalog', _('Catalog is not readable.'))
+    return render(
+        request,
+        'pages/import_tours.html',
+        {
+            REQUEST_USER_LITERAL: request.user,
+            USER_LITERAL: account,
+            'form': form,
+            'summary': summary,
+            'ignore_special_header': True,
+            STYLE_FILES_LITERAL: [
+                HEADER_CSS,
+                BODY_CSS,
                 'css/account_form.css',
             ],
         },
@@ -1,30 +1,25 @@
 """Module with page views."""
 
-from os import getenv
 from uuid import UUID
 
-from django.core import exceptions, paginator
+from django.core import exceptions
 from django.http import (HttpRequest, HttpResponse, HttpResponseNotFound,
                          HttpResponseRedirect)
 from django.shortcuts import redirect, render
-from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
-from dotenv import load_dotenv
 
 from ..forms import FindAgenciesForm, FindToursForm
-from ..models import Account, Agency, Review, Tour
-from ..views_utils import (address_form_utils, page_utils,
-                           reviews_list_manager, tour_utils,
-                           tours_list_manager)
+from ..models import Account, Tour
+from ..views_utils import (address_form_utils, page_cache, read_pages,
+                           tour_utils)
 
-load_dotenv()
-DEFAULT_AGECIES_PER_PAGE = 15
 FORM_LITERAL = 'form'
 STYLE_FILES_LITERAL = 'style_files'
 HEADER_CSS = 'css/header.css'
 BODY_CSS = 'css/body.css'
 
 
+@page_cache.cache_anonymous_page(page_cache.TOURS_TAG)
 def index(request: HttpRequest) -> HttpResponse:
     """Index page view.
 
@@ -49,6 +44,7 @@ def index(request: HttpRequest) -> HttpResponse:
     )
 
 
+@page_cache.cache_anonymous_page(page_cache.TOURS_TAG)
 def tours(request: HttpRequest) -> HttpResponse:
     """Tours list view.
 
@@ -58,40 +54,13 @@ def tours(request: HttpRequest) -> HttpResponse:
     Returns:
         HttpResponse: rendered template.
     """
-    expected_get_subset = ['starting_city', 'country']
-    if not request.GET or not set(expected_get_subset).issubset(request.GET):
-        tours_data = Tour.objects.all()
-    else:
-        tours_data = Tour.objects.filter(
-            starting_city=request.GET.get('starting_city'),
-            address__city__country=request.GET.get('country'),
-        )
-    reviews_data = {}
-    for tour_data in tours_data:
-        reviews_data[tour_data] = Review.objects.filter(tour=tour_data, account__agency=None)
-    tours_manager = tours_list_manager.ToursListManager(request, tours_data, reviews_data)
-    tours_block = tours_manager.render_tours_block()
-    form = FindToursForm(request)
-    return render(
-        request,
-        'pages/tours.html',
-        {
-            FORM_LITERAL: form,
-            'tours_block': tours_block,
-            'reviews_data': reviews_data,
-            STYLE_FILES_LITERAL: [
-                HEADER_CSS,
-                BODY_CSS,
-                'css/search_tours.css',
-                'css/rating.css',
-                'css/avatar.css',
-            ],
-        },
-    )
+    tours_block = read_pages.render_tours_block(request)
+    return read_pages.render_tours_page(request, tours_block, FindToursForm(request))
 
 
+@page_cache.cache_anonymous_page(page_cache.AGENCIES_TAG)
 def agencies(request: HttpRequest) -> HttpResponse:
-    """Viw with list of all agencies.
+    """Viw with list of all agencies read from agencies directory.
 
     Args:
         request: HttpRequest - request from user.
@@ -99,50 +68,8 @@ def agencies(request: HttpRequest) -> HttpResponse:
     Returns:
         HttpResponse: rendered template.
     """
-    page = int(request.GET.get('page', 1))
-    if not request.GET or not request.GET.get('city'):
-        agencies_data = Agency.objects.all()
-    else:
-        agencies_data = Agency.objects.filter(address__city=request.GET.get('city'))
-    agencies_data = [
-        agency for agency in agencies_data if hasattr(agency, 'account')  # noqa: WPS421
-    ]
-    agencies_paginator = paginator.Paginator(
-        agencies_data,
-        int(getenv('AGENCIES_PER_PAGE', DEFAULT_AGECIES_PER_PAGE)),
-    )
-    agencies_data = agencies_paginator.get_page(page)
-    reviews_data = {agency: Review.objects.filter(tour__agency=agency) for agency in agencies_data}
-    for agency_data, agency_reviews in reviews_data.items():
-        tour_ratings = [review.rating for review in agency_reviews]
-        if tour_ratings:
-            reviews_data[agency_data] = round(sum(tour_ratings) / len(tour_ratings), 2)
-        else:
-            reviews_data[agency_data] = 0
-    pages_slice = page_utils.get_pages_slice(page, int(agencies_paginator.num_pages))
-    return render(
-        request,
-        'pages/agencies.html',
-        {
-            FORM_LITERAL: FindAgenciesForm(request),
-            'agencies_data': agencies_data,
-            'reviews_data': reviews_data,
-            'pages': {
-                'current': page,
-                'total': int(agencies_paginator.num_pages),
-                'slice': pages_slice,
-            },
-            STYLE_FILES_LITERAL: [
-                HEADER_CSS,
-                BODY_CSS,
-                'css/agencies.css',
-                'css/search_agencies.css',
-                'css/rating.css',
-                'css/avatar.css',
-                'css/pages.css',
-            ],
-        },
-    )
+    agencies_page = read_pages.get_agencies_page(request)
+    return read_pages.render_agencies_page(request, agencies_page, FindAgenciesForm(request))
 
 
 def create_tour(request: HttpRequest) -> HttpResponse:
@@ -293,6 +220,7 @@ def csrf_failure(request: HttpRequest, reason: str = '') -> HttpResponseRedirect
     return redirect('index')
 
 
+@page_cache.cache_anonymous_page(page_cache.TOUR_TAG)
 def tour(request: HttpRequest, uuid: UUID) -> HttpResponse:
     """Tour view.
 
@@ -303,38 +231,14 @@ def tour(request: HttpRequest, uuid: UUID) -> HttpResponse:
     Returns:
         HttpResponse: rendered template.
     """
-    ratings = []
-    tour_data = Tour.objects.filter(id=uuid).first()
+    tour_data = read_pages.get_tour(uuid)
     if not tour_data:
         return HttpResponseNotFound()
-    reviews = list(tour_data.reviews.filter(account__agency=None))
-    for review in reviews:
-        ratings.append(review.rating)
-    reviews = reviews_list_manager.ReviewsListManager(
-        request,
-        reviews,
-        reverse('tour', kwargs={'uuid': uuid}),
-    )
+    reviews = tour_utils.create_tour_reviews_manager(request, tour_data)
     reviews = reviews.render_reviews_block()
     if isinstance(reviews, HttpResponseRedirect):
         return reviews
-    return render(
-        request,
-        'pages/tour.html',
-        {
-            'ratings': ratings,
-            'reviews': reviews,
-            'tour': tour_data,
-            'request': request,
-            STYLE_FILES_LITERAL: [
-                HEADER_CSS,
-                BODY_CSS,
-                'css/tour.css',
-                'css/rating.css',
-                'css/avatar.css',
-            ],
-        },
-    )
+    return read_pages.render_tour_page(request, tour_data, reviews)
 
 
 def create_address(request: HttpRequest) -> HttpResponse:
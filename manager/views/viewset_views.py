@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from django.db.models import Model
+from django.db.models import Model, QuerySet
 from django.http import HttpRequest
 from rest_framework import authentication, permissions, serializers, viewsets
 
@@ -36,25 +36,29 @@ class CustomViewSetPermission(permissions.BasePermission):
 def create_viewset(
     model_class: Model,
     serializer: serializers.ModelSerializer,
+    queryset: QuerySet | None = None,
 ) -> viewsets.ModelViewSet:
     """Viewset decorator.
 
     Args:
         model_class: Model - model for generate viewset.
         serializer: ModelSerializer - serializer for model.
+        queryset: QuerySet | None, optional - queryset with related objects. Defaults to all.
 
     Returns:
         ModelViewSet: model viewset.
     """
+    viewset_queryset = model_class.objects.all() if queryset is None else queryset
+
     class CustomViewSet(viewsets.ModelViewSet):
         serializer_class = serializer
-        queryset = model_class.objects.all()
+        queryset = viewset_queryset
         permission_classes = [CustomViewSetPermission]
         authentication_classes = [authentication.TokenAuthentication]
     return CustomViewSet
 
 
 AgencyViewSet = create_viewset(Agency, AgencySerializer)
-TourViewSet = create_viewset(Tour, TourSerializer)
+TourViewSet = create_viewset(Tour, TourSerializer, Tour.objects.prefetch_related('addresses'))
 AddressViewSet = create_viewset(Address, AddressSerializer)
 ReviewViewSet = create_viewset(Review, ReviewSerializer)
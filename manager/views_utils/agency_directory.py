@@ -0,0 +1,165 @@
+"""Module with functions for keep agencies directory summary up to date."""
+
+from itertools import islice
+from os import getenv
+from threading import local
+from typing import Any, Iterable
+
+from django.db import models, transaction
+from dotenv import load_dotenv
+
+from ..models import (RATING_COUNT_FIELDS, Agency, AgencyDirectory,
+                      get_average_rating)
+from ..validators import get_datetime
+from . import page_cache
+
+load_dotenv()
+DEFAULT_BATCH_SIZE = 1000
+DIRECTORY_UPDATE_FIELDS = (
+    'name',
+    'city',
+    'city_name',
+    'country_name',
+    'rating',
+    'reviews_count',
+    'tours_count',
+    'account',
+    'has_account',
+    'refreshed',
+)
+
+
+class PendingChanges(local):
+    """Ids of changed agencies and tours collected in current thread until commit."""
+
+    def __init__(self) -> None:
+        """Init empty changes."""
+        self.agencies = set()
+        self.tours = set()
+
+
+_pending = PendingChanges()
+
+
+def get_directory_agencies(agencies_ids: Iterable[Any] | None = None) -> models.QuerySet:
+    """Get agencies with summed tours counters in one query.
+
+    Args:
+        agencies_ids: Iterable[Any] | None, optional - ids or ids queryset, all if None.
+
+    Returns:
+        models.QuerySet: annotated agencies.
+    """
+    agencies = Agency.objects.select_related('address__city__country')
+    if agencies_ids is not None:
+        agencies = agencies.filter(id__in=agencies_ids)
+    counters = {
+        field_name: models.Sum(f'tour__{field_name}', default=0)
+        for field_name in RATING_COUNT_FIELDS.values()
+    }
+    return agencies.annotate(
+        tours_count=models.Count('tour'),
+        listed_account_id=models.F('account'),
+        **counters,
+    ).order_by()
+
+
+def make_directory_entry(agency: Agency, refreshed: Any) -> AgencyDirectory:
+    """Make directory entry of agency annotated by get_directory_agencies.
+
+    Args:
+        agency: Agency - annotated agency.
+        refreshed: Any - refresh date and time.
+
+    Returns:
+        AgencyDirectory: unsaved entry.
+    """
+    distribution = {
+        rating: getattr(agency, field_name) for rating, field_name in RATING_COUNT_FIELDS.items()
+    }
+    city = agency.address.city
+    return AgencyDirectory(
+        agency_id=agency.id,
+        name=agency.name,
+        city_id=city.id,
+        city_name=city.name,
+        country_name=city.country.name,
+        rating=get_average_rating(distribution),
+        reviews_count=sum(distribution.values()),
+        tours_count=agency.tours_count,
+        account_id=agency.listed_account_id,
+        has_account=agency.listed_account_id is not None,
+        refreshed=refreshed,
+    )
+
+
+def refresh_agency_directory(
+    agencies_ids: Iterable[Any] | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """Upsert directory entries of agencies in batches.
+
+    Every batch is one INSERT ... ON CONFLICT UPDATE, outside of transaction it is
+    committed at once, so readers are never blocked and see every entry either old or
+    refreshed. Entries of deleted agencies are deleted with them. Batch size is set with
+    AGENCY_DIRECTORY_BATCH_SIZE. Cached agencies pages are invalidated after refresh.
+
+    Args:
+        agencies_ids: Iterable[Any] | None, optional - ids or ids queryset, all if None.
+        batch_size: int | None, optional - entries in batch. Defaults to None.
+
+    Returns:
+        int: count of refreshed entries.
+    """
+    batch_size = batch_size or int(getenv('AGENCY_DIRECTORY_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+    refreshed = get_datetime()
+    agencies = get_directory_agencies(agencies_ids).iterator(chunk_size=batch_size)
+    entries = (make_directory_entry(agency, refreshed) for agency in agencies)
+    refreshed_count = 0
+    batch = list(islice(entries, batch_size))
+    while batch:
+        AgencyDirectory.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['agency'],
+            update_fields=DIRECTORY_UPDATE_FIELDS,
+        )
+        refreshed_count += len(batch)
+        batch = list(islice(entries, batch_size))
+    if refreshed_count:
+        page_cache.invalidate_tags([page_cache.AGENCIES_TAG])
+    return refreshed_count
+
+
+def schedule_agency_refresh(agency_id: Any = None, tour_id: Any = None) -> None:
+    """Refresh directory entry of agency or tour agency after current transaction commit.
+
+    Changes of one transaction are collected, so entry is refreshed once per commit.
+
+    Args:
+        agency_id: Any, optional - changed agency id. Defaults to None.
+        tour_id: Any, optional - id of changed tour of agency. Defaults to None.
+    """
+    if agency_id is not None:
+        _pending.agencies.add(agency_id)
+    if tour_id is not None:
+        _pending.tours.add(tour_id)
+    transaction.on_commit(refresh_pending_agencies)
+
+
+def refresh_pending_agencies() -> int:
+    """Refresh directory entries of agencies changed in committed transaction.
+
+    Returns:
+        int: count of refreshed entries.
+    """
+    agencies_ids = set(_pending.agencies)
+    tours_ids = set(_pending.tours)
+    if not agencies_ids and not tours_ids:
+        return 0
+    _pending.agencies.clear()
+    _pending.tours.clear()
+    changed_agencies = Agency.objects.filter(
+        models.Q(id__in=agencies_ids) | models.Q(tour__in=tours_ids),
+    )
+    return refresh_agency_directory(changed_agencies.values('id'))
@@ -0,0 +1,64 @@
+"""Module with concurrent database reads for async views.
+
+Async ORM of Django 4.2 runs queries of request one by one in its sync thread. Reads
+gathered here run in own threads with own connections, so they wait for database
+together. Connections of these threads are kept for CONN_MAX_AGE like request ones.
+"""
+
+import asyncio
+from contextlib import ExitStack
+from typing import Any, Callable
+
+from asgiref.sync import sync_to_async
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.http import HttpRequest
+
+
+def prepare_reads(request: HttpRequest) -> bool:
+    """Load lazy user of request and check request thread is in transaction.
+
+    User is loaded once here, so reads of other threads do not load it together.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        bool: True if default database connection of request is in transaction.
+    """
+    request.user.is_authenticated  # noqa: B018, WPS428
+    return connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+
+def run_read(read: Callable[[], Any]) -> Any:
+    """Run read in worker thread with its usable connection.
+
+    Args:
+        read: Callable[[], Any] - read function.
+
+    Returns:
+        Any: read result.
+    """
+    close_old_connections()
+    with ExitStack() as cleanup:
+        cleanup.callback(close_old_connections)
+        return read()
+
+
+async def gather_reads(request: HttpRequest, *reads: Callable[[], Any]) -> list[Any]:
+    """Run independent reads of request concurrently.
+
+    Inside transaction, e.g. in tests, reads run one by one in request thread, connections
+    of other threads would not see its changes.
+
+    Args:
+        request: HttpRequest - request from user.
+        reads: Callable[[], Any] - read functions, their results must be fetched data.
+
+    Returns:
+        list[Any]: reads results in order of reads.
+    """
+    if await sync_to_async(prepare_reads)(request):
+        return [await sync_to_async(read)() for read in reads]
+    return await asyncio.gather(*(
+        sync_to_async(run_read, thread_sensitive=False)(read) for read in reads
+    ))
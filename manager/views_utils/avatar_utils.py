@@ -0,0 +1,82 @@
+"""Module with functions for cache effective avatar urls of accounts."""
+
+from os import getenv
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from dotenv import load_dotenv
+
+from ..metrics import count_cache_lookup
+from ..timings import CACHE_PHASE, timed
+
+load_dotenv()
+DEFAULT_CACHE_SECONDS = 600
+DEFAULT_LOCAL_CACHE_SECONDS = 30
+
+
+def get_cache_key(account_id: Any) -> str:
+    """Get cache key of account avatar urls.
+
+    Args:
+        account_id: Any - account id.
+
+    Returns:
+        str: cache key.
+    """
+    return f'avatar-urls:{account_id}'
+
+
+def get_timeout() -> int:
+    """Get timeout of cached avatar urls.
+
+    Avatar urls are made of cached storage urls, which may be half of signed urls
+    lifetime old already, so cached avatar urls live at most a quarter of it.
+    Per process cache is not invalidated by images worker, so its default is short.
+
+    Returns:
+        int: AVATAR_URLS_CACHE_SECONDS, 0 turns cache off.
+    """
+    timeout = DEFAULT_CACHE_SECONDS if settings.SHARED_CACHE else DEFAULT_LOCAL_CACHE_SECONDS
+    timeout = int(getenv('AVATAR_URLS_CACHE_SECONDS', timeout))
+    if getattr(default_storage, 'querystring_auth', False):
+        timeout = min(timeout, default_storage.querystring_expire // 4)
+    return timeout
+
+
+def get_avatar_url(account_id: Any, variant: str, make_url: Callable[[], str]) -> str:
+    """Get avatar url variant from cache or make and cache it.
+
+    All variants of account are kept in one cache entry. Images worker invalidates urls
+    of processed avatars only in shared cache, per process cache entries just expire.
+
+    Args:
+        account_id: Any - account id.
+        variant: str - url variant, e.g. size or srcset.
+        make_url: Callable[[], str] - makes url on cache miss.
+
+    Returns:
+        str: avatar url.
+    """
+    timeout = get_timeout()
+    if timeout <= 0:
+        return make_url()
+    cache_key = get_cache_key(account_id)
+    with timed(CACHE_PHASE):
+        avatar_urls = cache.get(cache_key) or {}
+    count_cache_lookup('avatar_urls', variant in avatar_urls)
+    if variant not in avatar_urls:
+        avatar_urls[variant] = make_url()
+        with timed(CACHE_PHASE):
+            cache.set(cache_key, avatar_urls, timeout)
+    return avatar_urls[variant]
+
+
+def invalidate_avatar_urls(account_ids: Iterable[Any]) -> None:
+    """Forget cached avatar urls of accounts.
+
+    Args:
+        account_ids: Iterable[Any] - accounts ids.
+    """
+    cache.delete_many([get_cache_key(account_id) for account_id in account_ids])
@@ -1,36 +1,186 @@
-"""Module with functions for work with email."""
+"""Module with functions for work with email outbox."""
 
+import logging
+from datetime import timedelta
 from os import getenv
+from smtplib import SMTPException
 
 from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import models, transaction
 from django.utils import html
 from dotenv import load_dotenv
 
+from ..models import OutgoingEmail
+from ..validators import get_datetime
+
 load_dotenv()
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BACKOFF_SECONDS = 30
+DEFAULT_CLAIM_SECONDS = 300
+OUTBOX_UPDATE_FIELDS = ('next_attempt', 'last_error', 'sent')
+
+logger = logging.getLogger(__name__)
 
 
-def send_email(
+def queue_email(
     mail_subject: str,
     message: str,
     recipient_list: list | tuple,
     render_message_to_html: bool = True,
-) -> None:
-    """Send email to the specified address.
+) -> OutgoingEmail:
+    """Put email to the specified address into outbox.
+
+    Email is saved in current transaction and sent by `send_emails` worker.
 
     Args:
         mail_subject: str - subject of email.
         message: str - email message.
         recipient_list: list | tuple - list of recipients.
         render_message_to_html: bool, optional - If needs render message to html. Defaults to True.
+
+    Returns:
+        OutgoingEmail: queued email.
     """
     if render_message_to_html:
         plain_message = html.strip_tags(message)
+        html_message = message
     else:
         plain_message = message
-    mail.send_mail(
-        mail_subject,
-        plain_message,
+        html_message = None
+    return OutgoingEmail.objects.create(
+        subject=mail_subject,
+        plain_message=plain_message,
+        html_message=html_message,
+        recipients=list(recipient_list),
+    )
+
+
+def get_backoff(attempts: int) -> timedelta:
+    """Get delay before next delivery attempt.
+
+    Args:
+        attempts: int - count of failed attempts.
+
+    Returns:
+        timedelta: exponential delay.
+    """
+    backoff_seconds = int(getenv('EMAIL_OUTBOX_BACKOFF_SECONDS', DEFAULT_BACKOFF_SECONDS))
+    return timedelta(seconds=backoff_seconds * 2 ** max(attempts - 1, 0))
+
+
+def _send_message(
+    message: mail.EmailMessage,
+    connection: BaseEmailBackend,
+) -> None:
+    connection.open()
+    message.send()
+
+
+def deliver_email(email: OutgoingEmail, connection: BaseEmailBackend) -> bool:
+    """Send outbox email through reused connection.
+
+    Args:
+        email: OutgoingEmail - email for send.
+        connection: BaseEmailBackend - reused mail connection.
+
+    Returns:
+        bool: True if email was sent.
+    """
+    message = mail.EmailMultiAlternatives(
+        email.subject,
+        email.plain_message,
         getenv('SMTP_FROM_EMAIL'),
-        recipient_list,
-        html_message=message,
+        email.recipients,
+        connection=connection,
     )
+    if email.html_message:
+        message.attach_alternative(email.html_message, 'text/html')
+    try:
+        _send_message(message, connection)
+    except (SMTPException, OSError) as error:
+        connection.close()
+        email.last_error = str(error)
+        email.next_attempt = get_datetime() + get_backoff(email.attempts)
+        return False
+    email.sent = get_datetime()
+    email.last_error = None
+    return True
+
+
+def drop_exhausted_emails(max_attempts: int) -> int:
+    """Delete unsent emails which reached attempts limit and are not claimed by worker.
+
+    Args:
+        max_attempts: int - attempts limit.
+
+    Returns:
+        int: count of deleted emails.
+    """
+    exhausted_emails = OutgoingEmail.objects.filter(
+        sent=None,
+        attempts__gte=max_attempts,
+        next_attempt__lte=get_datetime(),
+    )
+    deleted_count, _ = exhausted_emails.delete()
+    if deleted_count:
+        logger.warning(f'Dropped {deleted_count} undelivered emails after {max_attempts} attempts')
+    return deleted_count
+
+
+def claim_emails(batch_size: int, max_attempts: int) -> list[OutgoingEmail]:
+    """Claim batch of due outbox emails in short transaction.
+
+    Rows are locked with SKIP LOCKED and their next attempt is moved forward by
+    EMAIL_OUTBOX_CLAIM_SECONDS, so other workers skip them while they are sent.
+    Attempt is counted on claim, so email crashing worker is not retried forever.
+
+    Args:
+        batch_size: int - max emails in batch.
+        max_attempts: int - attempts limit.
+
+    Returns:
+        list[OutgoingEmail]: claimed emails.
+    """
+    claim_seconds = int(getenv('EMAIL_OUTBOX_CLAIM_SECONDS', DEFAULT_CLAIM_SECONDS))
+    with transaction.atomic():
+        due_emails = OutgoingEmail.objects.select_for_update(skip_locked=True).filter(
+            sent=None,
+            attempts__lt=max_attempts,
+            next_attempt__lte=get_datetime(),
+        ).order_by('next_attempt')
+        emails = list(due_emails[:batch_size])
+        OutgoingEmail.objects.filter(id__in=[email.id for email in emails]).update(
+            attempts=models.F('attempts') + 1,
+            next_attempt=get_datetime() + timedelta(seconds=claim_seconds),
+        )
+    for email in emails:
+        email.attempts += 1
+    return emails
+
+
+def send_queued_emails(batch_size: int = None, max_attempts: int = None) -> tuple[int, int]:
+    """Send batch of due outbox emails over one reused connection.
+
+    Emails are claimed and committed before sending, so no locks are held during SMTP
+    and several workers can drain outbox at once. Exhausted emails are dropped.
+
+    Args:
+        batch_size: int, optional - max emails in batch. Defaults to EMAIL_OUTBOX_BATCH_SIZE.
+        max_attempts: int, optional - attempts limit. Defaults to EMAIL_OUTBOX_MAX_ATTEMPTS.
+
+    Returns:
+        tuple[int, int]: count of sent and failed emails.
+    """
+    batch_size = batch_size or int(getenv('EMAIL_OUTBOX_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+    max_attempts = max_attempts or int(getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS))
+    drop_exhausted_emails(max_attempts)
+    emails = claim_emails(batch_size, max_attempts)
+    if not emails:
+        return 0, 0
+    connection = mail.get_connection()
+    sent_count = sum(deliver_email(email, connection) for email in emails)
+    connection.close()
+    OutgoingEmail.objects.bulk_update(emails, OUTBOX_UPDATE_FIELDS)
+    return sent_count, len(emails) - sent_count
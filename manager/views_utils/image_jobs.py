@@ -0,0 +1,168 @@
+"""Module with functions for process uploaded images in background."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from os import getenv
+from types import MappingProxyType
+from typing import Any
+
+from django.db import connection, transaction
+from dotenv import load_dotenv
+
+from ..models import Account, ImageJob, Tour
+from ..validators import get_datetime
+from . import avatar_utils, renditions
+
+load_dotenv()
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BACKOFF_SECONDS = 30
+DEFAULT_WORKERS = 4
+JOB_UPDATE_FIELDS = ('obsolete_files', 'attempts', 'next_attempt', 'last_error', 'processed')
+IMAGE_MODELS = MappingProxyType({
+    'tour': Tour,
+    'account': Account,
+})
+
+
+def queue_image_job(instance: Tour | Account, obsolete_files: list[str]) -> ImageJob:
+    """Queue renditions of instance avatar and deletion of obsolete files.
+
+    Job is saved in current transaction and processed by `process_images` worker.
+
+    Args:
+        instance: Tour | Account - instance with changed avatar.
+        obsolete_files: list[str] - storage names of files for delete.
+
+    Returns:
+        ImageJob: queued job.
+    """
+    return ImageJob.objects.create(
+        target_model=type(instance).__name__.lower(),
+        target_id=instance.id,
+        image=instance.avatar.name or '',
+        obsolete_files=obsolete_files,
+    )
+
+
+def get_backoff(attempts: int) -> timedelta:
+    """Get delay before next processing attempt.
+
+    Args:
+        attempts: int - count of failed attempts.
+
+    Returns:
+        timedelta: exponential delay.
+    """
+    backoff_seconds = int(getenv('IMAGE_JOBS_BACKOFF_SECONDS', DEFAULT_BACKOFF_SECONDS))
+    return timedelta(seconds=backoff_seconds * 2 ** max(attempts - 1, 0))
+
+
+def store_renditions(model: type, target_id: Any, image: str, new_renditions: dict) -> bool:
+    """Save renditions names if instance still has the same image, delete them otherwise.
+
+    Args:
+        model: type - Tour or Account.
+        target_id: Any - instance id.
+        image: str - storage name of rendered image.
+        new_renditions: dict - renditions names by widths.
+
+    Returns:
+        bool: True if renditions were saved.
+    """
+    updated_count = model.objects.filter(id=target_id, avatar=image).update(
+        avatar_renditions=new_renditions,
+    )
+    if not updated_count:
+        renditions.delete_renditions(model.avatar.field.storage, new_renditions)
+    elif model is Account:
+        avatar_utils.invalidate_avatar_urls([target_id])
+    return bool(updated_count)
+
+
+def _make_renditions(job: ImageJob) -> None:
+    model = IMAGE_MODELS[job.target_model]
+    if not model.objects.filter(id=job.target_id, avatar=job.image).exists():
+        return
+    new_renditions = renditions.create_renditions(
+        model.avatar.field.storage, job.image, model.rendition_widths,
+    )
+    store_renditions(model, job.target_id, job.image, new_renditions)
+
+
+def _run_job(job: ImageJob) -> None:
+    storage = IMAGE_MODELS[job.target_model].avatar.field.storage
+    for file_name in job.obsolete_files:
+        storage.delete(file_name)
+    job.obsolete_files = []
+    if job.image:
+        _make_renditions(job)
+
+
+def process_image_job(job: ImageJob) -> bool:
+    """Delete obsolete files and make renditions of job image.
+
+    Jobs of replaced images are skipped, images which can not be decoded are not retried.
+
+    Args:
+        job: ImageJob - job for process.
+
+    Returns:
+        bool: True if job was processed.
+    """
+    job.attempts += 1
+    try:
+        _run_job(job)
+    except renditions.INVALID_IMAGE_ERRORS as error:
+        job.last_error = str(error)
+        job.processed = get_datetime()
+        return False
+    except Exception as error:
+        job.last_error = str(error)
+        job.next_attempt = get_datetime() + get_backoff(job.attempts)
+        return False
+    job.last_error = None
+    job.processed = get_datetime()
+    return True
+
+
+def _process_in_thread(job: ImageJob) -> bool:
+    processed = process_image_job(job)
+    connection.close()
+    return processed
+
+
+def process_image_jobs(
+    batch_size: int = None,
+    max_attempts: int = None,
+    workers: int = None,
+) -> tuple[int, int]:
+    """Process batch of due image jobs on a pool of worker threads.
+
+    Rows are locked with SKIP LOCKED, so several workers can drain jobs at once.
+
+    Args:
+        batch_size: int, optional - max jobs in batch. Defaults to IMAGE_JOBS_BATCH_SIZE.
+        max_attempts: int, optional - attempts limit. Defaults to IMAGE_JOBS_MAX_ATTEMPTS.
+        workers: int, optional - threads, 1 for caller thread. Defaults to IMAGE_JOBS_WORKERS.
+
+    Returns:
+        tuple[int, int]: count of processed and failed jobs.
+    """
+    batch_size = batch_size or int(getenv('IMAGE_JOBS_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+    max_attempts = max_attempts or int(getenv('IMAGE_JOBS_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS))
+    workers = workers or int(getenv('IMAGE_JOBS_WORKERS', DEFAULT_WORKERS))
+    with transaction.atomic():
+        due_jobs = ImageJob.objects.select_for_update(skip_locked=True).filter(
+            processed=None,
+            attempts__lt=max_attempts,
+            next_attempt__lte=get_datetime(),
+        ).order_by('next_attempt')
+        jobs = list(due_jobs[:batch_size])
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                processed_count = sum(pool.map(_process_in_thread, jobs))
+        else:
+            processed_count = sum(map(process_image_job, jobs))
+        ImageJob.objects.bulk_update(jobs, JOB_UPDATE_FIELDS)
+    return processed_count, len(jobs) - processed_count
@@ -0,0 +1,237 @@
+"""Module with full page cache of anonymous requests.
+
+Page key is made of path, normalized query string and versions of page tags. Signals
+change versions of tags of changed data after commit, so cached pages are invalidated by
+data changes. Bulk writes, which bypass signals, invalidate their tags themselves. Workers
+and commands change versions in shared cache only, so it is off by default with LocMem.
+Timeout, PAGE_CACHE_SECONDS, keeps only signed storage urls of cached pages valid, 0
+turns cache off.
+"""
+
+import hashlib
+from functools import partial, update_wrapper
+from typing import Any, Callable, Iterable
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+
+from .. import metrics, timings
+
+PAGES_TAG = 'pages'
+TOURS_TAG = 'tours'
+AGENCIES_TAG = 'agencies'
+TOUR_TAG = 'tour:{uuid}'
+MESSAGES_COOKIE = 'messages'
+TAG_KEY = 'page-tag:{0}'
+OK_STATUS = 200
+
+
+def get_tags_versions(tags: Iterable[str]) -> list[str]:
+    """Get versions of tags, missing tag gets new version, so evicted tag never goes back.
+
+    Args:
+        tags: Iterable[str] - tags names.
+
+    Returns:
+        list[str]: versions in order of tags.
+    """
+    tags_keys = [TAG_KEY.format(tag) for tag in tags]
+    versions = cache.get_many(tags_keys)
+    for tag_key in tags_keys:
+        if tag_key not in versions:
+            cache.add(tag_key, uuid4().hex, None)
+            versions[tag_key] = cache.get(tag_key, '')
+    return [versions[version_key] for version_key in tags_keys]
+
+
+def invalidate_tags(tags: Iterable[str]) -> None:
+    """Change versions of tags, pages with them are not found in cache anymore.
+
+    Args:
+        tags: Iterable[str] - tags names.
+    """
+    new_versions = {TAG_KEY.format(tag): uuid4().hex for tag in tags}
+    cache.set_many(new_versions, None)
+
+
+def schedule_invalidation(*tags: str) -> None:
+    """Invalidate tags after commit, page rendered before it would be cached as fresh.
+
+    Args:
+        tags: str - tags names.
+    """
+    transaction.on_commit(partial(invalidate_tags, tags))
+
+
+def schedule_tours_invalidation(tours_ids: Iterable[Any]) -> None:
+    """Invalidate tours list and pages of tours after commit.
+
+    Args:
+        tours_ids: Iterable[Any] - tours ids.
+    """
+    schedule_invalidation(TOURS_TAG, *(TOUR_TAG.format(uuid=tour_id) for tour_id in tours_ids))
+
+
+def get_timeout() -> int:
+    """Get timeout of cached pages.
+
+    Returns:
+        int: PAGE_CACHE_SECONDS, but at most half of signed urls lifetime.
+    """
+    timeout = settings.PAGE_CACHE_SECONDS
+    if getattr(default_storage, 'querystring_auth', False):
+        timeout = min(timeout, default_storage.querystring_expire // 2)
+    return timeout
+
+
+def get_page_key(request: HttpRequest, tags: Iterable[str]) -> str:
+    """Get cache key of page.
+
+    Args:
+        request: HttpRequest - request from user.
+        tags: Iterable[str] - tags of page data.
+
+    Returns:
+        str: cache key.
+    """
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    versions = ':'.join(get_tags_versions(tags))
+    page_key = f'{request.path}?{query}#{versions}'.encode()
+    key_hash = hashlib.sha256(page_key).hexdigest()
+    return f'page:{key_hash}'
+
+
+def get_cached_page(request: HttpRequest, tags: Iterable[str]) -> tuple[str, HttpResponse | None]:
+    """Get cached page of request.
+
+    Args:
+        request: HttpRequest - request from user.
+        tags: Iterable[str] - tags of page data.
+
+    Returns:
+        tuple[str, HttpResponse | None]: page cache key and page, None if it is not cached.
+    """
+    with timings.timed(timings.CACHE_PHASE):
+        page_key = get_page_key(request, tags)
+        response = cache.get(page_key)
+    metrics.count_cache_lookup('pages', response is not None)
+    return page_key, response
+
+
+def cache_page(page_key: str, request: HttpRequest, response: HttpResponse) -> None:
+    """Cache successful page which sets no cookies and has no CSRF token.
+
+    Args:
+        page_key: str - page cache key.
+        request: HttpRequest - request from user.
+        response: HttpResponse - rendered page.
+    """
+    is_cacheable = response.status_code == OK_STATUS and not response.streaming
+    is_shared = not response.cookies and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    if is_cacheable and is_shared:
+        with timings.timed(timings.CACHE_PHASE):
+            cache.set(page_key, response, get_timeout())
+
+
+class AnonymousPageCache:
+    """Sync or async view wrapper which serves anonymous requests from page cache."""
+
+    def __init__(self, view: Callable, tags: tuple[str, ...]) -> None:
+        """Wrap view.
+
+        Args:
+            view: Callable - page view.
+            tags: tuple[str, ...] - tags of page data, formatted with view arguments.
+        """
+        self.view = view
+        self.tags = tags
+        update_wrapper(self, view)
+        if iscoroutinefunction(view):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Serve page from cache or render and cache it.
+
+        Args:
+            request: HttpRequest - request from user.
+            args: Any - view arguments.
+            kwargs: Any - view key word arguments.
+
+        Returns:
+            Any: page or awaitable page of async view.
+        """
+        if iscoroutinefunction(self):
+            return self.serve_async(request, *args, **kwargs)
+        if not self.is_enabled(request):
+            return self.view(request, *args, **kwargs)
+        page_key, response = get_cached_page(request, self.format_tags(kwargs))
+        if response is None:
+            response = self.view(request, *args, **kwargs)
+            cache_page(page_key, request, response)
+        return response
+
+    async def serve_async(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Serve page of async view from cache or render and cache it.
+
+        Args:
+            request: HttpRequest - request from user.
+            args: Any - view arguments.
+            kwargs: Any - view key word arguments.
+
+        Returns:
+            HttpResponse: page.
+        """
+        if not self.is_enabled(request):
+            return await self.view(request, *args, **kwargs)
+        page_tags = self.format_tags(kwargs)
+        page_key, response = await sync_to_async(get_cached_page)(request, page_tags)
+        if response is None:
+            response = await self.view(request, *args, **kwargs)
+            await sync_to_async(cache_page)(page_key, request, response)
+        return response
+
+    def is_enabled(self, request: HttpRequest) -> bool:
+        """Check page of request may be served from cache.
+
+        Page is the same for all GET requests without session and messages.
+
+        Args:
+            request: HttpRequest - request from user.
+
+        Returns:
+            bool: True if cache is on and request is anonymous.
+        """
+        cookies = request.COOKIES
+        if settings.PAGE_CACHE_SECONDS <= 0 or request.method != 'GET':
+            return False
+        return settings.SESSION_COOKIE_NAME not in cookies and MESSAGES_COOKIE not in cookies
+
+    def format_tags(self, view_kwargs: dict) -> list[str]:
+        """Format tags of requested page with view key word arguments, e.g. url uuid.
+
+        Args:
+            view_kwargs: dict - view key word arguments.
+
+        Returns:
+            list[str]: tags of page and tag of all pages.
+        """
+        return [PAGES_TAG, *(tag.format(**view_kwargs) for tag in self.tags)]
+
+
+def cache_anonymous_page(*tags: str) -> Callable[[Callable], AnonymousPageCache]:
+    """Cache page of decorated view for anonymous requests.
+
+    Args:
+        tags: str - tags of page data, e.g. tour:{uuid} with view argument.
+
+    Returns:
+        Callable[[Callable], AnonymousPageCache]: view decorator.
+    """
+    return partial(AnonymousPageCache, tags=tags)
@@ -0,0 +1,80 @@
+"""Module with tabs of profile page rendered inline or by partial endpoints."""
+
+from django.http import HttpRequest, HttpResponseRedirect
+from django.urls import reverse
+
+from ..models import Account, AgencyRequests, Review, Tour
+from . import requests_list_manager, reviews_list_manager, tours_list_manager
+from .read_pages import TOUR_ADDRESSES_PREFETCH
+
+PROFILE_ACCOUNTS = Account.objects.select_related('account', 'agency')
+
+
+def get_profile_account(request: HttpRequest, username: str | None = None) -> Account | None:
+    """Get account of profile in one query.
+
+    Args:
+        request: HttpRequest - request from user.
+        username: str | None, optional - profile username, request user if None.
+
+    Returns:
+        Account | None: account or None if it does not exist or user is anonymous.
+    """
+    if username:
+        return PROFILE_ACCOUNTS.filter(account__username=username).first()
+    if not request.user.is_authenticated:
+        return None
+    return PROFILE_ACCOUNTS.filter(account=request.user).first()
+
+
+def render_tours_tab(request: HttpRequest, account: Account) -> str:
+    """Render requested page of agency tours.
+
+    Args:
+        request: HttpRequest - request from user.
+        account: Account - agency account.
+
+    Returns:
+        str: rendered tours block.
+    """
+    tours_data = Tour.objects.filter(agency=account.agency_id)
+    tours_data = tours_data.prefetch_related(TOUR_ADDRESSES_PREFETCH)
+    tours_manager = tours_list_manager.ToursListManager(request, tours_data)
+    return tours_manager.render_tours_block()
+
+
+def render_reviews_tab(request: HttpRequest, account: Account) -> str | HttpResponseRedirect:
+    """Render requested page of account reviews.
+
+    Args:
+        request: HttpRequest - request from user.
+        account: Account - reviews author.
+
+    Returns:
+        str | HttpResponseRedirect: rendered reviews block or redirect after review change.
+    """
+    reviews = reviews_list_manager.AccountReviewsListManager(
+        request,
+        Review.objects.filter(account=account),
+        reverse('my_profile'),
+    )
+    return reviews.render_reviews_block(display=True, check_user_review=False)
+
+
+def render_requests_tab(request: HttpRequest) -> str | HttpResponseRedirect:
+    """Render requested page of agency requests for staff.
+
+    Args:
+        request: HttpRequest - request from staff user.
+
+    Returns:
+        str | HttpResponseRedirect: rendered requests block or redirect after request review.
+    """
+    agency_requests = AgencyRequests.objects.select_related(
+        'account__account', 'agency__address__city',
+    ).order_by('id')
+    requests_manager = requests_list_manager.AgencyRequestsListManager(
+        request,
+        agency_requests,
+    )
+    return requests_manager.render_agency_requests_block()
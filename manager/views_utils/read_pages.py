@@ -0,0 +1,170 @@
+"""Module with reads and renders of tours, tour and agencies pages.
+
+Sync views call them in order, async views gather independent reads concurrently.
+"""
+
+from os import getenv
+from uuid import UUID
+
+from django.core.paginator import Paginator
+from django.forms import Form
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import render
+from dotenv import load_dotenv
+
+from ..models import AgencyDirectory, Tour
+from . import page_utils, tours_list_manager
+
+load_dotenv()
+DEFAULT_AGECIES_PER_PAGE = 15
+STYLE_FILES_LITERAL = 'style_files'
+HEADER_CSS = 'css/header.css'
+BODY_CSS = 'css/body.css'
+RATING_CSS = 'css/rating.css'
+AVATAR_CSS = 'css/avatar.css'
+TOUR_ADDRESSES_PREFETCH = 'addresses__city__country'
+
+
+def render_tours_block(request: HttpRequest) -> str:
+    """Render requested page of filtered tours.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        str: rendered block.
+    """
+    tours_data = Tour.objects.prefetch_related(TOUR_ADDRESSES_PREFETCH)
+    tours_data = tours_list_manager.filter_tours(request, tours_data)
+    return tours_list_manager.ToursListManager(request, tours_data).render_tours_block()
+
+
+def render_tours_page(request: HttpRequest, tours_block: str, form: Form) -> HttpResponse:
+    """Render tours page.
+
+    Args:
+        request: HttpRequest - request from user.
+        tours_block: str - rendered tours block.
+        form: Form - tours search form.
+
+    Returns:
+        HttpResponse: rendered template.
+    """
+    return render(
+        request,
+        'pages/tours.html',
+        {
+            'form': form,
+            'tours_block': tours_block,
+            STYLE_FILES_LITERAL: [
+                HEADER_CSS,
+                BODY_CSS,
+                'css/search_tours.css',
+                RATING_CSS,
+                AVATAR_CSS,
+            ],
+        },
+    )
+
+
+def get_tour(uuid: UUID) -> Tour | None:
+    """Get tour with agency account and addresses.
+
+    Args:
+        uuid: UUID - tour id.
+
+    Returns:
+        Tour | None: tour, None if it does not exist.
+    """
+    tour_data = Tour.objects.select_related('agency__account__account')
+    return tour_data.prefetch_related(TOUR_ADDRESSES_PREFETCH).filter(id=uuid).first()
+
+
+def render_tour_page(request: HttpRequest, tour: Tour, reviews: str) -> HttpResponse:
+    """Render tour page.
+
+    Args:
+        request: HttpRequest - request from user.
+        tour: Tour - tour.
+        reviews: str - rendered reviews block.
+
+    Returns:
+        HttpResponse: rendered template.
+    """
+    return render(
+        request,
+        'pages/tour.html',
+        {
+            'reviews': reviews,
+            'tour': tour,
+            'request': request,
+            STYLE_FILES_LITERAL: [
+                HEADER_CSS,
+                BODY_CSS,
+                'css/tour.css',
+                RATING_CSS,
+                AVATAR_CSS,
+            ],
+        },
+    )
+
+
+def get_agencies_page(request: HttpRequest) -> dict:
+    """Get requested page of agencies directory with pages navigation.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        dict: fetched agencies page and pages data.
+    """
+    page = int(request.GET.get('page', 1))
+    agencies_data = AgencyDirectory.objects.filter(has_account=True)
+    if request.GET.get('city'):
+        agencies_data = agencies_data.filter(city=request.GET.get('city'))
+    agencies_data = agencies_data.select_related('account__account').order_by('name')
+    agencies_paginator = Paginator(
+        agencies_data,
+        int(getenv('AGENCIES_PER_PAGE', DEFAULT_AGECIES_PER_PAGE)),
+    )
+    agencies_page = agencies_paginator.get_page(page)
+    agencies_page.object_list = list(agencies_page.object_list)
+    total_pages = int(agencies_paginator.num_pages)
+    return {
+        'agencies_data': agencies_page,
+        'pages': {
+            'current': page,
+            'total': total_pages,
+            'slice': page_utils.get_pages_slice(page, total_pages),
+        },
+    }
+
+
+def render_agencies_page(request: HttpRequest, agencies_page: dict, form: Form) -> HttpResponse:
+    """Render agencies page.
+
+    Args:
+        request: HttpRequest - request from user.
+        agencies_page: dict - agencies page and pages data.
+        form: Form - agencies search form.
+
+    Returns:
+        HttpResponse: rendered template.
+    """
+    return render(
+        request,
+        'pages/agencies.html',
+        {
+            'form': form,
+            **agencies_page,
+            STYLE_FILES_LITERAL: [
+                HEADER_CSS,
+                BODY_CSS,
+                'css/agencies.css',
+                'css/search_agencies.css',
+                RATING_CSS,
+                AVATAR_CSS,
+                'css/pages.css',
+            ],
+        },
+    )
@@ -0,0 +1,117 @@
+"""Module with functions for make WebP renditions of uploaded images."""
+
+import io
+from pathlib import PurePosixPath
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+RENDITIONS_DIR = 'renditions'
+WEBP_QUALITY = 80
+INVALID_IMAGE_ERRORS = (UnidentifiedImageError, Image.DecompressionBombError)
+
+
+def get_rendition_name(original_name: str, width: int) -> str:
+    """Get storage name of rendition next to the original.
+
+    Args:
+        original_name: str - storage name of original image.
+        width: int - rendition width.
+
+    Returns:
+        str: rendition name, e.g. covers/renditions/name_320.webp.
+    """
+    original_path = PurePosixPath(original_name)
+    file_name = f'{original_path.stem}_{width}.webp'
+    return str(original_path.parent / RENDITIONS_DIR / file_name)
+
+
+def render_webp(image: Image.Image, width: int) -> bytes:
+    """Resize image to width keeping aspect ratio and encode as WebP.
+
+    Args:
+        image: Image - decoded image.
+        width: int - rendition width.
+
+    Returns:
+        bytes: encoded rendition.
+    """
+    height = max(round(image.height * width / image.width), 1)
+    rendition = image.resize((width, height), Image.Resampling.LANCZOS)
+    output = io.BytesIO()
+    rendition.save(output, 'WEBP', quality=WEBP_QUALITY, method=4)
+    return output.getvalue()
+
+
+def open_image(storage: Storage, name: str) -> Image.Image:
+    """Decode stored image applying EXIF orientation.
+
+    Args:
+        storage: Storage - storage with image.
+        name: str - image storage name.
+
+    Returns:
+        Image: decoded RGB or RGBA image.
+    """
+    with storage.open(name, 'rb') as raw_image:
+        image = ImageOps.exif_transpose(Image.open(raw_image))
+        image.load()
+    if image.mode not in {'RGB', 'RGBA'}:
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    return image
+
+
+def create_renditions(
+    storage: Storage,
+    original_name: str,
+    widths: tuple[int, ...],
+) -> dict[str, str]:
+    """Make WebP renditions of image and store them next to the original.
+
+    Images are never upscaled, widths above original width give one original width rendition.
+
+    Args:
+        storage: Storage - storage with image.
+        original_name: str - image storage name.
+        widths: tuple[int, ...] - renditions widths.
+
+    Returns:
+        dict[str, str]: renditions names by widths.
+    """
+    image = open_image(storage, original_name)
+    renditions = {}
+    for width in sorted({min(max_width, image.width) for max_width in widths}):
+        name = get_rendition_name(original_name, width)
+        storage.delete(name)
+        rendition = ContentFile(render_webp(image, width))
+        renditions[str(width)] = storage.save(name, rendition)
+    return renditions
+
+
+def delete_renditions(storage: Storage, renditions: dict[str, str]) -> None:
+    """Delete stored renditions.
+
+    Args:
+        storage: Storage - storage with renditions.
+        renditions: dict[str, str] - renditions names by widths.
+    """
+    for name in renditions.values():
+        storage.delete(name)
+
+
+def pick_rendition(renditions: dict[str, str], size: int) -> str | None:
+    """Pick smallest rendition not narrower than size, or the widest one.
+
+    Args:
+        renditions: dict[str, str] - renditions names by widths.
+        size: int - displayed width in pixels.
+
+    Returns:
+        str | None: rendition name, None if there are no renditions.
+    """
+    if not renditions:
+        return None
+    widths = sorted(int(width) for width in renditions)
+    fitting_widths = [width for width in widths if width >= size]
+    return renditions[str(fitting_widths[0] if fitting_widths else widths[-1])]
@@ -1,19 +1,81 @@
 """Module for work with agency requests list."""
 
+from contextlib import suppress
+from functools import partial
 from os import getenv
+from uuid import UUID
 
-from django.core.paginator import Paginator
-from django.http import HttpRequest
+from django.core import exceptions, paginator
+from django.db import models, transaction
+from django.http import HttpRequest, HttpResponseRedirect
 from django.shortcuts import redirect
 from django.template.loader import render_to_string
-from django.urls import reverse
 from dotenv import load_dotenv
 
-from ..models import Account, AgencyRequests
-from .page_utils import get_pages_slice
+from ..models import Account, Agency, AgencyRequests, Tour
+from . import agency_directory, page_cache, page_utils, tour_utils
 
 load_dotenv()
 DEFAULT_REQUESTS_PER_PAGE = 15
+AGENCY_REQUESTS_LABEL = 'manager.AgencyRequests'
+MODERATION_ACTIONS = ('accept', 'decline')
+
+
+def get_accounts_ids(posted_ids: list[str]) -> list[UUID]:
+    """Get accounts ids of requests from posted form skipping malformed ones.
+
+    Args:
+        posted_ids: list[str] - posted ids of requests accounts.
+
+    Returns:
+        list[UUID]: accounts ids.
+    """
+    accounts_ids = []
+    for posted_id in posted_ids:
+        with suppress(ValueError):
+            accounts_ids.append(UUID(posted_id))
+    return accounts_ids
+
+
+@transaction.atomic
+def accept_agency_requests(accounts_ids: list[UUID]) -> int:
+    """Link accounts with agencies of their requests and delete requests.
+
+    Reviews of linked accounts are not counted in tours ratings anymore.
+
+    Args:
+        accounts_ids: list[UUID] - ids of requests accounts.
+
+    Returns:
+        int: count of accepted requests.
+    """
+    agency_requests = AgencyRequests.objects.filter(account__in=accounts_ids)
+    requested_agency = agency_requests.filter(account=models.OuterRef('pk'))
+    requested_agency = requested_agency.values('agency')[:1]
+    Account.objects.filter(id__in=agency_requests.values('account')).update(
+        agency=models.Subquery(requested_agency),
+    )
+    agencies_ids = list(agency_requests.values_list('agency', flat=True))
+    for agency_id in agencies_ids:
+        agency_directory.schedule_agency_refresh(agency_id=agency_id)
+    agencies_tours = Tour.objects.filter(agency__in=agencies_ids).values_list('id', flat=True)
+    page_cache.schedule_tours_invalidation(agencies_tours)
+    transaction.on_commit(partial(tour_utils.refresh_reviewed_tours_counts, accounts_ids))
+    return agency_requests.delete()[1].get(AGENCY_REQUESTS_LABEL, 0)
+
+
+@transaction.atomic
+def decline_agency_requests(accounts_ids: list[UUID]) -> int:
+    """Delete requested agencies with their requests.
+
+    Args:
+        accounts_ids: list[UUID] - ids of requests accounts.
+
+    Returns:
+        int: count of declined requests.
+    """
+    agencies = Agency.objects.filter(request__account__in=accounts_ids)
+    return agencies.delete()[1].get(AGENCY_REQUESTS_LABEL, 0)
 
 
 class AgencyRequestsListManager:
@@ -22,17 +84,17 @@ class AgencyRequestsListManager:
     def __init__(
         self,
         request: HttpRequest,
-        agency_requests: list[AgencyRequests] | tuple[AgencyRequests],
+        agency_requests: models.QuerySet | list[AgencyRequests] | tuple[AgencyRequests],
     ) -> None:
         """Init method.
 
         Args:
             request: HttpRequest - request from user.
-            agency_requests: list[AgencyRequests] | tuple[AgencyRequests] - agencies requests.
+            agency_requests: QuerySet | list | tuple - agencies requests, queryset is paged lazily.
         """
         self.request = request
         self.agency_requests = agency_requests
-        self.paginator = Paginator(
+        self.paginator = paginator.Paginator(
             agency_requests,
             getenv('REQUESTS_PER_PAGE', DEFAULT_REQUESTS_PER_PAGE),
         )
@@ -76,43 +138,37 @@ class AgencyRequestsListManager:
             request=self.request,
         )
 
-    def render_agency_requests_block(self) -> str:
-        """Render block of agencies requests list.
+    def render_agency_requests_block(self) -> str | HttpResponseRedirect:
+        """Render block of agencies requests list or moderate posted requests.
 
         Returns:
-            str: rendered block.
+            str | HttpResponseRedirect: rendered block or redirect after moderation.
+
+        Raises:
+            PermissionDenied: if requests are moderated by user who is not staff.
         """
-        if self.request.method == 'POST':
-            redirect_link = reverse('my_profile')
-            if 'accept' in self.request.POST.keys():
-                account_id = self.request.POST.get('id')
-                account = Account.objects.filter(id=account_id).first()
-                agency_request = AgencyRequests.objects.filter(account=account).first()
-                if agency_request:
-                    account.agency = agency_request.agency
-                    account.save()
-                    agency_request.delete()
-                    return redirect(redirect_link)
-                return redirect(redirect_link)
-            if 'decline' in self.request.POST.keys():
-                account_id = self.request.POST.get('id')
-                account = Account.objects.filter(id=account_id).first()
-                agency_request = AgencyRequests.objects.filter(account=account).first()
-                if agency_request:
-                    agency_request.agency.delete()
-                    agency_request.delete()
-                    return redirect(redirect_link)
-                return redirect(redirect_link)
+        post_request = self.request.POST
+        moderated = any(action in post_request for action in MODERATION_ACTIONS)
+        if self.request.method == 'POST' and moderated:
+            if not self.request.user.is_staff:
+                raise exceptions.PermissionDenied()
+            accounts_ids = get_accounts_ids(post_request.getlist('id'))
+            if 'accept' in post_request:
+                accept_agency_requests(accounts_ids)
+            else:
+                decline_agency_requests(accounts_ids)
+            return redirect('my_profile')
         page = int(self.request.GET.get('r_page', 1))
         agency_requests_list = self.render_agency_requests_list(page=page)
         num_pages = int(self.paginator.num_pages)
-        pages_slice = get_pages_slice(page, num_pages)
+        pages_slice = page_utils.get_pages_slice(page, num_pages)
         pages_slice = ''.join(pages_slice)
         return render_to_string(
             'parts/agency_requests_block.html',
             {
                 'request': self.request,
                 'agency_requests_list': agency_requests_list,
+                'requests_count': self.paginator.count,
                 'pages': {
                     'current': page,
                     'total': num_pages,
@@ -121,6 +177,7 @@ class AgencyRequestsListManager:
                 'style_files': [
                     'css/tours.css',
                     'css/pages.css',
+                    'css/agency_requests.css',
                 ],
             },
             request=self.request,
@@ -0,0 +1,127 @@
+"""Module for handling forms of request user reviews."""
+
+from django.core.paginator import Page
+from django.http import HttpRequest, HttpResponseRedirect
+from django.shortcuts import redirect
+from django.template.loader import render_to_string
+
+from ..forms import UserReviewForm
+from ..models import Account, Review, Tour
+from ..validators import get_datetime
+from . import errors_utils
+
+
+class ReviewForms:
+    """Class for create, edit and delete reviews of request user."""
+
+    def __init__(self, request: HttpRequest, redirect_url: str) -> None:
+        """Init method.
+
+        Args:
+            request: HttpRequest - request from user.
+            redirect_url: str - url for redirect after review change.
+        """
+        self.request = request
+        self.redirect_url = redirect_url
+        self.account = None
+
+    def render_not_existing_review(self, tour: Tour) -> str | HttpResponseRedirect:
+        """Render card for not existing review or create it by POST data.
+
+        Args:
+            tour: Tour - tour for connect with review form.
+
+        Returns:
+            str | HttpResponseRedirect: rendered card or redirect after review create.
+        """
+        errors = {}
+        account = self.account
+        if account is None:
+            account = Account.objects.filter(account=self.request.user).first()
+        if self.request.method == 'POST':
+            form = UserReviewForm(self.request.POST)
+            if form.is_valid():
+                Review.objects.create(
+                    tour=tour,
+                    account=account,
+                    rating=form.cleaned_data['rating'],
+                    text=form.cleaned_data['text'],
+                )
+                return redirect(f'{self.redirect_url}#reviews')
+            errors = errors_utils.convert_errors(form.errors.as_data())
+        else:
+            form = UserReviewForm()
+        return render_to_string(
+            'parts/not_created_review.html',
+            {
+                'errors': errors,
+                'form': form.my_render(self.request, errors=errors),
+                'account': account,
+                'style_files': [
+                    'css/rating.css',
+                    'css/review_create.css',
+                ],
+            },
+            request=self.request,
+        )
+
+    def handle_review_post(self, review: Review) -> HttpResponseRedirect | dict:
+        """Delete or edit review of request user by POST data.
+
+        Args:
+            review: Review - review owned by request user.
+
+        Returns:
+            HttpResponseRedirect | dict: redirect if review changed, else form errors.
+        """
+        review_id = str(review.id)
+        post_data = self.request.POST
+        is_owner = review.account.account_id == self.request.user.id
+        if is_owner and post_data.get('delete') == review_id:
+            review.delete()
+            return redirect(self.redirect_url)
+        is_edited = 'delete' not in post_data and post_data.get('review', review_id) == review_id
+        if not (is_owner and is_edited):
+            return {}
+        form = UserReviewForm(post_data)
+        if form.is_valid():
+            review.rating = form.cleaned_data['rating']
+            review.text = form.cleaned_data['text']
+            review.edited = get_datetime()
+            review.save()
+            return redirect(self.redirect_url)
+        return errors_utils.convert_errors(form.errors.as_data())
+
+    def render_review_form(self, review: Review, errors: dict = None) -> str:
+        """Render edit form for review.
+
+        Args:
+            review: Review - review for init form data.
+            errors: dict, optional - errors of posted edit. Defaults to None.
+
+        Returns:
+            str: rendered form.
+        """
+        initial_data = {'rating': review.rating, 'text': review.text}
+        return UserReviewForm(initial=initial_data).my_render(self.request, review, errors)
+
+    def render_edit_forms(self, reviews_page: Page) -> dict | HttpResponseRedirect:
+        """Render edit forms only for reviews of request user.
+
+        Args:
+            reviews_page: Page - page with reviews.
+
+        Returns:
+            dict | HttpResponseRedirect: forms by review id or redirect after review change.
+        """
+        edit_forms = {}
+        for review in reviews_page:
+            if review.account.account_id != self.request.user.id:
+                continue
+            errors = {}
+            if self.request.method == 'POST':
+                errors = self.handle_review_post(review)
+                if isinstance(errors, HttpResponseRedirect):
+                    return errors
+            edit_forms[review.id] = self.render_review_form(review, errors)
+        return edit_forms
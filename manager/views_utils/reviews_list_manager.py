@@ -3,111 +3,66 @@
 from os import getenv
 
 from django.core.paginator import Paginator
+from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponseRedirect
-from django.shortcuts import redirect
 from django.template.loader import render_to_string
-from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from dotenv import load_dotenv
 
-from ..forms import UserReviewForm
-from ..models import Account, Review, Tour
-from ..validators import get_datetime
-from . import errors_utils, page_utils
+from ..models import Review, Tour
+from . import page_utils
+from .review_forms import ReviewForms
 
 load_dotenv()
 DEFAULT_REVIEWS_PER_PAGE = 10
+REVIEWS_ORDERING = ('-created', 'id')
+STYLE_FILES_LITERAL = 'style_files'
+REVIEW_STYLE_FILES = (
+    'css/rating.css',
+    'css/review_create.css',
+    'css/review_edit.css',
+)
 
 
 class ReviewsListManager:
     """Class for working with reviews list."""
 
+    review_template_name = 'parts/review.html'
+
     def __init__(
         self,
         request: HttpRequest,
-        reviews: list[Review] | tuple[Review],
+        reviews: QuerySet[Review],
         redirect_url: str,
-        review_template_name: str = 'parts/review.html',
+        tour: Tour = None,
     ) -> None:
         """Init method.
 
         Args:
             request: HttpRequest - request from user.
-            reviews: list[Review] | tuple[Review] - list of reviews for work.
-            redirect_url: str - url for redirect after delete review.
-            review_template_name: str, optional - review template. Defaults to 'parts/review.html'.
+            reviews: QuerySet[Review] - reviews for work. Only requested page is fetched.
+            redirect_url: str - url for redirect after review change.
+            tour: Tour, optional - tour of reviews. Needed for pin request user review.
         """
         self.request = request
-        self.reviews = reviews
-        self.redirect_url = redirect_url
-        self.review_template_name = review_template_name
-        self.reviews_count = len(reviews)
-        self.paginator = Paginator(reviews, getenv('REVIEWS_PER_PAGE', DEFAULT_REVIEWS_PER_PAGE))
-
-    def get_tour(self) -> Tour:
-        """Get tour by id in url path.
-
-        Returns:
-            Tour: finded tour.
-        """
-        tour_id = self.request.path.split('/')[-2]
-        return Tour.objects.filter(id=tour_id).first()
-
-    def delete(self, review: Review, redirect_url: str) -> HttpResponseRedirect:
-        """Delete review and redirect.
+        if not reviews.ordered:
+            reviews = reviews.order_by(*REVIEWS_ORDERING)
+        self.reviews = reviews.select_related('account__account', 'tour')
+        self.forms = ReviewForms(request, redirect_url)
+        self.tour = tour
+        self.user_review = None
+        self.paginator = Paginator(
+            self.reviews, getenv('REVIEWS_PER_PAGE', DEFAULT_REVIEWS_PER_PAGE),
+        )
 
-        Args:
-            review: Review - review for delete.
-            redirect_url: str - url for redirect after delete.
+    @property
+    def reviews_count(self) -> int:
+        """Count reviews including pinned user review.
 
         Returns:
-            HttpResponseRedirect: redirect after delete.
+            int: reviews count.
         """
-        review.delete()
-        return redirect(redirect_url)
-
-    def render_not_existing_review(self, tour: Tour) -> str:
-        """Render card for not existing review.
-
-        Args:
-            tour: Tour - tour for connect with review form.
-
-        Returns:
-            str: rendered card.
-        """
-        errors = {}
-        account = Account.objects.filter(account=self.request.user).first()
-        if self.request.method == 'POST':
-            form = UserReviewForm(self.request.POST)
-            if form.is_valid():
-                rating = form.cleaned_data['rating']
-                text = form.cleaned_data['text']
-                Review.objects.create(
-                    tour=tour,
-                    account=account,
-                    rating=rating,
-                    text=text,
-                )
-                redirect_url = reverse('tour', kwargs={'uuid': tour.id})
-                return redirect(f'{redirect_url}#reviews')
-            else:
-                errors = form.errors.as_data()
-                errors = errors_utils.convert_errors(errors)
-        else:
-            form = UserReviewForm()
-        return render_to_string(
-            'parts/not_created_review.html',
-            {
-                'errors': errors,
-                'form': form.my_render(self.request),
-                'account': account,
-                'style_files': [
-                    'css/rating.css',
-                    'css/review_create.css',
-                ],
-            },
-            request=self.request,
-        )
+        return self.paginator.count + int(self.user_review is not None)
 
     def render_review(self, review: Review, render_form: bool = False) -> str:
         """Render review card.
@@ -119,33 +74,14 @@ class ReviewsListManager:
         Returns:
             str: rendered card.
         """
-        initial_data = {}
-        initial_data['rating'] = review.rating
-        initial_data['text'] = review.text
         form = None
         errors = {}
-        if self.request.method == 'POST' and render_form:
-            delete_key_in_post = 'delete' in self.request.POST.keys()
-            id_in_delete = str(review.id) == self.request.POST.get('delete')
-            request_user_equals_account = self.request.user == review.account.account
-            if delete_key_in_post and id_in_delete and request_user_equals_account:
-                return self.delete(review, self.redirect_url)
-            form = UserReviewForm(self.request.POST, initial=initial_data)
-            if form.is_valid():
-                rating = form.cleaned_data['rating']
-                text = form.cleaned_data['text']
-                review.rating = rating
-                review.text = text
-                review.edited = get_datetime()
-                review.save()
-                return redirect(self.redirect_url)
-            else:
-                errors = form.errors.as_data()
-                errors = errors_utils.convert_errors(errors)
         if render_form:
-            form = UserReviewForm(initial=initial_data)
-        if form:
-            form = form.my_render(self.request, review)
+            if self.request.method == 'POST':
+                errors = self.forms.handle_review_post(review)
+                if isinstance(errors, HttpResponseRedirect):
+                    return errors
+            form = self.forms.render_review_form(review, errors)
         return render_to_string(
             self.review_template_name,
             {
@@ -153,41 +89,59 @@ class ReviewsListManager:
                 'form': form,
                 'review': review,
                 'request': self.request,
-                'style_files': [
-                    'css/rating.css',
-                    'css/review_create.css',
-                    'css/review_edit.css',
-                ],
+                STYLE_FILES_LITERAL: REVIEW_STYLE_FILES,
             },
             request=self.request,
         )
 
-    def render_reviews_list(self, page: int) -> str:
+    def pin_request_user_review(self) -> None:
+        """Find request user review and exclude it from paged reviews."""
+        user_review, account = self.tour.get_request_user_review(self.request)
+        self.user_review = user_review
+        if account is not None and account.agency_id is None:
+            self.forms.account = account
+        if user_review:
+            self.paginator = Paginator(
+                self.reviews.exclude(id=self.user_review.id),
+                self.paginator.per_page,
+            )
+
+    def render_pinned_review(self) -> str | HttpResponseRedirect:
+        """Render request user review or form for create it.
+
+        Returns:
+            str | HttpResponseRedirect: rendered card or redirect after review change.
+        """
+        if self.user_review:
+            return self.render_review(self.user_review, render_form=True)
+        return self.forms.render_not_existing_review(self.tour)
+
+    def render_reviews_list(self, page: int) -> str | HttpResponseRedirect:
         """Render list of rendered reviews cards.
 
         Args:
             page: int - page for render cards from this one.
 
         Returns:
-            str: rendered list.
+            str | HttpResponseRedirect: rendered list or redirect after review change.
         """
-        rendered_reviews = []
+        pinned_review = ''
+        if self.forms.account:
+            pinned_review = self.render_pinned_review()
+            if isinstance(pinned_review, HttpResponseRedirect):
+                return pinned_review
         reviews_page = self.paginator.get_page(page)
-        for review in reviews_page:
-            if not review:
-                tour = self.get_tour()
-                rendered_review = self.render_not_existing_review(tour)
-            elif review.account.account == self.request.user:
-                rendered_review = self.render_review(review, render_form=True)
-            else:
-                rendered_review = self.render_review(review)
-            if isinstance(rendered_review, HttpResponseRedirect):
-                return rendered_review
-            rendered_reviews.append(rendered_review)
+        edit_forms = self.forms.render_edit_forms(reviews_page)
+        if isinstance(edit_forms, HttpResponseRedirect):
+            return edit_forms
         return render_to_string(
             'parts/reviews_list.html',
             {
-                'reviews': rendered_reviews,
+                'pinned_review': pinned_review,
+                'reviews': reviews_page,
+                'edit_forms': edit_forms,
+                'review_template_name': self.review_template_name,
+                STYLE_FILES_LITERAL: REVIEW_STYLE_FILES,
             },
             request=self.request,
         )
@@ -197,19 +151,14 @@ class ReviewsListManager:
 
         Args:
             display: bool, optional - Are display block on page loads. Defaults to False.
-            check_user_review: bool, optional - Check if current user send review. Defaults True.
+            check_user_review: bool, optional - Pin current user review. Defaults True.
 
         Returns:
-            str: _description_
+            str: rendered block.
         """
         page = int(self.request.GET.get('page', 1))
-        if check_user_review:
-            user_review, account = self.get_tour().get_request_user_review(self.request)
-            if user_review:
-                self.reviews.remove(user_review)
-                self.reviews.insert(0, user_review)
-            elif self.request.user.is_authenticated and account.agency is None:
-                self.reviews.insert(0, None)
+        if check_user_review and self.tour:
+            self.pin_request_user_review()
         reviews_list = self.render_reviews_list(page=page)
         if isinstance(reviews_list, HttpResponseRedirect):
             return reviews_list
@@ -229,10 +178,16 @@ class ReviewsListManager:
                 'display': display,
                 'reviews_title_literal': _('Reviews'),
                 'reviews_count': self.reviews_count,
-                'style_files': [
+                STYLE_FILES_LITERAL: [
                     'css/reviews.css',
                     'css/pages.css',
                 ],
             },
             request=self.request,
         )
+
+
+class AccountReviewsListManager(ReviewsListManager):
+    """Class for working with reviews list of account, cards show reviewed tours."""
+
+    review_template_name = 'parts/tour_review.html'
@@ -0,0 +1,112 @@
+"""Module with cache of storage files urls."""
+
+import hashlib
+import threading
+from os import getenv
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.core.files.storage import Storage
+from dotenv import load_dotenv
+
+from ..metrics import count_cache_lookup
+from ..timings import CACHE_PHASE, STORAGE_PHASE, timed
+
+load_dotenv()
+DEFAULT_CACHE_SECONDS = 600
+
+
+class UrlCacheStats(NamedTuple):
+    """Storage urls cache counters."""
+
+    hits: int
+    misses: int
+
+
+class StorageUrlCache:
+    """Cache of storage urls keyed on storage and file name with hits and misses counters."""
+
+    def __init__(self) -> None:
+        """Create cache with zero counters."""
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def url(self, storage: Storage, name: str) -> str:
+        """Get file url from cache or from storage.
+
+        Timeout is STORAGE_URLS_CACHE_SECONDS, but at most half of signed urls lifetime.
+
+        Args:
+            storage: Storage - storage with file.
+            name: str - file storage name.
+
+        Returns:
+            str: file url.
+        """
+        cache_key = self.get_cache_key(storage, name)
+        with timed(CACHE_PHASE):
+            file_url = cache.get(cache_key)
+        self.count(hit=file_url is not None)
+        if file_url is None:
+            with timed(STORAGE_PHASE):
+                file_url = storage.url(name)
+            with timed(CACHE_PHASE):
+                cache.set(cache_key, file_url, self.get_timeout(storage))
+        return file_url
+
+    def get_cache_key(self, storage: Storage, name: str) -> str:
+        """Get cache key of file url.
+
+        Args:
+            storage: Storage - storage with file.
+            name: str - file storage name.
+
+        Returns:
+            str: cache key.
+        """
+        storage_class = type(storage)
+        bucket_name = getattr(storage, 'bucket_name', '')
+        storage_key = f'{storage_class.__module__}.{storage_class.__name__}:{bucket_name}'
+        file_key = f'{storage_key}:{name}'
+        key_hash = hashlib.sha256(file_key.encode()).hexdigest()
+        return f'storage-url:{key_hash}'
+
+    def get_timeout(self, storage: Storage) -> int:
+        """Get timeout of cached url.
+
+        Args:
+            storage: Storage - storage with file.
+
+        Returns:
+            int: timeout in seconds.
+        """
+        timeout = int(getenv('STORAGE_URLS_CACHE_SECONDS', DEFAULT_CACHE_SECONDS))
+        if getattr(storage, 'querystring_auth', False):
+            timeout = min(timeout, storage.querystring_expire // 2)
+        return timeout
+
+    def count(self, hit: bool) -> None:
+        """Count cache hit or miss.
+
+        Args:
+            hit: bool - True if url was found in cache.
+        """
+        count_cache_lookup('storage_urls', hit)
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> UrlCacheStats:
+        """Get counters of this process.
+
+        Returns:
+            UrlCacheStats: hits and misses.
+        """
+        with self.lock:
+            return UrlCacheStats(self.hits, self.misses)
+
+
+storage_urls = StorageUrlCache()
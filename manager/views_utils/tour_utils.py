@@ -1,12 +1,18 @@
 """Module with functions for work with tours."""
 
+from typing import Any, Iterable
+
+from django.db import models
 from django.http import HttpRequest
 from django.shortcuts import redirect
 from django.template.loader import render_to_string
+from django.urls import reverse
 
 from ..forms import TourEditForm, TourForm
-from ..models import Agency, Tour
+from ..models import RATING_COUNT_FIELDS, Agency, Tour, get_average_rating
+from . import agency_directory, page_cache
 from .errors_utils import convert_errors
+from .reviews_list_manager import ReviewsListManager
 
 
 def save_tour(
@@ -29,7 +35,7 @@ def save_tour(
     if tour:
         tour = form.save(commit=False)
         if post_data.get('avatar_clear') == 'on':
-            tour.avatar.delete()
+            tour.avatar = None
         if 'avatar' in request.FILES and post_data.get('avatar_clear') != 'on':
             tour.avatar = request.FILES['avatar']
         tour.save()
@@ -91,3 +97,53 @@ def render_tour_form(
         },
         request=request,
     )
+
+
+def get_agency_rating(agency: Agency) -> float:
+    """Get rating of agency weighted by reviews counts of its tours in one aggregate query.
+
+    Args:
+        agency: Agency - agency of tours.
+
+    Returns:
+        float: average rating of agency reviews or 0 if there are no reviews.
+    """
+    counters = {
+        field_name: models.Sum(field_name, default=0)
+        for field_name in RATING_COUNT_FIELDS.values()
+    }
+    totals = Tour.objects.filter(agency=agency).aggregate(**counters)
+    return get_average_rating({
+        rating: totals[field_name] for rating, field_name in RATING_COUNT_FIELDS.items()
+    })
+
+
+def refresh_reviewed_tours_counts(accounts_ids: Iterable[Any]) -> None:
+    """Recount ratings counters of tours reviewed by accounts which agencies links changed.
+
+    Args:
+        accounts_ids: Iterable[Any] - accounts ids.
+    """
+    reviewed_tours = list(Tour.objects.filter(reviews__account__in=accounts_ids).distinct())
+    for reviewed_tour in reviewed_tours:
+        reviewed_tour.refresh_ratings_counts()
+        agency_directory.schedule_agency_refresh(agency_id=reviewed_tour.agency_id)
+    page_cache.schedule_tours_invalidation(tour_data.id for tour_data in reviewed_tours)
+
+
+def create_tour_reviews_manager(request: HttpRequest, tour: Tour) -> ReviewsListManager:
+    """Create manager of tour reviews written by users, not agencies.
+
+    Args:
+        request: HttpRequest - request from user.
+        tour: Tour - tour of reviews.
+
+    Returns:
+        ReviewsListManager: manager with request user review pinned.
+    """
+    return ReviewsListManager(
+        request,
+        tour.reviews.filter(account__agency=None),
+        reverse('tour', kwargs={'uuid': tour.id}),
+        tour=tour,
+    )
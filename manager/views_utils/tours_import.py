@@ -0,0 +1,280 @@
+"""Module with bulk import of tours catalog."""
+
+import csv
+import io
+import json
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import IO, Iterable, Iterator, NamedTuple
+
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from ..import_forms import (ADDRESS_PARTS, ADDRESSES_SEPARATOR,
+                            TourImportRowForm)
+from ..models import Address, Agency, City, Tour, TourAddress
+from . import agency_directory, errors_utils, page_cache
+
+DEFAULT_CHUNK_SIZE = 500
+ROW_ERROR_LITERAL = '__all__'
+
+
+class ImportRow(NamedTuple):
+    """Validated catalog row."""
+
+    number: int
+    name: str
+    description: str
+    price: Decimal
+    country: str
+    starting_city: str
+    addresses: tuple[tuple[str, str, str], ...]
+
+
+def get_import_format(file_name: str) -> str:
+    """Get catalog format by file extension.
+
+    Args:
+        file_name: str - catalog file name.
+
+    Returns:
+        str: csv, json or jsonl.
+    """
+    return Path(file_name).suffix.lstrip('.').lower()
+
+
+def _join_address(address: str | dict) -> str:
+    if isinstance(address, dict):
+        return ', '.join(str(address.get(part, '')) for part in ADDRESS_PARTS)
+    return address
+
+
+def _normalize_row(row: dict) -> dict:
+    addresses = row.get('addresses')
+    if isinstance(addresses, list):
+        addresses = (_join_address(address) for address in addresses)
+        row['addresses'] = ADDRESSES_SEPARATOR.join(addresses)
+    return row
+
+
+def _read_json_lines(text: IO[str]) -> Iterator[dict | None]:
+    for line in text:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            yield None
+
+
+def read_rows(catalog: IO[bytes], import_format: str) -> Iterator[dict | None]:
+    """Read catalog rows one by one.
+
+    CSV and JSON Lines are streamed, JSON array is loaded at once.
+
+    Args:
+        catalog: IO[bytes] - opened binary catalog file.
+        import_format: str - csv, json or jsonl.
+
+    Yields:
+        dict | None: row, None for unreadable row.
+    """
+    if import_format == 'json':
+        rows = json.load(catalog)
+        if not isinstance(rows, list):
+            rows = [None]
+        yield from rows
+        return
+    text = io.TextIOWrapper(catalog, encoding='utf-8-sig', newline='')
+    if import_format == 'csv':
+        yield from csv.DictReader(text)
+    else:
+        yield from _read_json_lines(text)
+
+
+class ImportSummary:
+    """Tours import summary."""
+
+    def __init__(self) -> None:
+        """Init empty summary."""
+        self.created = 0
+        self.errors = []
+
+    def add_error(self, row_number: int, errors: dict) -> None:
+        """Save row errors.
+
+        Args:
+            row_number: int - number of row in catalog, starting from 1.
+            errors: dict - errors by field names.
+        """
+        self.errors.append((row_number, errors))
+
+
+class CatalogLookups:
+    """Cities, addresses and existing tours of chunk fetched with one query each."""
+
+    def __init__(self, agency: Agency) -> None:
+        """Init empty lookups.
+
+        Args:
+            agency: Agency - agency of imported tours.
+        """
+        self.agency = agency
+        self.cities = {}
+        self.addresses = {}
+        self.existing_tours = set()
+
+    def load(self, rows: list[ImportRow]) -> None:
+        """Fetch everything rows refer to.
+
+        Args:
+            rows: list[ImportRow] - validated rows of chunk.
+        """
+        names = {row.starting_city for row in rows}
+        names.update(address[0] for row in rows for address in row.addresses)
+        cities = City.objects.filter(
+            name__in=names,
+            country__name__in={row.country for row in rows},
+        ).values_list('name', 'country__name', 'id')
+        self.cities = {(name, country): city_id for name, country, city_id in cities}
+        self._load_addresses(rows)
+        existing_tours = Tour.objects.filter(
+            agency=self.agency,
+            name__in={row.name for row in rows},
+        )
+        self.existing_tours.update(existing_tours.values_list('name', 'description'))
+
+    def find_city(self, name: str, country: str) -> str | None:
+        """Find city id.
+
+        Args:
+            name: str - city name.
+            country: str - country name.
+
+        Returns:
+            str | None: city id if city exists.
+        """
+        return self.cities.get((name, country))
+
+    def find_addresses(self, row: ImportRow) -> list:
+        """Find ids of row addresses.
+
+        Args:
+            row: ImportRow - validated row.
+
+        Returns:
+            list: unique address ids, empty if some address is not found.
+        """
+        address_ids = []
+        for city, street, house_number in row.addresses:
+            address_id = self.addresses.get((city, row.country, street, house_number))
+            if not address_id:
+                return []
+            if address_id not in address_ids:
+                address_ids.append(address_id)
+        return address_ids
+
+    def _load_addresses(self, rows: list[ImportRow]) -> None:
+        addresses = Address.objects.filter(
+            city_id__in=self.cities.values(),
+            street__in={address[1] for row in rows for address in row.addresses},
+        ).order_by('id')
+        addresses = addresses.values_list(
+            'city__name', 'city__country__name', 'street', 'house_number', 'id',
+        )
+        self.addresses = {}
+        for *address_key, address_id in addresses:
+            self.addresses.setdefault(tuple(address_key), address_id)
+
+
+class ToursImporter:
+    """Import tours of agency in chunks."""
+
+    def __init__(self, agency: Agency, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Init importer.
+
+        Args:
+            agency: Agency - agency of imported tours.
+            chunk_size: int, optional - rows in chunk. Defaults to DEFAULT_CHUNK_SIZE.
+        """
+        self.agency = agency
+        self.chunk_size = chunk_size
+        self.summary = ImportSummary()
+        self.lookups = CatalogLookups(agency)
+
+    def import_rows(self, rows: Iterable[dict | None]) -> ImportSummary:
+        """Validate and create tours from rows.
+
+        Every chunk is created in own transaction, invalid rows are skipped and reported.
+
+        Args:
+            rows: Iterable[dict | None] - catalog rows.
+
+        Returns:
+            ImportSummary: created tours count and rows errors.
+        """
+        numbered_rows = enumerate(rows, start=1)
+        chunk = list(islice(numbered_rows, self.chunk_size))
+        while chunk:
+            self.import_chunk(chunk)
+            chunk = list(islice(numbered_rows, self.chunk_size))
+        return self.summary
+
+    def import_chunk(self, chunk: list[tuple[int, dict | None]]) -> None:
+        """Import one chunk of rows.
+
+        Args:
+            chunk: list[tuple[int, dict | None]] - numbered rows.
+        """
+        valid_rows = self._validate(chunk)
+        self.lookups.load(valid_rows)
+        tours, links = [], []
+        for row in valid_rows:
+            tour_links = self._build_tour(row)
+            if tour_links:
+                tours.append(tour_links[0].tour)
+                links.extend(tour_links)
+        with transaction.atomic():
+            Tour.objects.bulk_create(tours)
+            TourAddress.objects.bulk_create(links)
+            agency_directory.schedule_agency_refresh(agency_id=self.agency.id)
+            page_cache.schedule_invalidation(page_cache.TOURS_TAG)
+        self.summary.created += len(tours)
+
+    def _validate(self, chunk: list[tuple[int, dict | None]]) -> list[ImportRow]:
+        valid_rows = []
+        for row_number, row in chunk:
+            if not isinstance(row, dict):
+                self.summary.add_error(row_number, {ROW_ERROR_LITERAL: _('Row is not readable.')})
+                continue
+            form = TourImportRowForm(data=_normalize_row(row))
+            if form.is_valid():
+                valid_rows.append(ImportRow(number=row_number, **form.cleaned_data))
+            else:
+                row_errors = errors_utils.convert_errors(form.errors.as_data())
+                self.summary.add_error(row_number, row_errors)
+        return valid_rows
+
+    def _build_tour(self, row: ImportRow) -> list[TourAddress]:
+        starting_city_id = self.lookups.find_city(row.starting_city, row.country)
+        address_ids = self.lookups.find_addresses(row)
+        errors = {}
+        if not starting_city_id:
+            errors['starting_city'] = _('City not found.')
+        if not address_ids:
+            errors['addresses'] = _('Address not found.')
+        if (row.name, row.description) in self.lookups.existing_tours:
+            errors[ROW_ERROR_LITERAL] = _('Tour already exists.')
+        if errors:
+            self.summary.add_error(row.number, errors)
+            return []
+        self.lookups.existing_tours.add((row.name, row.description))
+        tour = Tour(
+            name=row.name,
+            description=row.description,
+            price=row.price,
+            agency=self.agency,
+            starting_city_id=starting_city_id,
+        )
+        return [TourAddress(tour=tour, address_id=address_id) for address_id in address_ids]
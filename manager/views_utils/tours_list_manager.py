@@ -3,16 +3,35 @@
 from os import getenv
 
 from django.core.paginator import Paginator
-from django.db.models import Manager
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.template.loader import render_to_string
 from dotenv import load_dotenv
 
-from ..models import Review, Tour
+from ..models import Tour
 from .page_utils import get_pages_slice
 
 load_dotenv()
 DEFAULT_TOURS_PER_PAGE = 15
+TOURS_FILTER_FIELDS = ('starting_city', 'country')
+
+
+def filter_tours(request: HttpRequest, tours: QuerySet[Tour]) -> QuerySet[Tour]:
+    """Filter tours by starting city and country if both are requested.
+
+    Args:
+        request: HttpRequest - request from user.
+        tours: QuerySet[Tour] - tours for filter.
+
+    Returns:
+        QuerySet[Tour]: filtered tours.
+    """
+    if not set(TOURS_FILTER_FIELDS).issubset(request.GET):
+        return tours
+    return tours.filter(
+        starting_city=request.GET.get('starting_city'),
+        address__city__country=request.GET.get('country'),
+    )
 
 
 class ToursListManager:
@@ -22,18 +41,15 @@ class ToursListManager:
         self,
         request: HttpRequest,
         tours: list[Tour] | tuple[Tour],
-        reviews: dict[Tour, Manager[Review]],
     ) -> None:
         """Init method.
 
         Args:
             request: HttpRequest - request from user.
             tours: list[Tour] | tuple[Tour] - tours for work.
-            reviews: dict[Tour, Manager[Review]] - dict with tour object and list of his reviews.
         """
         self.request = request
         self.tours = tours
-        self.reviews = reviews
         self.paginator = Paginator(tours, getenv('TOURS_PER_PAGE', DEFAULT_TOURS_PER_PAGE))
 
     def render_tour_card(self, tour: Tour, rating: float) -> str:
@@ -67,13 +83,7 @@ class ToursListManager:
         rendered_tours = []
         tours_page = self.paginator.get_page(page)
         for tour in tours_page:
-            tour_reviews = self.reviews[tour]
-            tour_ratings = [review.rating for review in tour_reviews]
-            if tour_ratings:
-                tour_rating = round(sum(tour_ratings) / len(tour_ratings), 2)
-            else:
-                tour_rating = 0
-            rendered_tour_card = self.render_tour_card(tour, tour_rating)
+            rendered_tour_card = self.render_tour_card(tour, tour.rating)
             rendered_tours.append(rendered_tour_card)
         return render_to_string(
             'parts/tours_list.html',
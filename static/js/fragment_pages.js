@@ -0,0 +1,20 @@
+// Page buttons inside a fragment request only the paged block from its data-url,
+// the search form, header and the rest of the page are not rendered again.
+$(document).on('click', '.fragment .pages button', function(event) {
+    var fragment = $(this).closest('.fragment');
+    var query = new URLSearchParams(window.location.search);
+    query.set(this.name, this.value);
+    var search = '?' + query.toString();
+    event.preventDefault();
+    fragment.load(fragment.data('url') + search, function(response, status) {
+        if (status === 'error') {
+            window.location.search = search;
+            return;
+        }
+        history.pushState(null, '', search + window.location.hash);
+    });
+});
+
+$(window).on('popstate', function() {
+    window.location.reload();
+});
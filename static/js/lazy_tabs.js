@@ -0,0 +1,9 @@
+function showLazyTab(tab) {
+    // Tab block is requested once, with the page query, e.g. ?page=2, of the whole page.
+    tab.show();
+    if (tab.data('loaded') || tab.children().length) {
+        return;
+    }
+    tab.data('loaded', true);
+    tab.load(tab.data('url') + window.location.search);
+}
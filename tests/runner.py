@@ -3,6 +3,7 @@
 from types import MethodType
 from typing import Any
 
+from django.conf import settings
 from django.db import connections
 from django.db.backends.base.base import BaseDatabaseWrapper
 from django.test.runner import DiscoverRunner
@@ -22,6 +23,17 @@ def prepare_db(self):
 class PostgresSchemaRunner(DiscoverRunner):
     """Run table schema."""
 
+    def setup_test_environment(self, **kwargs: Any) -> None:
+        """Set up test environment without page cache.
+
+        Changes of rolled back tests do not invalidate pages, tests turn cache on themselves.
+
+        Args:
+            kwargs: Any - key word arguments.
+        """
+        super().setup_test_environment(**kwargs)
+        settings.PAGE_CACHE_SECONDS = 0
+
     def setup_databases(self, **kwargs: Any) -> list[tuple[BaseDatabaseWrapper, str, bool]]:
         """Pre-setup database for work.
 
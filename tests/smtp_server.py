@@ -0,0 +1,108 @@
+"""Local SMTP server stand-in for email tests."""
+
+import socketserver
+import threading
+from typing import Any
+
+LOCALHOST = '127.0.0.1'
+DATA_END = b'.\r\n'
+
+
+class SMTPStubHandler(socketserver.StreamRequestHandler):
+    """Handler of one SMTP session."""
+
+    def handle(self) -> None:  # noqa: WPS110
+        """Speak minimal SMTP and save received messages."""
+        self.server.connections_count += 1
+        self.reply('220 stub ready')
+        for line in iter(self.rfile.readline, b''):
+            verb = line[:4].upper()
+            if verb == b'QUIT':
+                self.reply('221 bye')
+                return
+            if verb == b'DATA':
+                self.receive_message()
+            elif verb == b'MAIL' and self.server.failures_left:
+                self.server.failures_left -= 1
+                self.reply('451 temporary failure')
+            else:
+                self.reply('250 ok')
+
+    def receive_message(self) -> None:
+        """Read message body until the end of data."""
+        self.reply('354 end data with <CR><LF>.<CR><LF>')
+        message_lines = []
+        for line in iter(self.rfile.readline, DATA_END):
+            message_lines.append(line)
+        self.server.messages.append(b''.join(message_lines).decode())
+        self.reply('250 queued')
+
+    def reply(self, answer: str) -> None:
+        """Send answer to client.
+
+        Args:
+            answer: str - SMTP answer line.
+        """
+        self.wfile.write(f'{answer}\r\n'.encode())
+
+
+class SMTPStubServer(socketserver.ThreadingTCPServer):
+    """SMTP server which keeps received messages in memory."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, failures: int = 0) -> None:
+        """Init server on free local port.
+
+        Args:
+            failures: int, optional - count of messages to reject. Defaults to 0.
+        """
+        super().__init__((LOCALHOST, 0), SMTPStubHandler)
+        self.messages = []
+        self.connections_count = 0
+        self.failures_left = failures
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        """Get server port.
+
+        Returns:
+            int: listened port.
+        """
+        return self.server_address[1]
+
+    def email_settings(self) -> dict:
+        """Get settings for send emails to this server.
+
+        Returns:
+            dict: django email settings.
+        """
+        return {
+            'EMAIL_BACKEND': 'django.core.mail.backends.smtp.EmailBackend',
+            'EMAIL_HOST': LOCALHOST,
+            'EMAIL_PORT': self.port,
+            'EMAIL_HOST_USER': '',
+            'EMAIL_HOST_PASSWORD': None,  # noqa: S105
+            'EMAIL_USE_SSL': False,
+            'EMAIL_USE_TLS': False,
+        }
+
+    def __enter__(self) -> 'SMTPStubServer':
+        """Start server in background thread.
+
+        Returns:
+            SMTPStubServer: started server.
+        """
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop server.
+
+        Args:
+            args: Any - exception info.
+        """
+        self.shutdown()
+        self.server_close()
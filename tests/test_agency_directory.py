@@ -0,0 +1,100 @@
+"""Agencies directory tests."""
+
+import io
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from manager.forms import FindAgenciesForm
+from manager.models import (Account, Address, Agency, AgencyDirectory, City,
+                            Country, Review, Tour)
+
+PRICE = 400
+POINT = -74.0061, 40.7129
+CITY_NAME = 'New York'
+AGENCY_NAME = 'TravelFun'
+SUMMARY_FIELDS = ('tours_count', 'reviews_count', 'rating')
+
+
+class AgencyDirectoryTest(TestCase):
+    """Agencies directory tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        self.city = City.objects.create(
+            name=CITY_NAME,
+            country=Country.objects.create(name='USA'),
+            point=Point(*POINT),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agency = Agency.objects.create(
+                name=AGENCY_NAME,
+                phone_number='+79999999999',
+                address=Address.objects.create(
+                    city=self.city,
+                    street='Liberty St',
+                    house_number='1700',
+                    point=Point(*POINT),
+                ),
+            )
+            agency_user = User.objects.create_user(username='agency')
+            Account.objects.create(account=agency_user, agency=self.agency)
+            self.tour = Tour.objects.create(
+                name='Exciting NY Tour',
+                description='Discover NY with us!',
+                agency=self.agency,
+                starting_city=self.city,
+                price=PRICE,
+            )
+
+    def add_review(self, username: str, rating: int) -> Review:
+        """Create review of tour and refresh directory.
+
+        Args:
+            username: str - reviewer username.
+            rating: int - review rating.
+
+        Returns:
+            Review: created review.
+        """
+        account = Account.objects.create(account=User.objects.create_user(username=username))
+        with self.captureOnCommitCallbacks(execute=True):
+            return Review.objects.create(tour=self.tour, account=account, rating=rating)
+
+    def test_entry_follows_changes(self):
+        """Test entry is refreshed once per commit after tours and reviews changes."""
+        self.add_review('first', 5)
+        self.add_review('second', 2)
+        entry = AgencyDirectory.objects.get(agency=self.agency)
+        self.assertEqual((entry.name, entry.city_name, entry.country_name), (
+            AGENCY_NAME, CITY_NAME, 'USA',
+        ))
+        self.assertTrue(entry.has_account)
+        summary = AgencyDirectory.objects.values_list(*SUMMARY_FIELDS)
+        self.assertEqual(summary.get(agency=self.agency), (1, 2, 3.5))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tour.delete()
+        self.assertEqual(summary.get(agency=self.agency), (0, 0, 0))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agency.delete()
+        self.assertFalse(AgencyDirectory.objects.exists())
+
+    def test_agencies_page(self):
+        """Test agencies page and search form are read from directory."""
+        self.add_review('first', 4)
+        response = self.client.get(reverse('agencies'), {'city': self.city.id})
+        self.assertContains(response, AGENCY_NAME)
+        self.assertEqual(response.context['agencies_data'][0].rating, 4)
+        choices = FindAgenciesForm().fields['city'].choices
+        self.assertIn((self.city.id, CITY_NAME), choices)
+
+    def test_refresh_command(self):
+        """Test command rebuilds whole directory."""
+        AgencyDirectory.objects.all().delete()
+        stdout = io.StringIO()
+        call_command('refresh_agency_directory', batch_size=1, stdout=stdout)
+        self.assertIn('Refreshed: 1 agencies', stdout.getvalue())
+        self.assertTrue(AgencyDirectory.objects.filter(agency=self.agency).exists())
@@ -0,0 +1,125 @@
+"""Async read views tests."""
+
+import threading
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.gis.geos import Point
+from django.http import HttpRequest
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from manager.middleware import ServerTimingMiddleware
+from manager.models import (Account, Address, Agency, City, Country, Review,
+                            Tour)
+from manager.views import async_views
+from manager.views_utils.async_reads import gather_reads
+
+PRICE = 400
+POINT = -74.0061, 40.7129
+TOUR_NAME = 'Exciting NY Tour'
+AGENCY_NAME = 'TravelFun'
+BARRIER_TIMEOUT = 5
+
+
+def create_request(path: str, **headers: str) -> HttpRequest:
+    """Create anonymous async GET request.
+
+    Args:
+        path: str - requested path.
+        headers: str - request headers.
+
+    Returns:
+        HttpRequest: request.
+    """
+    request = AsyncRequestFactory().get(path, **headers)
+    request.user = AnonymousUser()
+    return request
+
+
+class AsyncReadsTest(SimpleTestCase):
+    """Concurrent reads tests class."""
+
+    async def test_reads_run_concurrently(self):
+        """Test reads outside transaction wait for each other in own threads."""
+        barrier = threading.Barrier(2, timeout=BARRIER_TIMEOUT)
+        reads_results = await gather_reads(create_request('/'), barrier.wait, barrier.wait)
+        self.assertEqual(sorted(reads_results), [0, 1])
+
+
+class AsyncViewsTest(TestCase):
+    """Async pages and API lists tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        self.city = City.objects.create(
+            name='New York',
+            country=Country.objects.create(name='USA'),
+            point=Point(*POINT),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agency = Agency.objects.create(
+                name=AGENCY_NAME,
+                phone_number='+79999999999',
+                address=Address.objects.create(
+                    city=self.city,
+                    street='Liberty St',
+                    house_number='1700',
+                    point=Point(*POINT),
+                ),
+            )
+            Account.objects.create(
+                account=User.objects.create_user(username='agency'), agency=self.agency,
+            )
+            self.tour = Tour.objects.create(
+                name=TOUR_NAME,
+                description='Discover NY with us!',
+                agency=self.agency,
+                starting_city=self.city,
+                price=PRICE,
+            )
+        self.user = User.objects.create_user(username='reviewer')
+        account = Account.objects.create(account=self.user)
+        self.review = Review.objects.create(
+            tour=self.tour, account=account, rating=5, text='Unforgettable trip',
+        )
+
+    async def test_pages(self):
+        """Test tours, agencies and tour pages render gathered reads."""
+        response = await async_views.tours(create_request('/tours/'))
+        self.assertContains(response, TOUR_NAME)
+        response = await async_views.agencies(create_request('/agencies/'))
+        self.assertContains(response, AGENCY_NAME)
+        response = await async_views.tour(create_request('/tour/'), self.tour.id)
+        self.assertContains(response, TOUR_NAME)
+        self.assertContains(response, 'Unforgettable trip')
+        response = await async_views.tour(create_request('/tour/'), self.review.id)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_timings(self):
+        """Test async middleware measures queries of reads gathered by view."""
+        middleware = ServerTimingMiddleware(async_views.tours)
+        response = await middleware(create_request('/tours/'))
+        self.assertIn('db;dur=', response['Server-Timing'])
+
+    async def test_api_lists(self):
+        """Test async API lists answer as sync DRF views with and without token."""
+        token = await Token.objects.acreate(user=self.user)
+        authorization = {'HTTP_AUTHORIZATION': f'Token {token.key}'}
+        tours_views = async_views.tours_api, async_views.TOURS_LIST_VIEW
+        reviews_views = async_views.reviews_api, async_views.REVIEWS_LIST_VIEW
+        api_lists = (
+            (*tours_views, '/api/tours/', authorization),
+            (*reviews_views, '/api/reviews/', authorization),
+            (*tours_views, '/api/tours/?format=json', {}),
+        )
+        for async_view, sync_view, path, headers in api_lists:
+            with self.subTest(path=path, headers=headers):
+                response = await async_view(create_request(path, **headers))
+                sync_response = await sync_to_async(sync_view)(create_request(path, **headers))
+                await sync_to_async(sync_response.render)()
+                self.assertEqual(response.status_code, sync_response.status_code)
+                self.assertEqual(response['Content-Type'], sync_response['Content-Type'])
+                self.assertEqual(response.content, sync_response.content)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
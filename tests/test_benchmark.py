@@ -0,0 +1,33 @@
+"""Benchmark command tests."""
+
+import io
+import json
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from manager.models import Tour
+
+TOURS_COUNT = 40
+
+
+class BenchmarkCommandTest(TestCase):
+    """Benchmark command tests class."""
+
+    def test_report(self):
+        """Test JSON report of chosen endpoints and seeded rows rolled back."""
+        stdout = io.StringIO()
+        call_command(
+            'benchmark',
+            scales=[TOURS_COUNT],
+            requests=2,
+            only=['tours', 'tour-list'],
+            stdout=stdout,
+            stderr=io.StringIO(),
+        )
+        report = json.loads(stdout.getvalue())
+        measurements = report['scales'][str(TOURS_COUNT)]
+        self.assertEqual(set(measurements), {'tours', 'tour-list'})
+        self.assertEqual(measurements['tours']['status'], 200)
+        self.assertGreater(measurements['tour-list']['queries'], 0)
+        self.assertFalse(Tour.objects.exists())
@@ -0,0 +1,90 @@
+"""Replica database routing tests.
+
+Replica database tests run when PG_REPLICA_HOST is set, replica alias mirrors default
+test database then. Run them alone, other tests expect single database.
+"""
+
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase
+
+from manager import db_router
+from manager.middleware import PRIMARY_COOKIE, ReplicaRoutingMiddleware
+from manager.models import Country, Tour
+
+REPLICA = db_router.DEFAULT_REPLICA_ALIAS
+FRESH_PATH = 'manager.db_router.is_replica_fresh'
+
+
+def respond_with_read_database(request: HttpRequest) -> HttpResponse:
+    """Respond with alias of database serving reads.
+
+    Args:
+        request: HttpRequest - request from user.
+
+    Returns:
+        HttpResponse: response with database alias.
+    """
+    status = 302 if request.method == 'POST' else 200
+    return HttpResponse(db_router.read_database.get(), status=status)
+
+
+class ReplicaRouterTest(SimpleTestCase):
+    """Replica router and routing middleware tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        self.factory = RequestFactory()
+        replica_patcher = mock.patch.dict(settings.DATABASES, {REPLICA: {}})
+        replica_patcher.start()
+        self.addCleanup(replica_patcher.stop)
+        self.middleware = ReplicaRoutingMiddleware(respond_with_read_database)
+
+    def test_router(self):
+        """Test reads follow chosen database and writes and migrations use default one."""
+        router = db_router.ReplicaRouter()
+        self.assertEqual(router.db_for_read(Tour), DEFAULT_DB_ALIAS)
+        with db_router.read_from(REPLICA):
+            self.assertEqual(router.db_for_read(Tour), REPLICA)
+            self.assertEqual(router.db_for_write(Tour), DEFAULT_DB_ALIAS)
+        self.assertEqual(router.db_for_read(Tour), DEFAULT_DB_ALIAS)
+        self.assertFalse(router.allow_migrate(REPLICA, 'manager'))
+
+    @mock.patch(FRESH_PATH, return_value=True)
+    def test_read_your_writes(self, is_replica_fresh):
+        """Test safe requests read replica until client writes."""
+        response = self.middleware(self.factory.get('/tours/'))
+        self.assertEqual(response.content.decode(), REPLICA)
+        response = self.middleware(self.factory.post('/profile/'))
+        self.assertEqual(response.content.decode(), DEFAULT_DB_ALIAS)
+        self.assertIn(PRIMARY_COOKIE, response.cookies)
+        self.factory.cookies[PRIMARY_COOKIE] = '1'
+        response = self.middleware(self.factory.get('/profile/'))
+        self.assertEqual(response.content.decode(), DEFAULT_DB_ALIAS)
+        self.assertEqual(db_router.read_database.get(), DEFAULT_DB_ALIAS)
+
+    @mock.patch(FRESH_PATH, return_value=False)
+    def test_lagging_replica(self, is_replica_fresh):
+        """Test safe requests read default database when replica lags."""
+        response = self.middleware(self.factory.get('/tours/'))
+        self.assertEqual(response.content.decode(), DEFAULT_DB_ALIAS)
+        is_replica_fresh.assert_called_once_with(REPLICA)
+
+
+@skipUnless(db_router.get_replica_alias(), 'Replica is not configured.')
+class ReplicaDatabaseTest(TransactionTestCase):
+    """Replica database tests class."""
+
+    databases = '__all__'
+
+    def test_replica_reads(self):
+        """Test replica lag is measured and routed reads see committed data."""
+        alias = db_router.get_replica_alias()
+        self.assertLessEqual(db_router.get_replica_lag(alias), db_router.DEFAULT_MAX_LAG_SECONDS)
+        self.assertTrue(db_router.is_replica_fresh(alias))
+        Country.objects.create(name='USA')
+        with db_router.read_from(alias):
+            self.assertTrue(Country.objects.filter(name='USA').exists())
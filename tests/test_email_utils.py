@@ -0,0 +1,64 @@
+"""Email outbox tests."""
+
+from django.test import TestCase, override_settings
+
+from manager.models import OutgoingEmail
+from manager.validators import get_datetime
+from manager.views_utils.email_utils import (claim_emails, queue_email,
+                                             send_queued_emails)
+from tests.smtp_server import SMTPStubServer
+
+SUBJECT = 'Subject'
+RECIPIENTS = ('user@example.com',)
+MESSAGE = '<p>Hello</p>'
+
+
+class EmailOutboxTest(TestCase):
+    """Email outbox tests class."""
+
+    def test_queue_email(self):
+        """Test email saved into outbox with plain and html messages."""
+        email = queue_email(SUBJECT, MESSAGE, RECIPIENTS)
+        self.assertEqual(email.plain_message, 'Hello')
+        self.assertEqual(email.html_message, MESSAGE)
+        self.assertIsNone(email.sent)
+
+    def test_send_batch_over_one_connection(self):
+        """Test due emails sent in batch over one SMTP connection."""
+        for _ in range(3):
+            queue_email(SUBJECT, MESSAGE, RECIPIENTS)
+        with SMTPStubServer() as server:
+            with override_settings(**server.email_settings()):
+                sent_count, failed_count = send_queued_emails(batch_size=10)
+            self.assertEqual(len(server.messages), 3)
+            self.assertEqual(server.connections_count, 1)
+        self.assertEqual((sent_count, failed_count), (3, 0))
+        self.assertFalse(OutgoingEmail.objects.filter(sent=None).exists())
+
+    def test_failed_email_retried_later(self):
+        """Test failed email gets backoff and is not sent again at once."""
+        email = queue_email(SUBJECT, MESSAGE, RECIPIENTS)
+        with SMTPStubServer(failures=1) as server:
+            with override_settings(**server.email_settings()):
+                self.assertEqual(send_queued_emails(), (0, 1))
+                self.assertEqual(send_queued_emails(), (0, 0))
+        email.refresh_from_db()
+        self.assertEqual(email.attempts, 1)
+        self.assertIsNotNone(email.last_error)
+        self.assertGreater(email.next_attempt, get_datetime())
+
+    def test_exhausted_email_dropped(self):
+        """Test email which reached attempts limit is not sent and is deleted."""
+        email = queue_email(SUBJECT, MESSAGE, RECIPIENTS)
+        OutgoingEmail.objects.filter(id=email.id).update(attempts=2)
+        self.assertEqual(send_queued_emails(max_attempts=2), (0, 0))
+        self.assertFalse(OutgoingEmail.objects.filter(id=email.id).exists())
+
+    def test_claimed_email_skipped(self):
+        """Test claimed email counts attempt and is skipped by other workers while sent."""
+        email = queue_email(SUBJECT, MESSAGE, RECIPIENTS)
+        self.assertEqual(claim_emails(batch_size=10, max_attempts=1), [email])
+        self.assertEqual(send_queued_emails(max_attempts=1), (0, 0))
+        email.refresh_from_db()
+        self.assertEqual(email.attempts, 1)
+        self.assertGreater(email.next_attempt, get_datetime())
@@ -0,0 +1,159 @@
+"""Partial endpoints and lazily loaded profile tests."""
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from manager.models import (Account, Address, Agency, City, Country, Review,
+                            Tour)
+from manager.views_utils.tour_utils import get_agency_rating
+
+PRICE = 400
+POINT = -74.0061, 40.7129
+AGENCY_USERNAME = 'agency'
+REVIEWER_USERNAME = 'reviewer'
+REVIEW_TEXT = 'Unforgettable trip'
+
+
+class FragmentsTestCase(TestCase):
+    """Partial endpoints tests base class with agency tours."""
+
+    def setUp(self):
+        """Set up tests."""
+        country = Country.objects.create(name='USA')
+        self.city = City.objects.create(
+            name='New York',
+            country=country,
+            point=Point(*POINT),
+        )
+        address = Address.objects.create(
+            city=self.city,
+            street='Liberty St',
+            house_number='1700',
+            point=Point(*POINT),
+        )
+        self.agency = Agency.objects.create(
+            name='TravelFun', phone_number='+79999999999', address=address,
+        )
+        agency_user = User.objects.create_user(username=AGENCY_USERNAME)
+        Account.objects.create(account=agency_user, agency=self.agency)
+        self.reviewer = User.objects.create_user(username=REVIEWER_USERNAME)
+        self.account = Account.objects.create(account=self.reviewer)
+        self.tours = [
+            self.create_tour(tour_name) for tour_name in ('Tour 1', 'Tour 2', 'Tour 3')
+        ]
+
+    def create_tour(self, name: str) -> Tour:
+        """Create tour of agency.
+
+        Args:
+            name: str - tour name.
+
+        Returns:
+            Tour: created tour.
+        """
+        return Tour.objects.create(
+            name=name,
+            description='Sample',
+            agency=self.agency,
+            price=PRICE,
+            starting_city=self.city,
+        )
+
+
+class ProfileTabsTest(FragmentsTestCase):
+    """Profile tabs partial endpoints tests class."""
+
+    def test_agency_rating(self):
+        """Test agency rating is average of agency reviews like tour rating."""
+        self.assertEqual(get_agency_rating(self.agency), 0)
+        first_tour = self.tours[0]
+        Review.objects.create(tour=first_tour, account=self.account, rating=5)
+        other_user = User.objects.create_user(username='other')
+        other_account = Account.objects.create(account=other_user)
+        Review.objects.create(tour=first_tour, account=other_account, rating=4)
+        second_tour = self.tours[1]
+        Review.objects.create(tour=second_tour, account=self.account, rating=2)
+        self.assertEqual(get_agency_rating(self.agency), 3.67)
+
+    def test_agency_profile_lazy_tours(self):
+        """Test agency profile page does not render tours and tours tab does."""
+        profile_response = self.client.get(reverse('profile', args=[AGENCY_USERNAME]))
+        self.assertEqual(profile_response.status_code, status.HTTP_200_OK)
+        self.assertNotContains(profile_response, self.tours[0].name)
+        tours_url = reverse('profile_tours', args=[AGENCY_USERNAME])
+        self.assertContains(profile_response, tours_url)
+        tours_response = self.client.get(tours_url)
+        self.assertContains(tours_response, self.tours[0].name)
+        self.assertNotContains(tours_response, '<html')
+        reviews_url = reverse('profile_reviews', args=[AGENCY_USERNAME])
+        self.assertEqual(self.client.get(reviews_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_user_profile_lazy_reviews(self):
+        """Test reviews tab renders user reviews and posted edit redirects from profile."""
+        review = Review.objects.create(
+            tour=self.tours[0], account=self.account, rating=5, text=REVIEW_TEXT,
+        )
+        self.client.force_login(self.reviewer)
+        self.assertNotContains(self.client.get(reverse('my_profile')), REVIEW_TEXT)
+        reviews_url = reverse('profile_reviews', args=[REVIEWER_USERNAME])
+        self.assertContains(self.client.get(reviews_url), REVIEW_TEXT)
+        self.assertEqual(
+            self.client.post(reviews_url).status_code, status.HTTP_405_METHOD_NOT_ALLOWED,
+        )
+        response = self.client.post(
+            reverse('my_profile'),
+            {'review': str(review.id), 'rating': 3, 'text': 'Fine'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(Review.objects.get(id=review.id).rating, 3)
+
+    def test_requests_tab_for_staff(self):
+        """Test agency requests tab is shown only to staff."""
+        self.client.force_login(self.reviewer)
+        requests_url = reverse('agency_requests')
+        self.assertEqual(self.client.get(requests_url).status_code, status.HTTP_404_NOT_FOUND)
+        self.reviewer.is_staff = True
+        self.reviewer.save()
+        self.assertContains(self.client.get(requests_url), 'class="requests"')
+
+    def test_unknown_profile(self):
+        """Test unknown profile is not found."""
+        response = self.client.get(reverse('profile', args=['nobody']))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class PaginationFragmentsTest(FragmentsTestCase):
+    """Tours and reviews pages fragments tests class."""
+
+    def test_tours_list_page(self):
+        """Test tours fragment renders filtered page without search form in fewer queries."""
+        query = {'country': self.city.country_id, 'starting_city': self.city.id, 'page': 1}
+        response = self.client.get(reverse('tours_list'), query)
+        self.assertContains(response, self.tours[2].name)
+        self.assertNotContains(response, '<form method="get" action="/tours/"')
+        self.assertNotContains(response, '<html')
+        fragment_queries = CaptureQueriesContext(connection)
+        with fragment_queries:
+            self.client.get(reverse('tours_list'), query)
+        page_queries = CaptureQueriesContext(connection)
+        with page_queries:
+            self.client.get(reverse('tours'), query)
+        self.assertLess(len(fragment_queries), len(page_queries))
+
+    def test_tour_reviews_page(self):
+        """Test tour reviews fragment renders shown reviews block."""
+        tour_id = self.tours[1].id
+        Review.objects.create(
+            tour_id=tour_id, account=self.account, rating=5, text=REVIEW_TEXT,
+        )
+        reviews_url = reverse('tour_reviews', args=[tour_id])
+        response = self.client.get(reviews_url, {'page': 1})
+        self.assertContains(response, REVIEW_TEXT)
+        self.assertNotContains(response, 'style="display: none"')
+        tour_page = self.client.get(reverse('tour', args=[tour_id]))
+        self.assertContains(tour_page, reviews_url)
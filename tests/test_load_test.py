@@ -0,0 +1,111 @@
+"""Load test harness tests."""
+
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.core.management import call_command
+from django.test import LiveServerTestCase, SimpleTestCase
+
+from manager.management.commands.benchmark_servers import compare_levels
+from manager.management.load_scenarios import Sample
+from manager.management.load_test import find_saturation, summarize
+from manager.models import Address, Agency, City, Country, Review, Tour
+
+PRICE = 400
+LATENCY = 12.5
+RPS = 'rps'
+TOUR_STEP = 'tour'
+API_STEP = 'api'
+
+
+class LoadReportTest(SimpleTestCase):
+    """Load test report tests class."""
+
+    def test_summarize(self):
+        """Test failed and refused requests counted as errors and single latency percentiles."""
+        samples = [
+            Sample(TOUR_STEP, TOUR_STEP, 200, LATENCY),
+            Sample(TOUR_STEP, TOUR_STEP, 500, LATENCY),
+            Sample(API_STEP, API_STEP, 0, LATENCY),
+            Sample(API_STEP, API_STEP, 302, LATENCY),
+        ]
+        summary = summarize(samples, 2)
+        self.assertEqual(summary['errors'], 2)
+        self.assertEqual(summary['error_rate'], 0.5)
+        self.assertEqual(summary[RPS], 2)
+        self.assertEqual(summarize(samples[:1], 1)['p99_ms'], LATENCY)
+        self.assertEqual(summarize([], 1)['requests'], 0)
+
+    def test_find_saturation(self):
+        """Test saturation is the last users count which gained throughput."""
+        levels = [
+            (1, {RPS: 10}),
+            (5, {RPS: 45}),
+            (10, {RPS: 47}),
+            (25, {RPS: 30}),
+        ]
+        self.assertEqual(find_saturation(levels), 5)
+        self.assertIsNone(find_saturation(levels[:2]))
+
+    def test_compare_servers(self):
+        """Test ASGI gain is ratio of servers throughput at the same users count."""
+        comparison = compare_levels(
+            [{'users': 5, RPS: 40, 'p95_ms': 90}],
+            [{'users': 5, RPS: 50, 'p95_ms': 70}],
+        )
+        self.assertEqual(comparison[0]['asgi_gain'], 1.25)
+        self.assertEqual(comparison[0]['asgi_p95_ms'], 70)
+
+
+class LoadTestCommandTest(LiveServerTestCase):
+    """Load test command against live server tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        country = Country.objects.create(name='USA')
+        city = City.objects.create(
+            name='New York',
+            country=country,
+            point=Point(-74.006, 40.7128),
+        )
+        address = Address.objects.create(
+            city=city,
+            street='Liberty St',
+            house_number='1700',
+            point=Point(-74.0061, 40.7129),
+        )
+        agency = Agency.objects.create(
+            name='TravelFun', phone_number='+79999999999', address=address,
+        )
+        Tour.objects.create(
+            name='Exciting NY Tour',
+            description='Discover NY with us!',
+            agency=agency,
+            starting_city=city,
+            price=PRICE,
+        )
+
+    def test_report(self):
+        """Test scenarios run without errors and load test accounts are removed."""
+        stdout = io.StringIO()
+        call_command(
+            'loadtest',
+            base_url=self.live_server_url,
+            users=[2],
+            duration=1,
+            think_time=0,
+            scenarios=[TOUR_STEP, 'post-review', API_STEP],
+            accounts=2,
+            stdout=stdout,
+            stderr=io.StringIO(),
+        )
+        report = json.loads(stdout.getvalue())
+        level = report['levels'][0]
+        self.assertEqual(level['users'], 2)
+        self.assertGreater(level['requests'], 0)
+        self.assertEqual(level['errors'], 0)
+        self.assertIn('api:api-tours', level['steps'])
+        self.assertFalse(User.objects.filter(username__startswith='loadtest').exists())
+        self.assertFalse(Review.objects.exists())
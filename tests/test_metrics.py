@@ -0,0 +1,67 @@
+"""Prometheus metrics endpoint tests."""
+
+from unittest import mock
+
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from manager.models import Country
+
+SCRAPER_KEY = 'scraper'
+CHECKOUTS_SAMPLE = 'tours_db_connection_checkouts_total'
+
+
+def get_sample(name: str, **labels: str) -> float:
+    """Get sample of default database metric.
+
+    Args:
+        name: str - sample name.
+        labels: str - other labels.
+
+    Returns:
+        float: sample value, 0 if it was not observed yet.
+    """
+    return REGISTRY.get_sample_value(name, {'database': DEFAULT_DB_ALIAS, **labels}) or 0
+
+
+class MetricsViewTest(TestCase):
+    """Metrics endpoint tests class."""
+
+    def test_request_metrics(self):
+        """Test page request observed and outbox depth exported."""
+        self.client.get(reverse('tours'))
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        text = response.content.decode()
+        self.assertIn('tours_request_duration_seconds_bucket{', text)
+        self.assertIn('view="tours"', text)
+        self.assertIn('tours_email_outbox_depth 0.0', text)
+
+    @mock.patch.dict('os.environ', {'METRICS_TOKEN': SCRAPER_KEY})
+    def test_token_required(self):
+        """Test metrics are hidden without configured bearer token."""
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        response = self.client.get(
+            reverse('metrics'), HTTP_AUTHORIZATION=f'Bearer {SCRAPER_KEY}',
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class ConnectionMetricsTest(TransactionTestCase):
+    """Persistent connections metrics tests class."""
+
+    def test_checkouts(self):
+        """Test connection is opened once and reused by next request."""
+        connection.close()
+        opened = get_sample(CHECKOUTS_SAMPLE, result='opened')
+        reused = get_sample(CHECKOUTS_SAMPLE, result='reused')
+        connects = get_sample('tours_db_connect_duration_seconds_count')
+        for _ in range(2):
+            connection.close_if_unusable_or_obsolete()
+            Country.objects.count()
+        self.assertEqual(get_sample(CHECKOUTS_SAMPLE, result='opened'), opened + 1)
+        self.assertEqual(get_sample(CHECKOUTS_SAMPLE, result='reused'), reused + 1)
+        self.assertEqual(get_sample('tours_db_connect_duration_seconds_count'), connects + 1)
+        self.assertGreaterEqual(get_sample('tours_db_connections_open'), 1)
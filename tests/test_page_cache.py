@@ -0,0 +1,105 @@
+"""Anonymous pages cache tests."""
+
+import io
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from manager.models import (Account, Address, Agency, City, Country, Review,
+                            Tour)
+from manager.views_utils.tours_import import ToursImporter, read_rows
+
+PRICE = 400
+POINT = -74.0061, 40.7129
+REVIEW_TEXT = 'Unforgettable trip'
+IMPORTED_TOUR = 'Imported tour'
+CATALOG_LINES = (
+    'name,description,price,country,starting_city,addresses',
+    f'{IMPORTED_TOUR},Description,100,USA,New York,"New York, Liberty St, 1700"',
+)
+
+
+@override_settings(PAGE_CACHE_SECONDS=60)
+class PageCacheTest(TestCase):
+    """Anonymous pages cache tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        cache.clear()
+        self.city = City.objects.create(
+            name='New York',
+            country=Country.objects.create(name='USA'),
+            point=Point(*POINT),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agency = Agency.objects.create(
+                name='TravelFun',
+                phone_number='+79999999999',
+                address=Address.objects.create(
+                    city=self.city,
+                    street='Liberty St',
+                    house_number='1700',
+                    point=Point(*POINT),
+                ),
+            )
+            Account.objects.create(
+                account=User.objects.create_user(username='agency'), agency=self.agency,
+            )
+            self.tour = Tour.objects.create(
+                name='Exciting NY Tour',
+                description='Discover NY with us!',
+                agency=self.agency,
+                starting_city=self.city,
+                price=PRICE,
+            )
+        self.tour_url = reverse('tour', kwargs={'uuid': self.tour.id})
+
+    def test_anonymous_pages(self):
+        """Test page is rendered once for query string in any parameters order."""
+        tours_url = reverse('tours')
+        city_id = self.city.id
+        country_id = self.city.country_id
+        self.client.get(f'{tours_url}?starting_city={city_id}&country={country_id}')
+        reordered_url = f'{tours_url}?country={country_id}&starting_city={city_id}'
+        with self.assertNumQueries(0):
+            response = self.client.get(reordered_url)
+        self.assertContains(response, self.tour.name)
+        self.client.get(self.tour_url)
+        with self.assertNumQueries(0):
+            self.client.get(self.tour_url)
+
+    def test_logged_in_user(self):
+        """Test pages of user with session are not cached."""
+        self.client.force_login(User.objects.get(username='agency'))
+        self.client.get(self.tour_url)
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            self.client.get(self.tour_url)
+        self.assertTrue(queries.captured_queries)
+
+    def test_invalidation(self):
+        """Test tour page follows its reviews and agencies page follows agencies directory."""
+        self.assertNotContains(self.client.get(self.tour_url), REVIEW_TEXT)
+        reviewer = Account.objects.create(account=User.objects.create_user(username='reviewer'))
+        with self.captureOnCommitCallbacks(execute=True):
+            Review.objects.create(tour=self.tour, account=reviewer, rating=5, text=REVIEW_TEXT)
+        self.assertContains(self.client.get(self.tour_url), REVIEW_TEXT)
+        self.assertContains(self.client.get(reverse('agencies')), 'TravelFun')
+        self.agency.name = 'TravelJoy'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agency.save()
+        self.assertContains(self.client.get(reverse('agencies')), 'TravelJoy')
+
+    def test_bulk_import(self):
+        """Test tours imported without model signals invalidate tours page."""
+        tours_url = reverse('tours')
+        self.assertNotContains(self.client.get(tours_url), IMPORTED_TOUR)
+        catalog = io.BytesIO('\n'.join(CATALOG_LINES).encode())
+        with self.captureOnCommitCallbacks(execute=True):
+            ToursImporter(self.agency).import_rows(read_rows(catalog, 'csv'))
+        self.assertContains(self.client.get(tours_url), IMPORTED_TOUR)
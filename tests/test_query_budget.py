@@ -0,0 +1,168 @@
+"""Views query budgets tests."""
+
+from functools import partial
+from typing import Any, Callable
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from manager.models import (Account, Address, Agency, City, Country, Review,
+                            Tour)
+from manager.query_budget import QueryBudgetExceeded, assert_query_budget
+
+PRICE = 400
+SMALL_DATA = 1
+LARGE_DATA = 12
+
+
+class QueryBudgetTestCase(TestCase):
+    """Base test case with logged in user and helpers for create data shown by views."""
+
+    def setUp(self):
+        """Set up tests."""
+        self.country = Country.objects.create(name='USA')
+        self.city = City.objects.create(
+            name='New York',
+            country=self.country,
+            point=Point(-74.006, 40.7128),
+        )
+        self.user = User.objects.create_user(username='tester', password='123')
+        self.account = Account.objects.create(account=self.user)
+        self.client.force_login(self.user)
+        self.agencies_count = 0
+        self.reviewers_count = 0
+
+    def add_agency(self, tours_count: int) -> Agency:
+        """Create agency with account, tours and reviews.
+
+        Args:
+            tours_count: int - tours count.
+
+        Returns:
+            Agency: created agency.
+        """
+        self.agencies_count += 1
+        address = Address.objects.create(
+            city=self.city,
+            street='Liberty St',
+            house_number=str(self.agencies_count),
+            point=Point(-74.0061, 40.7129),
+        )
+        agency = Agency.objects.create(
+            name=f'Agency {self.agencies_count}',
+            phone_number='+79999999999',
+            address=address,
+        )
+        agency_user = User.objects.create_user(username=f'agency{self.agencies_count}')
+        Account.objects.create(account=agency_user, agency=agency)
+        for index in range(tours_count):
+            tour = Tour.objects.create(
+                name=f'Tour {self.agencies_count} {index}',
+                description='Description',
+                agency=agency,
+                starting_city=self.city,
+                price=PRICE,
+            )
+            tour.addresses.add(address)
+            Review.objects.create(tour=tour, account=self.account, rating=4, text='Good')
+        return agency
+
+    def add_reviews(self, tour: Tour, reviews_count: int) -> None:
+        """Create reviews of tour by new accounts.
+
+        Args:
+            tour: Tour - reviewed tour.
+            reviews_count: int - reviews count.
+        """
+        for _ in range(reviews_count):
+            self.reviewers_count += 1
+            reviewer = User.objects.create_user(username=f'reviewer{self.reviewers_count}')
+            account = Account.objects.create(account=reviewer)
+            Review.objects.create(tour=tour, account=account, rating=5, text='Great')
+
+    def get_queries_count(self, view_name: str, url: str, **headers: str) -> int:
+        """Get url within view budget.
+
+        Args:
+            view_name: str - url view name.
+            url: str - url for get.
+            headers: str - request headers.
+
+        Returns:
+            int: count of executed queries.
+        """
+        with assert_query_budget(view_name) as counter:
+            response = self.client.get(url, **headers)
+            queries_count = counter.count
+        self.assertEqual(response.status_code, 200)
+        return queries_count
+
+    def assert_constant_queries(
+        self,
+        view_name: str,
+        url: str,
+        add_data: Callable[[int], Any] | None = None,
+        **headers: str,
+    ) -> None:
+        """Check queries count is within budget and does not grow with data.
+
+        Args:
+            view_name: str - url view name.
+            url: str - url for get.
+            add_data: Callable[[int], Any] | None, optional - creates data. Defaults to add_agency.
+            headers: str - request headers.
+        """
+        add_data = add_data or self.add_agency
+        add_data(SMALL_DATA)
+        small_count = self.get_queries_count(view_name, url, **headers)
+        for _ in range(LARGE_DATA):
+            add_data(LARGE_DATA)
+        self.assertEqual(self.get_queries_count(view_name, url, **headers), small_count)
+
+
+class QueryBudgetTest(QueryBudgetTestCase):
+    """Query budgets tests class."""
+
+    def test_pages(self):
+        """Test list pages run fixed number of queries."""
+        for view_name in ('index', 'tours', 'tours_list', 'agencies'):
+            with self.subTest(view_name=view_name):
+                self.assert_constant_queries(view_name, reverse(view_name))
+
+    def test_tour_pages(self):
+        """Test tour page and its reviews run fixed number of queries for user without review."""
+        tour = Tour.objects.create(
+            name='Reviewed tour',
+            description='Description',
+            agency=self.add_agency(0),
+            starting_city=self.city,
+            price=PRICE,
+        )
+        for view_name in ('tour', 'tour_reviews'):
+            with self.subTest(view_name=view_name):
+                url = reverse(view_name, kwargs={'uuid': tour.id})
+                self.assert_constant_queries(view_name, url, partial(self.add_reviews, tour))
+
+    def test_profile_pages(self):
+        """Test profile page and its reviews tab run fixed number of queries."""
+        for view_name in ('profile', 'profile_reviews'):
+            with self.subTest(view_name=view_name):
+                url = reverse(view_name, kwargs={'username': self.user.username})
+                self.assert_constant_queries(view_name, url)
+
+    def test_api_tours(self):
+        """Test API tours list runs fixed number of queries."""
+        token = Token.objects.create(user=self.user)
+        self.assert_constant_queries(
+            'tour-list', reverse('tour-list'), HTTP_AUTHORIZATION=f'Token {token.key}',
+        )
+
+    def test_budget_exceeded(self):
+        """Test exceeded budget raises assertion error."""
+        with self.assertRaises(QueryBudgetExceeded):
+            with assert_query_budget('api-root'):
+                for _ in range(10):
+                    Country.objects.count()
@@ -0,0 +1,103 @@
+"""Reference data loader tests."""
+
+import io
+import tempfile
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from manager.management import reference_parsers
+from manager.management.copy_utils import ChunksFile, iter_csv_chunks
+from manager.models import City, Country
+
+COUNTRIES_CSV = 'Россия,США\n'
+CITIES_CSV = '\n'.join((
+    'name,country,latitude,longitude',
+    'Москва,Россия,55.7558,37.6173',
+    'New York,США,40.7128,-74.006',
+    'Nowhere,Атлантида,0,0',
+))
+RUSSIA = 'Russia'
+COUNTRY_INFO = f'#ISO\tISO3\tISO-Numeric\tfips\tCountry\nRU\tRUS\t643\tRS\t{RUSSIA}\n'
+GEONAMES_CITIES = '524901\tMoscow\tMoscow\t\t55.75222\t37.61556\tP\tPPLC\tRU\n'
+
+
+class CopyUtilsTest(SimpleTestCase):
+    """COPY helpers tests class."""
+
+    def test_chunks_file(self):
+        """Test chunks are read back as one csv text with small reads."""
+        rows = [('a,b', 1, None) for _ in range(5)]
+        chunks_file = ChunksFile(iter_csv_chunks(rows, chunk_rows=2))
+        parts = iter(lambda: chunks_file.read(3), '')
+        self.assertEqual(''.join(parts), '"a,b",1,\n' * 5)
+
+    def test_parsers(self):
+        """Test csv and GeoNames parsers."""
+        countries = reference_parsers.read_countries_csv(io.StringIO(COUNTRIES_CSV))
+        self.assertEqual(list(countries), [('', 'Россия'), ('', 'США')])
+        countries = reference_parsers.read_countries_geonames(io.StringIO(COUNTRY_INFO))
+        self.assertEqual(list(countries), [('RU', RUSSIA)])
+        cities = reference_parsers.read_cities_geonames(
+            io.StringIO(GEONAMES_CITIES), {'RU': RUSSIA},
+        )
+        self.assertEqual(list(cities), [('Moscow', RUSSIA, '37.61556', '55.75222')])
+
+
+class LoadReferenceDataTest(TestCase):
+    """load_reference_data command tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write(self, name: str, text: str) -> str:
+        """Write file into temporary directory.
+
+        Args:
+            name: str - file name.
+            text: str - file text.
+
+        Returns:
+            str: file path.
+        """
+        path = self.directory / name
+        path.write_text(text, encoding='utf-8')
+        return str(path)
+
+    def test_load_csv_twice(self):
+        """Test csv load creates countries and cities and reload changes nothing."""
+        countries = self.write('countries.csv', COUNTRIES_CSV)
+        cities = self.write('cities.csv', CITIES_CSV)
+        for _ in range(2):
+            call_command(
+                'load_reference_data', countries=countries, cities=cities, stdout=io.StringIO(),
+            )
+        self.assertEqual(Country.objects.count(), 2)
+        self.assertEqual(City.objects.count(), 2)
+        moscow = City.objects.get(name='Москва')
+        self.assertEqual(moscow.country.name, 'Россия')
+        self.assertAlmostEqual(moscow.point.x, 37.6173)
+
+    def test_load_geonames(self):
+        """Test GeoNames cities resolved by country codes."""
+        call_command(
+            'load_reference_data',
+            countries=self.write('countryInfo.txt', COUNTRY_INFO),
+            cities=self.write('cities.txt', GEONAMES_CITIES),
+            format='geonames',
+            stdout=io.StringIO(),
+        )
+        self.assertEqual(City.objects.get().country.name, RUSSIA)
+
+    def test_geonames_cities_need_countries(self):
+        """Test GeoNames cities without countries file are rejected."""
+        with self.assertRaises(CommandError):
+            call_command(
+                'load_reference_data',
+                cities=self.write('cities.txt', GEONAMES_CITIES),
+                format='geonames',
+            )
@@ -0,0 +1,138 @@
+"""Images renditions and image jobs tests."""
+
+import io
+from unittest import mock
+
+from django.contrib.gis.geos import Point
+from django.core.files.storage import InMemoryStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from PIL import Image
+
+from manager.models import Address, Agency, City, Country, ImageJob, Tour
+from manager.templatetags.avatar import get_tour_cover, get_tour_cover_srcset
+from manager.views_utils.image_jobs import process_image_jobs
+from manager.views_utils.renditions import get_rendition_name, pick_rendition
+from manager.views_utils.storage_urls import StorageUrlCache
+
+SMALL_RENDITION = 'covers/renditions/a_180.webp'
+LARGE_RENDITION = 'covers/renditions/a_360.webp'
+PRICE = 400
+
+
+class PickRenditionTest(SimpleTestCase):
+    """Renditions helpers tests class."""
+
+    def test_rendition_name(self):
+        """Test rendition stored next to original."""
+        self.assertEqual(get_rendition_name('covers/a.png', 180), SMALL_RENDITION)
+
+    def test_pick_rendition(self):
+        """Test smallest fitting rendition picked, widest one for big sizes."""
+        renditions = {'180': SMALL_RENDITION, '360': LARGE_RENDITION}
+        self.assertEqual(pick_rendition(renditions, 55), SMALL_RENDITION)
+        self.assertEqual(pick_rendition(renditions, 300), LARGE_RENDITION)
+        self.assertEqual(pick_rendition(renditions, 1000), LARGE_RENDITION)
+        self.assertIsNone(pick_rendition({}, 55))
+
+
+class StorageUrlCacheTest(SimpleTestCase):
+    """Storage urls cache tests class."""
+
+    def test_url_cached(self):
+        """Test storage asked once per file and hits and misses counted."""
+        storage = InMemoryStorage(base_url='/cached/')
+        url_cache = StorageUrlCache()
+        with mock.patch.object(storage, 'url', wraps=storage.url) as storage_url:
+            first_url = url_cache.url(storage, SMALL_RENDITION)
+            self.assertEqual(url_cache.url(storage, SMALL_RENDITION), first_url)
+            url_cache.url(storage, LARGE_RENDITION)
+            self.assertEqual(storage_url.call_count, 2)
+        self.assertEqual(url_cache.stats(), (1, 2))
+
+
+class CoverTestCase(TestCase):
+    """Base class for tests with tour cover in memory storage."""
+
+    def setUp(self):
+        """Set up tests."""
+        self.storage = InMemoryStorage()
+        storage_patcher = mock.patch.object(Tour.avatar.field, 'storage', self.storage)
+        storage_patcher.start()
+        self.addCleanup(storage_patcher.stop)
+        country = Country.objects.create(name='USA')
+        city = City.objects.create(
+            name='New York',
+            country=country,
+            point=Point(-74.006, 40.7128),
+        )
+        address = Address.objects.create(
+            city=city,
+            street='Liberty St',
+            house_number='1700',
+            point=Point(-74.0061, 40.7129),
+        )
+        agency = Agency.objects.create(
+            name='TravelFun', phone_number='+79999999999', address=address,
+        )
+        self.tour = Tour.objects.create(
+            name='Exciting NY Tour',
+            description='Discover NY with us!',
+            agency=agency,
+            starting_city=city,
+            price=PRICE,
+        )
+
+    def upload_cover(self, width: int, height: int) -> None:
+        """Upload generated PNG cover.
+
+        Args:
+            width: int - image width.
+            height: int - image height.
+        """
+        image_file = io.BytesIO()
+        Image.new('RGB', (width, height), 'red').save(image_file, 'PNG')
+        self.tour.avatar = SimpleUploadedFile('cover.png', image_file.getvalue())
+        self.tour.save()
+
+
+class TourCoverRenditionsTest(CoverTestCase):
+    """Tour cover renditions tests class."""
+
+    def test_renditions_created(self):
+        """Test original shown until worker makes renditions without upscaling."""
+        self.upload_cover(600, 400)
+        tour = Tour.objects.get(id=self.tour.id)
+        self.assertEqual(get_tour_cover(tour, 300), tour.avatar.url)
+        self.assertEqual(process_image_jobs(workers=1), (1, 0))
+        tour = Tour.objects.get(id=self.tour.id)
+        widths = sorted(tour.avatar_renditions, key=int)
+        self.assertEqual(widths, ['180', '360', '600'])
+        with self.storage.open(tour.avatar_renditions[widths[0]]) as rendition:
+            self.assertEqual(Image.open(rendition).size, (180, 120))
+        self.assertTrue(get_tour_cover(tour, 300).endswith('_360.webp'))
+        self.assertIn('600w', get_tour_cover_srcset(tour))
+
+    def test_files_deleted_with_cover(self):
+        """Test clearing cover forgets renditions at once and worker deletes files."""
+        self.upload_cover(200, 200)
+        process_image_jobs(workers=1)
+        tour = Tour.objects.get(id=self.tour.id)
+        obsolete_files = [tour.avatar.name, *tour.avatar_renditions.values()]
+        tour.avatar = None
+        tour.save()
+        self.assertEqual(Tour.objects.get(id=tour.id).avatar_renditions, {})
+        self.assertEqual(get_tour_cover_srcset(tour), '')
+        self.assertTrue(all(self.storage.exists(name) for name in obsolete_files))
+        self.assertEqual(process_image_jobs(workers=1), (1, 0))
+        self.assertFalse(any(self.storage.exists(name) for name in obsolete_files))
+
+    def test_broken_image_not_retried(self):
+        """Test image which can not be decoded keeps original and is not retried."""
+        self.tour.avatar = SimpleUploadedFile('cover.png', b'not an image')
+        self.tour.save()
+        self.assertEqual(process_image_jobs(workers=1), (0, 1))
+        self.assertEqual(process_image_jobs(workers=1), (0, 0))
+        job = ImageJob.objects.get()
+        self.assertIsNotNone(job.processed)
+        self.assertEqual(Tour.objects.get(id=self.tour.id).avatar_renditions, {})
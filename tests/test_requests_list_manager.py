@@ -2,19 +2,22 @@
 
 from django.contrib.auth.models import User
 from django.contrib.gis.geos import Point
+from django.db import connection
 from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
 from manager.models import (Account, Address, Agency, AgencyRequests, City,
                             Country)
-from manager.views_utils.requests_list_manager import AgencyRequestsListManager
+from manager.views_utils.requests_list_manager import (
+    AgencyRequestsListManager, accept_agency_requests, decline_agency_requests)
 
 POINT = -74.0061, 40.7129
 
 
-class AgencyRequestsListManagerTest(TestCase):
-    """Requests manager tests."""
+class AgencyRequestsTestCase(TestCase):
+    """Requests tests base class with one agency request."""
 
     def setUp(self):
         """Set up tests."""
@@ -33,14 +36,60 @@ class AgencyRequestsListManagerTest(TestCase):
             house_number='1700',
             point=Point(*POINT),
         )
-        agency = Agency.objects.create(
-            name='TravelFun',
-            phone_number='+79999999999',
-            address=agency_address,
-        )
+        self.agency_address = agency_address
+        agency = self.create_agency('TravelFun')
         self.agency_request = AgencyRequests.objects.create(account=self.account, agency=agency)
         self.agency_requests = [self.agency_request]
         self.request = self.factory.get('/fake-url')
+        self.staff_user = User.objects.create_user(username='moderator', is_staff=True)
+
+    def create_agency(self, name: str) -> Agency:
+        """Create agency.
+
+        Args:
+            name: str - agency name.
+
+        Returns:
+            Agency: created agency.
+        """
+        return Agency.objects.create(
+            name=name,
+            phone_number='+79999999999',
+            address=self.agency_address,
+        )
+
+    def get_action_data(self, action: str) -> dict:
+        """Get posted data of moderation action with request of test account.
+
+        Args:
+            action: str - accept or decline.
+
+        Returns:
+            dict: posted data.
+        """
+        return {action: 'true', 'id': str(self.account.id)}
+
+    def create_requests(self, count: int) -> list[Account]:
+        """Create accounts with agency requests.
+
+        Args:
+            count: int - count of requests.
+
+        Returns:
+            list[Account]: accounts of requests.
+        """
+        accounts = []
+        for number in range(count):
+            user = User.objects.create_user(username=f'requester{number}')
+            account = Account.objects.create(account=user)
+            agency = self.create_agency(f'Agency {number}')
+            AgencyRequests.objects.create(account=account, agency=agency)
+            accounts.append(account)
+        return accounts
+
+
+class AgencyRequestsListManagerTest(AgencyRequestsTestCase):
+    """Requests manager tests."""
 
     def test_initialization(self):
         """Test that the manager initializes correctly."""
@@ -62,8 +111,9 @@ class AgencyRequestsListManagerTest(TestCase):
     def test_post_accept_agency_request(self):
         """Test handling of accepting an agency request via POST."""
         request = self.factory.post(
-            reverse('my_profile'), {'accept': 'true', 'id': str(self.account.id)},
+            reverse('my_profile'), self.get_action_data('accept'),
         )
+        request.user = self.staff_user
         manager = AgencyRequestsListManager(request, self.agency_requests)
         response = manager.render_agency_requests_block()
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
@@ -72,9 +122,57 @@ class AgencyRequestsListManagerTest(TestCase):
     def test_post_decline_agency_request(self):
         """Test handling of declining an agency request via POST."""
         request = self.factory.post(
-            reverse('my_profile'), {'decline': 'true', 'id': str(self.account.id)},
+            reverse('my_profile'), self.get_action_data('decline'),
         )
+        request.user = self.staff_user
         manager = AgencyRequestsListManager(request, self.agency_requests)
         response = manager.render_agency_requests_block()
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
         self.assertFalse(AgencyRequests.objects.filter(id=self.agency_request.id).exists())
+
+
+class AgencyRequestsModerationTest(AgencyRequestsTestCase):
+    """Bulk requests moderation tests."""
+
+    def test_bulk_accept(self):
+        """Test selected requests are accepted in queries count independent of selection."""
+        accounts = self.create_requests(3)
+        single_queries = CaptureQueriesContext(connection)
+        with single_queries:
+            accept_agency_requests([accounts[2].id])
+        bulk_queries = CaptureQueriesContext(connection)
+        with bulk_queries:
+            accepted = accept_agency_requests([account.id for account in accounts])
+        self.assertEqual(accepted, 2)
+        self.assertEqual(len(bulk_queries), len(single_queries))
+        accepted_agencies = Account.objects.filter(agency__isnull=False).values_list(
+            'agency__name', flat=True,
+        )
+        self.assertEqual(set(accepted_agencies), {'Agency 0', 'Agency 1', 'Agency 2'})
+        self.assertEqual(list(AgencyRequests.objects.all()), [self.agency_request])
+
+    def test_bulk_decline(self):
+        """Test declined requests are deleted with their agencies."""
+        accounts = self.create_requests(2)
+        request = self.factory.post(
+            reverse('my_profile'),
+            {'decline': 'true', 'id': [str(account.id) for account in accounts] + ['bad']},
+        )
+        request.user = self.staff_user
+        manager = AgencyRequestsListManager(request, self.agency_requests)
+        response = manager.render_agency_requests_block()
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(list(AgencyRequests.objects.all()), [self.agency_request])
+        self.assertFalse(Agency.objects.filter(name__startswith='Agency').exists())
+        self.assertEqual(decline_agency_requests([]), 0)
+
+    def test_moderation_needs_staff(self):
+        """Test user who is not staff can not moderate requests from staff profile."""
+        Account.objects.create(account=self.staff_user)
+        self.client.force_login(self.account.account)
+        response = self.client.post(
+            reverse('profile', kwargs={'username': self.staff_user.username}),
+            self.get_action_data('accept'),
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(AgencyRequests.objects.filter(id=self.agency_request.id).exists())
@@ -0,0 +1,45 @@
+"""Bulk renditions command tests."""
+
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.management import call_command
+
+from manager.models import ImageJob, Tour
+from tests.test_renditions import CoverTestCase
+
+
+class RerenderImagesTest(CoverTestCase):
+    """rerender_images command tests class."""
+
+    def rerender(self, checkpoint: Path) -> None:
+        """Run command in this process.
+
+        Args:
+            checkpoint: Path - checkpoint file path.
+        """
+        call_command(
+            'rerender_images',
+            workers=1,
+            models=['tour'],
+            checkpoint=str(checkpoint),
+            stdout=io.StringIO(),
+        )
+
+    def test_rerender_and_resume(self):
+        """Test images without renditions rendered and finished ids skipped on resume."""
+        self.upload_cover(300, 300)
+        ImageJob.objects.all().delete()
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Path(directory) / 'checkpoint.json'
+            self.rerender(checkpoint)
+            tour = Tour.objects.get(id=self.tour.id)
+            rendered_widths = sorted(tour.avatar_renditions, key=int)
+            saved_ids = json.loads(checkpoint.read_text())
+            Tour.objects.filter(id=self.tour.id).update(avatar_renditions={})
+            self.rerender(checkpoint)
+        self.assertEqual(rendered_widths, ['180', '300'])
+        self.assertEqual(saved_ids, {'tour': str(self.tour.id)})
+        self.assertEqual(Tour.objects.get(id=self.tour.id).avatar_renditions, {})
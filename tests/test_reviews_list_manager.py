@@ -6,19 +6,21 @@ from django.test import RequestFactory, TestCase
 
 from manager.models import (Account, Address, Agency, City, Country, Review,
                             Tour)
-from manager.views_utils.reviews_list_manager import ReviewsListManager
+from manager.views_utils.reviews_list_manager import (DEFAULT_REVIEWS_PER_PAGE,
+                                                      ReviewsListManager)
 
 PRICE = 400
 POINT = -74.0061, 40.7129
+PASSWORD = '123'  # noqa: S105
 
 
-class ReviewsListManagerTest(TestCase):
-    """Reviews manager test class."""
+class ReviewsTestCase(TestCase):
+    """Base test case with tour and review."""
 
     def setUp(self):
         """Set up tests."""
         self.factory = RequestFactory()
-        self.user = User.objects.create_user(username='tester', password='123')
+        self.user = User.objects.create_user(username='tester', password=PASSWORD)
         account = Account.objects.create(account=self.user)
         country = Country.objects.create(name='USA')
         city = City.objects.create(
@@ -39,15 +41,31 @@ class ReviewsListManagerTest(TestCase):
             name='Tour 1', description='Sample', agency=agency, price=PRICE, starting_city=city,
         )
         self.review = Review.objects.create(tour=self.tour, rating=5, account=account)
-        self.reviews = {self.tour: [self.review]}
+        self.reviews = Review.objects.filter(tour=self.tour)
         self.request = self.factory.get('/tour/{id}/#reviews'.format(id=self.tour.id))
         self.redirect_url = '/redirect/'
 
-    def test_get_tour(self):
-        """Test get tour."""
-        manager = ReviewsListManager(self.request, self.reviews, self.redirect_url)
-        tour = manager.get_tour()
-        self.assertEqual(tour, self.tour)
+
+class ReviewsListManagerTest(ReviewsTestCase):
+    """Reviews manager test class."""
+
+    def test_user_review_scoped_to_tour(self):
+        """Test user review of another tour is not pinned."""
+        other_tour = Tour.objects.create(
+            name='Tour 2',
+            description='Sample',
+            agency=self.tour.agency,
+            price=PRICE,
+            starting_city=self.tour.starting_city,
+        )
+        request = self.factory.get('/tour/{id}/'.format(id=other_tour.id))
+        request.user = self.user
+        other_reviews = Review.objects.filter(tour=other_tour)
+        manager = ReviewsListManager(request, other_reviews, self.redirect_url, tour=other_tour)
+        manager.pin_request_user_review()
+        self.assertIsNone(manager.user_review)
+        self.assertEqual(manager.reviews_count, 0)
+        self.assertNotIn(str(self.review.id), manager.render_reviews_list(1))
 
     def test_render_review(self):
         """Test render review."""
@@ -75,3 +93,65 @@ class ReviewsListManagerTest(TestCase):
         manager = ReviewsListManager(request, self.reviews, self.redirect_url)
         manager.render_review(self.review, render_form=True)
         self.assertFalse(Review.objects.filter(id=self.review.id).exists())
+
+
+class ReviewsPagingTest(ReviewsTestCase):
+    """Reviews paging and batched rendering tests."""
+
+    def test_reviews_page_is_limited(self):
+        """Test only requested page of reviews rendered."""
+        for number in range(DEFAULT_REVIEWS_PER_PAGE + 2):
+            user = User.objects.create_user(username=f'reviewer{number}', password=PASSWORD)
+            account = Account.objects.create(account=user)
+            Review.objects.create(tour=self.tour, rating=4, account=account)
+        request = self.factory.get('/tour/{id}/?page=2'.format(id=self.tour.id))
+        request.user = self.user
+        manager = ReviewsListManager(request, self.reviews, self.redirect_url, tour=self.tour)
+        manager.pin_request_user_review()
+        rendered_list = manager.render_reviews_list(2)
+        self.assertEqual(manager.reviews_count, DEFAULT_REVIEWS_PER_PAGE + 3)
+        self.assertEqual(manager.paginator.count, DEFAULT_REVIEWS_PER_PAGE + 2)
+        self.assertEqual(rendered_list.count('<div class="review">'), 3)
+
+    def test_user_review_pinned(self):
+        """Test request user review pinned and excluded from pages."""
+        request = self.factory.get('/tour/{id}/'.format(id=self.tour.id))
+        request.user = self.user
+        manager = ReviewsListManager(request, self.reviews, self.redirect_url, tour=self.tour)
+        manager.pin_request_user_review()
+        self.assertEqual(manager.user_review, self.review)
+        self.assertEqual(manager.paginator.count, 0)
+        self.assertIn('edit_form', manager.render_reviews_list(1))
+
+    def test_edit_form_only_for_owner(self):
+        """Test edit form rendered only for request user review."""
+        other_user = User.objects.create_user(username='other', password=PASSWORD)
+        other_account = Account.objects.create(account=other_user)
+        Review.objects.create(tour=self.tour, rating=3, account=other_account)
+        request = self.factory.get('/profile/')
+        request.user = self.user
+        manager = ReviewsListManager(request, self.reviews, self.redirect_url)
+        rendered_list = manager.render_reviews_list(1)
+        self.assertEqual(rendered_list.count('<div class="review">'), 2)
+        self.assertEqual(rendered_list.count('edit_form'), 1)
+
+    def test_invalid_edit_errors_rendered(self):
+        """Test errors of invalid edit shown in form of not pinned review."""
+        request = self.factory.post('/profile/', {'rating': 9, 'text': 'Updated'})
+        request.user = self.user
+        manager = ReviewsListManager(request, self.reviews, self.redirect_url)
+        rendered_list = manager.render_reviews_list(1)
+        self.assertEqual(Review.objects.get(id=self.review.id).rating, 5)
+        self.assertIn('fa-triangle-exclamation', rendered_list)
+
+    def test_reviews_page_queries_are_flat(self):
+        """Test rendering page of reviews does not query per review."""
+        for number in range(DEFAULT_REVIEWS_PER_PAGE):
+            user = User.objects.create_user(username=f'reviewer{number}', password=PASSWORD)
+            account = Account.objects.create(account=user)
+            Review.objects.create(tour=self.tour, rating=4, account=account)
+        request = self.factory.get('/tour/{id}/'.format(id=self.tour.id))
+        request.user = User.objects.create_user(username='viewer', password=PASSWORD)
+        manager = ReviewsListManager(request, self.reviews, self.redirect_url)
+        with self.assertNumQueries(2):
+            manager.render_reviews_list(1)
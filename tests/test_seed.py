@@ -0,0 +1,55 @@
+"""Synthetic data seed tests."""
+
+import io
+
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models import Count
+from django.test import TestCase
+
+from manager.management.seed_data import SyntheticData
+from manager.models import RATING_COUNT_FIELDS, Review, Tour
+
+TOURS_COUNT = 60
+SEED = 7
+
+
+class SeedTest(TestCase):
+    """Seed command and synthetic data tests class."""
+
+    def test_ratings_counters_match_reviews(self):
+        """Test tours ratings counters are the counts of copied reviews."""
+        call_command('seed', tours=TOURS_COUNT, seed=SEED, stdout=io.StringIO())
+        self.assertEqual(Tour.objects.count(), TOURS_COUNT)
+        grouped_reviews = Review.objects.values('tour_id', 'rating').annotate(count=Count('id'))
+        reviews_counts = {
+            (group['tour_id'], group['rating']): group['count'] for group in grouped_reviews
+        }
+        for tour in Tour.objects.all():
+            for rating, field_name in RATING_COUNT_FIELDS.items():
+                expected_count = reviews_counts.get((tour.id, rating), 0)
+                self.assertEqual(getattr(tour, field_name), expected_count)
+
+    def test_same_seed_same_rows(self):
+        """Test the same seed gives the same ids and rows counts."""
+        first_counts, first_ids = self.create_rolled_back(SEED)
+        second_counts, second_ids = self.create_rolled_back(SEED)
+        self.assertEqual(first_counts, second_counts)
+        self.assertEqual(first_ids, second_ids)
+        self.assertEqual(first_counts['tour'], TOURS_COUNT)
+        self.assertNotEqual(self.create_rolled_back(SEED + 1)[1], first_ids)
+
+    def create_rolled_back(self, seed: int) -> tuple[dict, set]:
+        """Create synthetic data and roll it back.
+
+        Args:
+            seed: int - random seed.
+
+        Returns:
+            tuple[dict, set]: rows counts and tours ids.
+        """
+        with transaction.atomic():
+            counts = SyntheticData(seed).create(TOURS_COUNT)
+            tours_ids = set(Tour.objects.values_list('id', flat=True))
+            transaction.set_rollback(True)
+        return counts, tours_ids
@@ -0,0 +1,147 @@
+"""Signals tests."""
+
+from types import MappingProxyType
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.test import TestCase, override_settings
+
+from manager.models import (Account, Address, Agency, City, Country, Review,
+                            Tour)
+from manager.templatetags.avatar import get_avatar, gravatar_url
+from manager.views_utils.avatar_utils import (DEFAULT_LOCAL_CACHE_SECONDS,
+                                              get_timeout)
+
+PRICE = 400
+RENDITIONS = MappingProxyType({'180': 'cover.webp'})
+
+
+class TourRatingsCountsTest(TestCase):
+    """Tour ratings counters tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        country = Country.objects.create(name='USA')
+        city = City.objects.create(
+            name='New York',
+            country=country,
+            point=Point(-74.006, 40.7128),
+        )
+        agency_address = Address.objects.create(
+            city=city,
+            street='Liberty St',
+            house_number='1700',
+            point=Point(-74.0061, 40.7129),
+        )
+        agency = Agency.objects.create(
+            name='TravelFun', phone_number='+79999999999', address=agency_address,
+        )
+        self.tour = Tour.objects.create(
+            name='Exciting NY Tour',
+            description='Discover NY with us!',
+            agency=agency,
+            starting_city=city,
+            price=PRICE,
+        )
+        self.other_agency = Agency.objects.create(
+            name='TravelJoy',
+            phone_number='+79999999998',
+            address=Address.objects.create(
+                city=city,
+                street='Wall St',
+                house_number='11',
+                point=Point(-74.0089, 40.7069),
+            ),
+        )
+        user = User.objects.create_user(username='tester', password='123')
+        self.account = Account.objects.create(account=user)
+
+    def test_counters_follow_reviews(self):
+        """Test counters changed on review create, edit and delete."""
+        review = Review.objects.create(tour=self.tour, account=self.account, rating='5')
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.ratings_distribution[5], 1)
+        review = Review.objects.get(id=review.id)
+        review.rating = 3
+        review.save()
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.ratings_distribution[5], 0)
+        self.assertEqual(self.tour.ratings_distribution[3], 1)
+        self.assertEqual(self.tour.rating, 3)
+        review.delete()
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.ratings_count, 0)
+        self.assertEqual(self.tour.rating, 0)
+
+    def test_agency_reviews_not_counted(self):
+        """Test reviews are uncounted while their account is linked with agency."""
+        Review.objects.create(tour=self.tour, account=self.account, rating=5)
+        self.account.agency = self.other_agency
+        with self.captureOnCommitCallbacks(execute=True):
+            self.account.save()
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.ratings_count, 0)
+        review = Review.objects.get(account=self.account)
+        review.rating = 3
+        review.save()
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.ratings_count, 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_agency.delete()
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.ratings_distribution[3], 1)
+        self.assertEqual(self.tour.ratings_count, 1)
+
+    def test_refresh_ratings_counts(self):
+        """Test counters recounted from reviews."""
+        Review.objects.create(tour=self.tour, account=self.account, rating=4)
+        Tour.objects.filter(id=self.tour.id).update(four_stars_count=0)
+        self.tour.refresh_ratings_counts()
+        self.assertEqual(self.tour.ratings_distribution[4], 1)
+        self.assertEqual(self.tour.ratings_count, 1)
+
+    def test_tour_save_keeps_counters(self):
+        """Test save of loaded tour does not overwrite counters and renditions."""
+        stale_tour = Tour.objects.get(id=self.tour.id)
+        Review.objects.create(tour=self.tour, account=self.account, rating=4)
+        tours = Tour.objects.filter(id=self.tour.id)
+        tours.update(avatar_renditions=dict(RENDITIONS))
+        stale_tour.price = PRICE * 2
+        stale_tour.save()
+        self.tour.refresh_from_db()
+        self.assertEqual(self.tour.price, PRICE * 2)
+        self.assertEqual(self.tour.ratings_distribution[4], 1)
+        self.assertEqual(self.tour.avatar_renditions, RENDITIONS)
+
+
+@override_settings(SHARED_CACHE=True)
+class AvatarUrlsCacheTest(TestCase):
+    """Cached avatar urls invalidation tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        self.user = User.objects.create_user(
+            username='tester', password='123', email='old@example.com',
+        )
+        self.account = Account.objects.create(account=self.user)
+
+    def test_login_keeps_cache(self):
+        """Test saving other user fields keeps cached url."""
+        cached_url = get_avatar(self.account)
+        self.user.email = 'new@example.com'
+        self.user.save(update_fields=['last_login'])
+        account = Account.objects.get(id=self.account.id)
+        self.assertEqual(get_avatar(account), cached_url)
+
+    def test_email_change_invalidates_cache(self):
+        """Test changed email gives new gravatar url."""
+        get_avatar(self.account)
+        self.user.email = 'new@example.com'
+        self.user.save()
+        account = Account.objects.get(id=self.account.id)
+        self.assertEqual(get_avatar(account), gravatar_url('new@example.com'))
+
+    @override_settings(SHARED_CACHE=False)
+    def test_local_cache_timeout(self):
+        """Test avatar urls are cached shortly in per process cache."""
+        self.assertEqual(get_timeout(), DEFAULT_LOCAL_CACHE_SECONDS)
@@ -0,0 +1,35 @@
+"""Server-Timing middleware tests."""
+
+import json
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from manager.timings import CACHE_PHASE, RequestTimings
+
+
+class RequestTimingsTest(SimpleTestCase):
+    """Request phases timings tests class."""
+
+    def test_header(self):
+        """Test phases durations and counts in header."""
+        timings = RequestTimings()
+        timings.add(CACHE_PHASE, 0.002)
+        timings.add(CACHE_PHASE, 0.001)
+        header = timings.header()
+        self.assertTrue(header.startswith('total;dur='))
+        self.assertIn('cache;dur=3.0;desc="2"', header)
+
+
+class ServerTimingMiddlewareTest(TestCase):
+    """Server-Timing middleware tests class."""
+
+    def test_page_timings(self):
+        """Test page response has header and log line with db and template phases."""
+        with self.assertLogs('manager.timings', 'INFO') as logs:
+            response = self.client.get(reverse('tours'))
+            log_line = json.loads(logs.records[-1].getMessage())
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertIn('tpl;dur=', response['Server-Timing'])
+        self.assertEqual(log_line['view'], 'tours')
+        self.assertGreater(log_line['db_count'], 0)
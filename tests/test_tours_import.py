@@ -0,0 +1,119 @@
+"""Tours catalog import tests."""
+
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from manager.models import (Account, Address, Agency, City, Country, Tour,
+                            TourAddress)
+from manager.views_utils.tours_import import ToursImporter, read_rows
+
+COUNTRY = 'USA'
+CITY = 'New York'
+HEADER = 'name,description,price,country,starting_city,addresses'
+ADDRESSES = 'New York, Liberty St, 1700'
+
+
+class ToursImportTest(TestCase):
+    """Tours import tests class."""
+
+    def setUp(self):
+        """Set up tests."""
+        country = Country.objects.create(name=COUNTRY)
+        city = City.objects.create(
+            name=CITY,
+            country=country,
+            point=Point(-74.006, 40.7128),
+        )
+        address = Address.objects.create(
+            city=city,
+            street='Liberty St',
+            house_number='1700',
+            point=Point(-74.0061, 40.7129),
+        )
+        self.agency = Agency.objects.create(
+            name='TravelFun', phone_number='+79999999999', address=address,
+        )
+
+    def import_csv(self, *lines: str):
+        """Import csv lines with header.
+
+        Returns:
+            ImportSummary: import summary.
+        """
+        catalog = io.BytesIO('\n'.join((HEADER, *lines)).encode())
+        importer = ToursImporter(self.agency, chunk_size=2)
+        return importer.import_rows(read_rows(catalog, 'csv'))
+
+    def test_import_csv(self):
+        """Test valid rows created in chunks and invalid rows reported."""
+        summary = self.import_csv(
+            f'Tour 1,Description,100,{COUNTRY},{CITY},"{ADDRESSES}"',
+            f'Tour 2,Description,-1,{COUNTRY},{CITY},"{ADDRESSES}"',
+            f'Tour 3,Description,100,{COUNTRY},Boston,"{ADDRESSES}"',
+            f'Tour 4,Description,100,{COUNTRY},{CITY},"New York, Broadway, 1"',
+            f'Tour 1,Description,100,{COUNTRY},{CITY},"{ADDRESSES}"',
+        )
+        self.assertEqual(summary.created, 1)
+        failed_rows = [row_number for row_number, _ in summary.errors]
+        self.assertEqual(failed_rows, [2, 3, 4, 5])
+        self.assertIn('price', summary.errors[0][1])
+        self.assertIn('starting_city', summary.errors[1][1])
+        self.assertIn('addresses', summary.errors[2][1])
+        tour = Tour.objects.get(name='Tour 1')
+        self.assertEqual(TourAddress.objects.filter(tour=tour).count(), 1)
+
+    def import_json(self, rows_count: int) -> int:
+        """Import JSON catalog in one chunk.
+
+        Returns:
+            int: count of executed queries.
+        """
+        rows = [
+            {
+                'name': f'Tour {rows_count} {index}',
+                'description': 'Description',
+                'price': '100',
+                'country': COUNTRY,
+                'starting_city': CITY,
+                'addresses': [{'city': CITY, 'street': 'Liberty St', 'house_number': '1700'}],
+            }
+            for index in range(rows_count)
+        ]
+        catalog = io.BytesIO(json.dumps(rows).encode())
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            summary = ToursImporter(self.agency).import_rows(read_rows(catalog, 'json'))
+        self.assertEqual(summary.created, rows_count)
+        return len(queries)
+
+    def test_import_json_queries(self):
+        """Test chunk resolved with constant number of queries."""
+        self.assertEqual(self.import_json(2), self.import_json(20))
+
+    def test_import_view(self):
+        """Test agency imports catalog from profile page."""
+        user = User.objects.create_user(username='agency', password='123')
+        Account.objects.create(account=user, agency=self.agency)
+        self.client.force_login(user)
+        catalog = SimpleUploadedFile(
+            'tours.jsonl',
+            json.dumps({
+                'name': 'Tour',
+                'description': 'Description',
+                'price': 100,
+                'country': COUNTRY,
+                'starting_city': CITY,
+                'addresses': ADDRESSES,
+            }).encode(),
+        )
+        response = self.client.post(reverse('import_tours'), {'catalog': catalog})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.agency.tour_set.get().name, 'Tour')
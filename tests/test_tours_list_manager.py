@@ -48,11 +48,10 @@ class ToursListManagerTest(TestCase):
             )
             for number in range(5)
         ]
-        self.reviews = {
-            tour: [Review.objects.create(tour=tour, rating=5, account=account)]
-            for tour in self.tours
-        }
-        self.manager = ToursListManager(self.request, self.tours, self.reviews)
+        for tour in self.tours:
+            Review.objects.create(tour=tour, rating=5, account=account)
+            tour.refresh_from_db()
+        self.manager = ToursListManager(self.request, self.tours)
 
     def test_initialization(self):
         """Test init manager."""
@@ -79,3 +78,11 @@ class ToursListManagerTest(TestCase):
         self.assertIn('css/tours.css', render_result)
         self.assertIn('css/pages.css', render_result)
         self.assertIn('<div class="tours">', render_result)
+
+    def test_tour_rating_from_counters(self):
+        """Test tour rating and distribution taken from counters."""
+        tour = self.tours[0]
+        self.assertEqual(tour.rating, 5)
+        self.assertEqual(tour.ratings_count, 1)
+        render_result = self.manager.render_tour_card(tour, tour.rating)
+        self.assertIn('rating_distribution', render_result)
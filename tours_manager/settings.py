@@ -86,6 +86,9 @@ REST_FRAMEWORK = {
 }
 
 MIDDLEWARE = [
+    'manager.middleware.ServerTimingMiddleware',
+    'manager.middleware.ReplicaRoutingMiddleware',
+    'manager.middleware.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -97,9 +100,31 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'tours_manager.urls'
 
+# Cache shared by web workers, images worker and commands, e.g. Redis with
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache and
+# CACHE_LOCATION=redis://localhost:6379/0. Caches invalidated from other processes
+# are limited with per process LocMem cache: anonymous pages are off and avatars
+# urls live AVATAR_URLS_CACHE_SECONDS, 30 by default.
+LOCMEM_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+CACHES = {
+    'default': {
+        'BACKEND': getenv('CACHE_BACKEND', LOCMEM_CACHE),
+        'LOCATION': getenv('CACHE_LOCATION', ''),
+    },
+}
+SHARED_CACHE = CACHES['default']['BACKEND'] != LOCMEM_CACHE
+
+# Read pages and API lists are served by async views, asgi.py turns it on.
+ASYNC_VIEWS = getenv('ASYNC_VIEWS') == 'True'
+
+# Anonymous pages are cached until their data changes, timeout only keeps signed
+# storage urls valid, 0 turns cache off. Data changed by other processes invalidates
+# pages only in shared cache, so cache is off by default with LocMem.
+PAGE_CACHE_SECONDS = int(getenv('PAGE_CACHE_SECONDS', '3600' if SHARED_CACHE else '0'))
+
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'manager.template_backends.TimedDjangoTemplates',
         'DIRS': [path.join(BASE_DIR, 'templates')],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -121,21 +146,45 @@ WSGI_APPLICATION = 'tours_manager.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# Connections are kept open between requests of worker thread for PG_CONN_MAX_AGE seconds,
+# 0 closes them after every request. Kept connection is checked before first use in request.
 DATABASES = {
     'default': {
-        'ENGINE': 'django.contrib.gis.db.backends.postgis',
+        'ENGINE': 'manager.db_backend',
         'NAME': getenv('PG_DBNAME'),
         'USER': getenv('PG_USER'),
         'PASSWORD': getenv('PG_PASSWORD'),
         'HOST': getenv('PG_HOST'),
         'PORT': getenv('PG_PORT'),
-        'OPTIONS': {'options': '-c search_path=public,tours_data'},
+        'CONN_MAX_AGE': int(getenv('PG_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': getenv('PG_CONN_HEALTH_CHECKS', 'True') == 'True',
+        'OPTIONS': {
+            'options': '-c search_path=public,tours_data',
+            'connect_timeout': int(getenv('PG_CONNECT_TIMEOUT', '5')),
+        },
         'TEST': {
             'NAME': 'test_db',
         },
     },
 }
 
+# Reads of safe requests go to replica when PG_REPLICA_HOST is set, e.g. to second local
+# server streaming from default one. In tests replica alias mirrors default test database.
+if getenv('PG_REPLICA_HOST'):
+    DATABASES[getenv('DB_REPLICA_ALIAS', 'replica')] = {
+        **DATABASES['default'],
+        'NAME': getenv('PG_REPLICA_DBNAME', getenv('PG_DBNAME')),
+        'USER': getenv('PG_REPLICA_USER', getenv('PG_USER')),
+        'PASSWORD': getenv('PG_REPLICA_PASSWORD', getenv('PG_PASSWORD')),
+        'HOST': getenv('PG_REPLICA_HOST'),
+        'PORT': getenv('PG_REPLICA_PORT', getenv('PG_PORT')),
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    }
+
+DATABASE_ROUTERS = ['manager.db_router.ReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators